@@ -0,0 +1,181 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the shared asset registry for the super break-out game. Every image, font,
+and sound is loaded once per process and the same object is handed out to every sprite that asks for it. Assets
+come from the asset bundle when it is built and up to date, and from the loose files otherwise.
+"""
+
+# Import and Initalize dependencies.
+import collections
+import os
+import pygame
+import bundle
+pygame.init()
+
+
+class AssetRegistry():
+    """This class defines a process-wide cache of decoded images, fonts, and sounds."""
+
+    # Initalizes the path of the game font as a constant class variable.
+    FONT_PATH = "fonts/press_start_2.ttf"
+
+    # Initalizes the most rendered text surfaces kept at once as a constant class variable.
+    TEXT_CACHE_SIZE = 256
+
+    # Initalizes the path of the asset bundle as a constant class variable.
+    BUNDLE_PATH = bundle.PATH
+
+    def __init__(self):
+        """Initalizes the empty caches. Takes no parameters and returns nothing."""
+
+        self.__images = {}
+        self.__converted = set()
+        self.__fonts = {}
+        self.__sounds = {}
+        self.__texts = collections.OrderedDict()
+        self.__bundle = None
+        self.__bundle_opened = False
+        self.__music_file = None
+        self.__bundled = 0
+        self.__loads = 0
+        self.__hits = 0
+        self.__text_hits = 0
+        self.__text_misses = 0
+
+    def get_image(self, path, size=None, colorkey=None):
+        """This method gets a decoded image, loading it on first use. The image is converted to the display
+        format once a display exists. Takes the image path as a string, an optional size to scale to as a
+        tuple ordered pair, and an optional color to make transparent as a tuple with rgb values. Returns the
+        shared surface, which must not be drawn on or changed."""
+
+        key = (path, size, colorkey)
+
+        # Decodes and scales the image the first time it is asked for.
+        if key not in self.__images:
+            image = self.__open_bundle_asset("get_image", path) or pygame.image.load(path)
+            if size is not None:
+                image = pygame.transform.scale(image, size)
+            image.set_colorkey(colorkey)
+            self.__images[key] = image
+            self.__loads += 1
+        else:
+            self.__hits += 1
+
+        # Converts the image to the display format as soon as there is a display.
+        if key not in self.__converted and pygame.display.get_surface() is not None:
+            image = self.__images[key]
+            if image.get_flags() & pygame.SRCALPHA:
+                image = image.convert_alpha()
+            else:
+                image = image.convert()
+            image.set_colorkey(colorkey)
+            self.__images[key] = image
+            self.__converted.add(key)
+
+        return self.__images[key]
+
+    def get_font(self, size):
+        """This method gets the game font at a size, loading it on first use. Takes the font size as an
+        integer parameter. Returns the shared font object."""
+
+        if size not in self.__fonts:
+            font_file = self.__open_bundle_asset("get_file", AssetRegistry.FONT_PATH)
+            self.__fonts[size] = pygame.font.Font(font_file or AssetRegistry.FONT_PATH, size)
+            self.__loads += 1
+        else:
+            self.__hits += 1
+
+        return self.__fonts[size]
+
+    def get_sound(self, path):
+        """This method gets a decoded sound effect, loading it on first use. Takes the sound path as a string.
+        Returns the shared Sound."""
+
+        if path not in self.__sounds:
+            self.__sounds[path] = self.__open_bundle_asset("get_sound", path) or pygame.mixer.Sound(path)
+            self.__loads += 1
+        else:
+            self.__hits += 1
+
+        return self.__sounds[path]
+
+    def load_music(self, path):
+        """This method loads a music file into the music player, streaming it from the asset bundle when it is
+        packed there. Takes the music path as a string and returns nothing."""
+
+        # Keeps the packed file object alive for as long as the music player streams from it.
+        music_file = self.__open_bundle_asset("get_file", path)
+        if music_file:
+            pygame.mixer.music.load(music_file, os.path.splitext(path)[1][1:])
+        else:
+            pygame.mixer.music.load(path)
+        self.__music_file = music_file
+
+    def get_bundle(self):
+        """This method gets the asset bundle, opening it on first use. Takes no parameters. Returns the
+        AssetBundle, or None if it is missing or unreadable."""
+
+        if not self.__bundle_opened:
+            self.__bundle_opened = True
+            try:
+                self.__bundle = bundle.AssetBundle(AssetRegistry.BUNDLE_PATH)
+            except (OSError, ValueError):
+                self.__bundle = None
+
+        return self.__bundle
+
+    def __open_bundle_asset(self, getter, path):
+        """This helper method gets an asset from the asset bundle. Takes the name of the bundle method to get
+        it with and the asset path as strings. Returns the asset, or None if it must come from its loose file."""
+
+        asset_bundle = self.get_bundle()
+        if asset_bundle is None:
+            return None
+
+        asset = getattr(asset_bundle, getter)(path)
+        if asset is not None:
+            self.__bundled += 1
+
+        return asset
+
+    def render_text(self, text, size, color):
+        """This method gets the game font rendering of a text, rendering it only if it is not in the least
+        recently used text cache. Takes the text as a string, font size as an integer, and color as a tuple
+        with rgb values. Returns the shared surface, which must not be drawn on."""
+
+        key = (text, size, color)
+
+        # Moves a cached surface to the most recently used end.
+        if key in self.__texts:
+            self.__texts.move_to_end(key)
+            self.__text_hits += 1
+            return self.__texts[key]
+
+        # Renders the text and drops the least recently used surface if the cache is full.
+        self.__text_misses += 1
+        surface = self.get_font(size).render(text, True, color)
+        self.__texts[key] = surface
+        if len(self.__texts) > AssetRegistry.TEXT_CACHE_SIZE:
+            self.__texts.popitem(last=False)
+
+        return surface
+
+    def get_text_stats(self):
+        """This method gets the text cache counters. Takes no parameters and returns a dictionary with the hits,
+        misses, hit rate, and number of cached surfaces."""
+
+        total = self.__text_hits + self.__text_misses
+        return {"hits": self.__text_hits, "misses": self.__text_misses,
+                "hit_rate": self.__text_hits / total if total else 0.0, "size": len(self.__texts)}
+
+    def get_stats(self):
+        """This method gets how many assets were loaded and how many requests were served from the cache.
+        Takes no parameters and returns a dictionary."""
+
+        return {"images": len(self.__images), "fonts": len(self.__fonts), "sounds": len(self.__sounds),
+                "loads": self.__loads, "bundled": self.__bundled, "hits": self.__hits}
+
+
+# Initalizes the registry shared by the whole process.
+registry = AssetRegistry()
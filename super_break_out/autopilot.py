@@ -0,0 +1,158 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the autopilot for the platforms of the super break-out game. It works out where
+the ball will land by unfolding its straight path through the reflections off the screen edges and the bottom of
+the wall, then lines the platform up so the bounce sends the ball towards the column with the most bricks. It
+plays a platform through the same left and right inputs as the keyboard and mouse, so it can play soak games and
+the attract demo.
+"""
+
+# Import and Initalize dependencies.
+import simulation
+import game_sprites
+
+
+class Autopilot():
+    """This class defines a controller that plays one platform by predicting where the ball lands."""
+
+    # Initalizes how far the platform may be from its target before it moves, which is half of one move, as a
+    # constant class variable.
+    DEADBAND = game_sprites.Platform.SPEED // 2
+
+    # Initalizes the largest fraction of the platform's half width the autopilot aims with as a constant class
+    # variable, which keeps the ball on the platform when the platform stops short of its target.
+    MAX_SPOT = 0.6
+
+    def __init__(self, player):
+        """Initalizes the autopilot with no wall known yet. Takes the platform to play as 0 for player 1 or 1 for
+        player 2. Returns nothing."""
+
+        self.__player = player
+
+        # Initalizes the wall the autopilot last looked at, the bottom of that wall, the left and right edges of
+        # its columns with live bricks, and the point on the wall the ball is aimed at.
+        self.__wall = None
+        self.__wall_bottom = 0
+        self.__columns = []
+        self.__aim = (400, 0)
+
+    def predict(self, ball, height, ceiling=0):
+        """This method predicts where a ball will be when its bottom reaches a height, unfolding its straight
+        path through the reflections off the side edges and a ceiling. Takes the ball sprite, the height as an
+        integer, and the height of the ceiling, which is the top of the screen unless another is given and is
+        only used when the ball is below it. Returns a tuple of the left edge of the ball and the steps until it
+        gets there, or None when the ball is already below the height or is not moving up or down."""
+
+        x, y = ball.get_position()
+        dx, dy = ball.get_velocity()
+        target = height - ball.rect.height
+        if y < ceiling:
+            ceiling = simulation.Simulation.BOUNDS.top
+
+        # A ball moving up reflects off the ceiling before it comes down.
+        if dy > 0:
+            distance = target - y
+        elif dy < 0:
+            distance = (y - ceiling) + (target - ceiling)
+        else:
+            return None
+        if distance < 0:
+            return None
+        steps = distance / abs(dy)
+
+        return self.__fold(x + dx * steps, ball.rect.width), steps
+
+    def get_inputs(self, game):
+        """This method decides which way to move the platform this step. Takes the simulation. Returns a tuple
+        of whether to press left and right."""
+
+        platform = game.get_player2() if self.__player else game.get_player1()
+        height = platform.rect.top
+        self.__update_wall(game)
+
+        # Plays the ball in play that reaches the platform first.
+        landing = None
+        for ball in game.get_balls_in_play():
+            prediction = self.predict(ball, height, self.__get_ceiling(ball))
+            if prediction and (landing is None or prediction[1] < landing[1]):
+                landing, chosen = prediction, ball
+        if landing is None:
+            return (False, False)
+        x, steps = landing
+        centre = x + chosen.rect.width / 2
+
+        # Works out the sideways speed that carries the ball from the platform to the aim.
+        aim_x, aim_y = self.__aim
+        climb = max(height - aim_y, 1) / abs(chosen.get_velocity()[1])
+        width = platform.rect.width
+        limit = min(Autopilot.MAX_SPOT, 1 - 2 * Autopilot.DEADBAND / width)
+        spot = min(max((aim_x - centre) / climb / game_sprites.Ball.MAX_BOUNCE_DX, -limit), limit)
+
+        # Centres the platform under the ball instead when the angled spot cannot be reached in time.
+        target = centre - spot * width / 2
+        if abs(target - platform.rect.centerx) > steps * game_sprites.Platform.SPEED + Autopilot.DEADBAND:
+            target = centre
+
+        return (platform.rect.centerx > target + Autopilot.DEADBAND,
+                platform.rect.centerx < target - Autopilot.DEADBAND)
+
+    def __fold(self, x, width):
+        """This helper method folds a straight sideways path back between the side edges of the screen, which
+        reflect it every span. Takes the unfolded left edge of the ball and the ball width. Returns the left
+        edge of the ball on the screen."""
+
+        bounds = simulation.Simulation.BOUNDS
+        span = bounds.width - width
+        x = (x - bounds.left) % (2 * span)
+        if x > span:
+            x = 2 * span - x
+
+        return x + bounds.left
+
+    def __get_ceiling(self, ball):
+        """This helper method gets the height a ball moving up will come back down from, which is the bottom of
+        the wall when the ball meets a column with live bricks there and the top of the screen otherwise. Takes
+        the ball sprite and returns an integer."""
+
+        x, y = ball.get_position()
+        dx, dy = ball.get_velocity()
+        if dy >= 0 or y <= self.__wall_bottom:
+            return 0
+
+        # Finds where the ball crosses the bottom of the wall.
+        centre = self.__fold(x + dx * (y - self.__wall_bottom) / -dy, ball.rect.width) + ball.rect.width / 2
+        for left, right in self.__columns:
+            if left <= centre < right:
+                return self.__wall_bottom
+
+        return 0
+
+    def __update_wall(self, game):
+        """This helper method looks at the wall again once it has changed. It finds the bottom of the wall, the
+        columns that still have live bricks, and the point to aim the ball at, which is the bottom of the column
+        with the most live bricks, preferring the columns nearer the middle. Takes the simulation and returns
+        nothing."""
+
+        bricks = game.get_bricks()
+        wall = (game.get_level(), bricks.get_count(), bricks.get_offset())
+        if wall == self.__wall:
+            return
+        self.__wall = wall
+
+        # Finds the columns with live bricks, edge to edge so that a ball between two bricks is caught.
+        counts = bricks.get_column_counts()
+        self.__columns = []
+        for col, count in enumerate(counts):
+            if count:
+                rect = bricks.get_cell_rect(0, col)
+                self.__columns.append((rect.left, bricks.get_cell_rect(0, col + 1).left))
+
+        # Aims at the middle of the screen when the wall is gone.
+        if not bricks.get_count():
+            self.__wall_bottom = 0
+            self.__aim = (simulation.Simulation.BOUNDS.centerx, 0)
+            return
+        self.__wall_bottom = bricks.get_bounds().bottom
+        col = max(range(len(counts)), key=lambda col: (counts[col], -abs(2 * col - len(counts) + 1)))
+        self.__aim = (bricks.get_cell_rect(0, col).centerx, self.__wall_bottom)
@@ -0,0 +1,328 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains a NumPy batched version of the super break-out game rules. It holds many
+independent games as arrays and steps all of them together, following the same rules as simulation.Simulation
+with the original overlap collisions (swept=False).
+"""
+
+# Import and Initalize dependencies.
+import numpy
+import brick_field
+import game_sprites
+import simulation
+
+
+def round_half_away(values):
+    """This function rounds values half away from zero the same way pygame rounds floats assigned to a Rect.
+    Takes a NumPy array as a parameter and returns an integer array."""
+
+    return (numpy.sign(values) * numpy.floor(numpy.abs(values) + 0.5)).astype(numpy.int64)
+
+
+class BatchSimulation():
+    """This class defines many independent games of super break-out stepped together with NumPy arrays."""
+
+    # Initalizes the brick wall layout as constant class variables.
+    ROWS = 6
+    COLS = 18
+    BRICK_SIZE = (40, 24)
+    BRICK_PITCH = (40 + 5, 24 + 5)
+    BRICK_TOP = 34 // 2 - 24 // 2
+
+    # Initalizes the ball and screen sizes as constant class variables.
+    BALL_SIZE = 15
+    SCREEN_SIZE = (800, 600)
+
+    # Initalizes the top of the loss zone as a constant class variable.
+    LOSS_ZONE_TOP = 585
+
+    # Initalizes the platform speed as a constant class variable.
+    PLATFORM_SPEED = 10
+
+    def __init__(self, n_games, difficulty=2, players=0):
+        """Initalizes the arrays for every game. Takes the number of games, the difficulty from 2 to 5, and
+        the number of players as 0 for one player or 1 for two players as integer parameters. Returns
+        nothing."""
+
+        self.__n_games = n_games
+        self.__difficulty = difficulty
+        self.__players = players
+
+        # Initalizes the score of each brick row as an array.
+        self.__row_scores = numpy.array(brick_field.BrickField.SCORE_VALUES, dtype=numpy.int64)
+
+        # Initalizes the left edge of each brick column and the top edge of each brick row.
+        self.__brick_left = numpy.arange(BatchSimulation.COLS) * BatchSimulation.BRICK_PITCH[0]
+        self.__brick_top = numpy.arange(BatchSimulation.ROWS) * BatchSimulation.BRICK_PITCH[1] \
+            + BatchSimulation.BRICK_TOP
+
+        # Initalizes the ball arrays.
+        self.__ball_x = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__ball_y = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__ball_dx = numpy.zeros(n_games, dtype=numpy.float64)
+        self.__ball_dy = numpy.zeros(n_games, dtype=numpy.float64)
+
+        # Initalizes the platform arrays with one column per player.
+        self.__paddle_x = numpy.zeros((n_games, 2), dtype=numpy.int64)
+        self.__paddle_y = numpy.zeros((n_games, 2), dtype=numpy.int64)
+        self.__paddle_w = numpy.zeros((n_games, 2), dtype=numpy.int64)
+        self.__paddle_h = numpy.zeros((n_games, 2), dtype=numpy.int64)
+        self.__paddle_active = numpy.zeros((n_games, 2), dtype=bool)
+
+        # Initalizes the brick wall arrays.
+        self.__alive = numpy.zeros((n_games, BatchSimulation.ROWS, BatchSimulation.COLS), dtype=bool)
+        self.__wall_offset = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__downshift_val = numpy.zeros(n_games, dtype=numpy.int64)
+
+        # Initalizes the game state arrays.
+        self.__score = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__lives = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__phase = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__frame = numpy.zeros(n_games, dtype=numpy.int64)
+        self.__done = numpy.zeros(n_games, dtype=bool)
+        self.__win = numpy.zeros(n_games, dtype=bool)
+
+        self.reset()
+
+    def reset(self, mask=None):
+        """This method starts new games. Takes an optional boolean array selecting which games to restart and
+        restarts all of them if it is None. Returns nothing."""
+
+        if mask is None:
+            mask = numpy.ones(self.__n_games, dtype=bool)
+
+        # Resets the ball to the centre of the screen with its starting velocity.
+        self.__ball_x[mask] = 400 - BatchSimulation.BALL_SIZE // 2
+        self.__ball_y[mask] = 400 - BatchSimulation.BALL_SIZE // 2
+        self.__ball_dx[mask] = 4
+        self.__ball_dy[mask] = 6
+
+        # Resets the platforms to match the selected options.
+        width, height = game_sprites.Platform.SIZES[self.__difficulty]
+        if self.__players == 0:
+            centres = ((400, 580), (600, 560))
+            active = (True, False)
+        else:
+            centres = ((200, 580), (600, 560))
+            active = (True, True)
+        for player in range(2):
+            self.__paddle_x[mask, player] = centres[player][0] - width // 2
+            self.__paddle_y[mask, player] = centres[player][1] - height // 2
+            self.__paddle_w[mask, player] = width
+            self.__paddle_h[mask, player] = height
+            self.__paddle_active[mask, player] = active[player]
+
+        # Resets the brick wall.
+        self.__alive[mask] = True
+        self.__wall_offset[mask] = 0
+        self.__downshift_val[mask] = 2
+
+        # Resets the game state.
+        self.__score[mask] = 0
+        self.__lives[mask] = 3
+        self.__phase[mask] = 1
+        self.__frame[mask] = 0
+        self.__done[mask] = False
+        self.__win[mask] = False
+
+    def step(self, inputs):
+        """This method advances every running game by one frame. Takes the inputs as a boolean array of shape
+        (n_games, 4) ordered as player 1 left, player 1 right, player 2 left, and player 2 right. Returns
+        nothing."""
+
+        inputs = numpy.asarray(inputs, dtype=bool)
+        running = ~self.__done
+        self.__frame[running] += 1
+
+        # Left/Right movement for each player, left first like the keyboard handler.
+        for player in range(2):
+            moving = running & self.__paddle_active[:, player]
+            left = moving & inputs[:, player * 2] & (self.__paddle_x[:, player] > 0)
+            self.__paddle_x[left, player] -= BatchSimulation.PLATFORM_SPEED
+            right = moving & inputs[:, player * 2 + 1] \
+                & (self.__paddle_x[:, player] + self.__paddle_w[:, player] < BatchSimulation.SCREEN_SIZE[0])
+            self.__paddle_x[right, player] += BatchSimulation.PLATFORM_SPEED
+
+        # Increase difficulty after player reaches halfway score.
+        third = running & (self.__phase == 2) & (self.__score >= simulation.Simulation.PHASE_THREE_SCORE)
+        if third.any():
+            self.__phase[third] = 3
+            self.__increase_speed(third, 2)
+            self.__downshift_val[third] = 8
+
+            # Halves the platforms around their centres.
+            halving = third[:, None] & self.__paddle_active
+            centre_x = self.__paddle_x + self.__paddle_w // 2
+            new_w = self.__paddle_w // 2
+            self.__paddle_x = numpy.where(halving, centre_x - new_w // 2, self.__paddle_x)
+            self.__paddle_w = numpy.where(halving, new_w, self.__paddle_w)
+
+        # Increases difficulty after player reaches phase 1.
+        second = running & (self.__phase == 1) & (self.__score >= simulation.Simulation.PHASE_TWO_SCORE)
+        if second.any():
+            self.__phase[second] = 2
+            self.__increase_speed(second, 1)
+            self.__downshift_val[second] = 4
+
+        # Checks if end condition is present.
+        won = running & (self.__score >= game_sprites.Hud.WIN_SCORE)
+        lost = running & ~won & (self.__lives < 1)
+        self.__win |= won
+        self.__done |= won | lost
+        running &= ~(won | lost)
+
+        ball_x = self.__ball_x
+        ball_y = self.__ball_y
+        size = BatchSimulation.BALL_SIZE
+
+        # Player-ball collisions, player 1 first like the sprite group order.
+        paddle_hit = running[:, None] & self.__paddle_active \
+            & (ball_x[:, None] < self.__paddle_x + self.__paddle_w) & (ball_x[:, None] + size > self.__paddle_x) \
+            & (ball_y[:, None] < self.__paddle_y + self.__paddle_h) & (ball_y[:, None] + size > self.__paddle_y)
+        bounced = paddle_hit.any(axis=1)
+        if bounced.any():
+            first = numpy.argmax(paddle_hit, axis=1)
+            rows = numpy.arange(self.__n_games)
+            self.__change_direction(bounced, self.__paddle_x[rows, first], self.__paddle_w[rows, first])
+
+            # Shifts all bricks down.
+            self.__wall_offset[bounced] += self.__downshift_val[bounced]
+
+        # Ball-brick collisions.
+        brick_top = self.__brick_top[None, :] + self.__wall_offset[:, None]
+        row_hit = (ball_y[:, None] < brick_top + BatchSimulation.BRICK_SIZE[1]) & (ball_y[:, None] + size > brick_top)
+        col_hit = (ball_x[:, None] < self.__brick_left[None, :] + BatchSimulation.BRICK_SIZE[0]) \
+            & (ball_x[:, None] + size > self.__brick_left[None, :])
+        brick_hit = self.__alive & row_hit[:, :, None] & col_hit[:, None, :] & running[:, None, None]
+        broken = brick_hit.any(axis=(1, 2))
+        if broken.any():
+
+            # Removes bricks and adds to score.
+            self.__score += (brick_hit.sum(axis=2) * self.__row_scores[None, :]).sum(axis=1)
+            self.__alive &= ~brick_hit
+
+            # Reverse ball direction off the first brick in wall order.
+            first_col = numpy.argmax(brick_hit.reshape(self.__n_games, -1), axis=1) % BatchSimulation.COLS
+            self.__change_direction(broken, self.__brick_left[first_col], BatchSimulation.BRICK_SIZE[0])
+
+        # Loss zone-brick collisions remove all lives.
+        lowest_bottom = numpy.where(self.__alive.any(axis=2), brick_top + BatchSimulation.BRICK_SIZE[1], 0).max(axis=1)
+        self.__lives[running & (lowest_bottom > BatchSimulation.LOSS_ZONE_TOP)] -= 3
+
+        # Ball-loss zone collisions.
+        lost_ball = running & (ball_y + size > BatchSimulation.LOSS_ZONE_TOP)
+        damaged = lost_ball & (self.__lives > 1)
+        self.__ball_x[damaged] = 400 - size // 2
+        self.__ball_y[damaged] = 400 - size // 2
+        self.__lives[lost_ball] -= 1
+
+        # Moves the balls.
+        self.__move_balls(running)
+
+    def __increase_speed(self, mask, amount):
+        """This helper method speeds up the ball in its current vertical direction. Takes the games to change
+        as a boolean array and the amount as an integer parameter. Returns nothing."""
+
+        self.__ball_dy[mask] += numpy.where(self.__ball_dy[mask] > 0, amount, -amount)
+
+    def __change_direction(self, mask, item_left, item_width):
+        """This helper method bounces the ball off an item using the platform angle rule from
+        Ball.change_direction. Takes the games to change as a boolean array and the left edges and widths of
+        the collided items as arrays or integers. Returns nothing."""
+
+        centre_x = self.__ball_x + BatchSimulation.BALL_SIZE // 2
+        spot = (centre_x - item_left) / item_width * 2 - 1
+        self.__ball_dy = numpy.where(mask, -self.__ball_dy, self.__ball_dy)
+        self.__ball_dx = numpy.where(mask, spot * 4, self.__ball_dx)
+
+    def __move_balls(self, mask):
+        """This helper method moves the balls by one frame and bounces them off the screen edges the same way
+        as Ball.move. Takes the games to move as a boolean array. Returns nothing."""
+
+        size = BatchSimulation.BALL_SIZE
+        width, height = BatchSimulation.SCREEN_SIZE
+
+        # Horizontal screen edges.
+        edge = mask & ((self.__ball_x <= 0) | (self.__ball_x + size >= width))
+        self.__ball_dx[edge] = -self.__ball_dx[edge]
+        self.__ball_x[mask] = numpy.clip(self.__ball_x[mask], 0, width - size)
+        self.__ball_x[mask] = round_half_away(self.__ball_x[mask] + self.__ball_dx[mask])
+
+        # Vertical screen edges.
+        edge = mask & ((self.__ball_y <= 0) | (self.__ball_y + size >= height))
+        self.__ball_dy[edge] = -self.__ball_dy[edge]
+        self.__ball_y[mask] = numpy.clip(self.__ball_y[mask], 0, height - size)
+        self.__ball_y[mask] = round_half_away(self.__ball_y[mask] + self.__ball_dy[mask])
+
+    def get_n_games(self):
+        """This method gets the number of games in the batch. Takes no parameters and returns an integer."""
+
+        return self.__n_games
+
+    def get_ball_positions(self):
+        """This method gets the top left corner of every ball. Takes no parameters and returns an integer array
+        of shape (n_games, 2)."""
+
+        return numpy.stack((self.__ball_x, self.__ball_y), axis=1)
+
+    def get_ball_velocities(self):
+        """This method gets the velocity of every ball. Takes no parameters and returns a float array of shape
+        (n_games, 2)."""
+
+        return numpy.stack((self.__ball_dx, self.__ball_dy), axis=1)
+
+    def get_paddle_positions(self):
+        """This method gets the left edge of every platform. Takes no parameters and returns an integer array of
+        shape (n_games, 2)."""
+
+        return self.__paddle_x.copy()
+
+    def get_paddle_widths(self):
+        """This method gets the width of every platform. Takes no parameters and returns an integer array of
+        shape (n_games, 2)."""
+
+        return self.__paddle_w.copy()
+
+    def get_alive(self):
+        """This method gets the brick alive mask. Takes no parameters and returns a boolean array of shape
+        (n_games, 6, 18)."""
+
+        return self.__alive.copy()
+
+    def get_wall_offsets(self):
+        """This method gets how far each brick wall has moved down. Takes no parameters and returns an integer
+        array."""
+
+        return self.__wall_offset.copy()
+
+    def get_scores(self):
+        """This method gets the score of every game. Takes no parameters and returns an integer array."""
+
+        return self.__score.copy()
+
+    def get_lives(self):
+        """This method gets the lives of every game. Takes no parameters and returns an integer array."""
+
+        return self.__lives.copy()
+
+    def get_phases(self):
+        """This method gets the phase of every game. Takes no parameters and returns an integer array."""
+
+        return self.__phase.copy()
+
+    def get_frames(self):
+        """This method gets the frames stepped by every game. Takes no parameters and returns an integer
+        array."""
+
+        return self.__frame.copy()
+
+    def get_done(self):
+        """This method gets which games have ended. Takes no parameters and returns a boolean array."""
+
+        return self.__done.copy()
+
+    def get_win(self):
+        """This method gets which games were won. Takes no parameters and returns a boolean array."""
+
+        return self.__win.copy()
@@ -0,0 +1,224 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This program times the costly paths of the super break-out game under the dummy SDL drivers. It saves
+the timings as JSON and compares them against a stored baseline so slowdowns are caught before release.
+
+Usage: python benchmark.py --output results.json
+       python benchmark.py --baseline baseline.json --threshold 0.15
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import json
+import platform
+import statistics
+import sys
+import time
+import pygame
+import main
+import assets
+import game_sprites
+import simulation
+import brick_field
+
+
+def measure(action, number, repeat):
+    """This function times an action. Takes the action as a function that takes no parameters, the number of
+    calls per run, and the number of runs as integers. Returns a dictionary of the best and mean time per call
+    in milliseconds."""
+
+    times = []
+    for run in range(repeat):
+        start = time.perf_counter()
+        for call in range(number):
+            action()
+        times.append((time.perf_counter() - start) / number * 1000)
+
+    return {"best_ms": min(times), "mean_ms": statistics.mean(times), "number": number, "repeat": repeat}
+
+
+def press(handler, key):
+    """This function sends one key press to a display state's event handler. Takes the handler and the pygame
+    key constant as parameters. Returns nothing."""
+
+    handler(pygame.event.Event(pygame.KEYDOWN, key=key))
+
+
+def start_game(render_mode, phase, sparse, mode="single"):
+    """This function builds a game and plays through the menus into the game screen. Takes the render mode as
+    a string, the phase to start in as an integer, whether to clear all but three bricks as a boolean, and the
+    game mode as a string. Returns the game."""
+
+    game = main.main(render_mode, start=False, mode=mode)
+
+    # Picks one player and very easy, then starts the game.
+    press(game.menu_events_handler, pygame.K_SPACE)
+    press(game.game_opt_events_handler, pygame.K_s)
+    press(game.game_opt_events_handler, pygame.K_RIGHT)
+    press(game.game_opt_events_handler, pygame.K_RIGHT)
+    press(game.game_opt_events_handler, pygame.K_s)
+    press(game.game_opt_events_handler, pygame.K_SPACE)
+    press(game.game_instr_events_handler, pygame.K_SPACE)
+
+    # Moves the game on to the third phase without the transition freezes.
+    game_simulation = game.get_simulation()
+    if phase == 3:
+        game_simulation.get_hud().add_score(simulation.Simulation.PHASE_THREE_SCORE)
+        game_simulation.step((False, False, False, False))
+        game_simulation.step((False, False, False, False))
+
+    # Clears all but three bricks.
+    if sparse:
+        bricks = game_simulation.get_bricks()
+        for index in bricks.get_alive_indices()[:-3]:
+            bricks.kill(index)
+
+    return game
+
+
+def frame_action(game):
+    """This function builds the action that runs one game frame from fresh ball positions, so the balls never
+    reach the loss zone while being timed. Takes the game as a parameter. Returns the action."""
+
+    serve = game.get_simulation().serve
+    frame_time = 1000 / simulation.Simulation.TICK_RATE
+
+    def action():
+        serve()
+        game.frame(frame_time)
+
+    return action
+
+
+def build_wall_action():
+    """This function builds the action that fills a brick field with the 108 bricks of the classic wall and
+    composes them into its layer, as a new game does. Takes no parameters. Returns the action."""
+
+    bricks = brick_field.BrickField(6, 18, (0, 34 // 2 - 24 // 2), (40 + 5, 24 + 5))
+
+    def action():
+        bricks.reset(6, 18)
+        for row in range(6):
+            for col in range(18):
+                bricks.add(row, col, row, (row + col) % 4)
+        bricks.get_layer().update()
+
+    return action
+
+
+def run_benchmarks(render_mode, repeat, selected=None):
+    """This function runs the benchmarks. Takes the render mode as a string, the number of runs per benchmark
+    as an integer, and an optional list of name fragments to limit which benchmarks run. Returns a dictionary
+    of results by benchmark name."""
+
+    results = {}
+
+    def bench(name, action, number):
+        if selected and not any(fragment in name for fragment in selected):
+            return
+        results[name] = measure(action, number, repeat)
+        print("%-24s %9.4f ms best %9.4f ms mean" % (name, results[name]["best_ms"], results[name]["mean_ms"]))
+
+    # Construction and reset.
+    game = main.main(render_mode, start=False)
+    bench("entities", game.entities, 5)
+    bench("reset", game.reset, 5)
+    bench("build_wall_108_bricks", build_wall_action(), 20)
+
+    # One game frame at phase 1 and 3 with a full and a near-empty wall.
+    for phase in (1, 3):
+        for sparse in (False, True):
+            name = "frame_phase%d_%s" % (phase, "sparse" if sparse else "full")
+            bench(name, frame_action(start_game(render_mode, phase, sparse)), 200)
+
+    # One game frame with every ball of the stress mode in play.
+    bench("frame_stress_256_balls", frame_action(start_game(render_mode, 1, False, "stress")), 50)
+
+    # Text rendering.
+    label = game_sprites.Label("Press [SPACE] to start", 25, (400, 400))
+    bench("label_update_static", label.update, 2000)
+    texts = iter(range(10 ** 9))
+
+    def changing_label():
+        label.set_text("Final Score: %d" % (next(texts) % 400))
+        label.update()
+
+    bench("label_update_changing", changing_label, 2000)
+    hud = game_sprites.Hud()
+
+    def changing_hud():
+        hud.add_score(1)
+        hud.update()
+
+    bench("hud_update_changing", changing_hud, 2000)
+    bench("hud_update_static", hud.update, 2000)
+
+    return results
+
+
+def compare(results, baseline, threshold):
+    """This function compares results against a baseline using the best times. Takes the results and baseline
+    dictionaries by benchmark name and the allowed slowdown as a fraction. Returns a list of tuples of the
+    name, baseline time, current time, ratio, and whether it regressed."""
+
+    rows = []
+    for name, result in results.items():
+        if name in baseline:
+            ratio = result["best_ms"] / baseline[name]["best_ms"]
+            rows.append((name, baseline[name]["best_ms"], result["best_ms"], ratio, ratio > 1 + threshold))
+
+    return rows
+
+
+def main_program():
+    """This function parses the command line, runs the benchmarks, and saves and compares the results. Takes no
+    parameters and returns nothing."""
+
+    parser = argparse.ArgumentParser(description="Benchmark super break-out.")
+    parser.add_argument("--output", default=None, help="save the results to this JSON file")
+    parser.add_argument("--baseline", default=None, help="compare against the results in this JSON file")
+    parser.add_argument("--threshold", type=float, default=0.15, help="allowed slowdown before failing")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per benchmark")
+    parser.add_argument("--render", choices=("flip", "dirty", "texture"), default="flip",
+                        help="render mode of the game")
+    parser.add_argument("--only", nargs="*", default=None, help="only run benchmarks containing these names")
+    args = parser.parse_args()
+
+    results = run_benchmarks(args.render, args.repeat, args.only)
+
+    # Prints how often the asset and text caches were hit over the whole run.
+    caches = {"assets": assets.registry.get_stats(), "text": assets.registry.get_text_stats()}
+    print()
+    print("assets: %(loads)d loaded, %(bundled)d from the bundle, %(hits)d cache hits" % caches["assets"])
+    print("text:   %(hits)d hits, %(misses)d misses, %(hit_rate).1f%% hit rate, %(size)d cached" %
+          dict(caches["text"], hit_rate=caches["text"]["hit_rate"] * 100))
+
+    # Saves the results with what they were measured on.
+    if args.output:
+        report = {"meta": {"python": platform.python_version(), "pygame": pygame.version.ver,
+                           "machine": platform.machine(), "render": args.render, "repeat": args.repeat,
+                           "time": time.strftime("%Y-%m-%d %H:%M:%S")},
+                  "caches": caches, "results": results}
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+    # Compares against the baseline and fails on any regression.
+    if args.baseline:
+        with open(args.baseline) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        rows = compare(results, baseline, args.threshold)
+        print()
+        for name, before, after, ratio, regressed in rows:
+            print("%-24s %9.4f -> %9.4f ms %6.2fx %s" % (name, before, after, ratio, "REGRESSED" if regressed else ""))
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main_program()
@@ -0,0 +1,370 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the brick field for the super break-out game. The wall is stored as
+contiguous arrays of brick positions, colors, shapes, hit points, scores, and live flags laid out on a lattice,
+so shifting the wall is one offset change and breaking a brick flips one flag. The display draws the wall from
+one cached layer that is only made when something draws it, and collision queries hand out small brick handles
+that score and break their brick. The live flags and hit points are small enough to save every frame, so a game
+can be rolled back to an earlier frame.
+"""
+
+# Import and Initalize dependencies.
+import array
+import itertools
+import pygame
+import assets
+import game_sprites
+
+
+class BrickHandle():
+    """This class defines a handle to one brick of a brick field, as returned by its collision queries."""
+
+    def __init__(self, field, index, rect):
+        """Initalizes the handle. Takes the brick field, the brick's index as an integer, and the brick's rect
+        at the time of the query. Returns nothing."""
+
+        self.field = field
+        self.index = index
+        self.rect = rect
+
+    def remove_brick(self, hud):
+        """This method hits the brick, breaking it and adding its score to the HUD once it has no hit points
+        left. Takes the HUD as a parameter and returns nothing."""
+
+        self.field.hit(self.index, hud)
+
+
+class BrickField():
+    """This class defines a wall of bricks stored as arrays on a fixed lattice of rows and columns."""
+
+    # Initalizes the tuple of brick colors as a constant class variable.
+    # Order: Purple, Red, Orange, Yellow, Green, Blue
+    COLORS = ("p", "r", "o", "y", "g", "b")
+
+    # Initalizes the tuple of brick shapes as a constant class variable.
+    SHAPES = ("_rect.png", "_circle.png", "_star.png", "_pentagon.png", "_fish.png")
+
+    # Initalizes the tuple of brick score values as a constant class variable.
+    # Order: Purple, Red, Orange, Yellow, Green, and Blue
+    SCORE_VALUES = (6, 5, 4, 3, 2, 1)
+
+    def __init__(self, rows, cols, origin, pitch, size=(40, 24)):
+        """Initalizes the empty field. Takes the number of rows and columns as integers, the top left corner of
+        the first cell, the width and height of a cell, and the width and height of a brick as tuple ordered
+        pairs. Returns nothing."""
+
+        # Initalizes the lattice attributes.
+        self.__origin = origin
+        self.__pitch = pitch
+        self.__size = size
+
+        # Initalizes the brick arrays, indexed by the order the bricks were added. They are a pool that later
+        # walls reuse, so they only grow to the largest wall the field has held.
+        self.__x = array.array("i")
+        self.__y = array.array("i")
+        self.__row = array.array("i")
+        self.__color = bytearray()
+        self.__shape = bytearray()
+        self.__hit_points = bytearray()
+        self.__full_hit_points = bytearray()
+        self.__score = bytearray()
+        self.__alive = bytearray()
+
+        # Initalizes the brick layer, which is only made when something draws the field.
+        self.__layer = None
+
+        self.reset(rows, cols)
+
+    def reset(self, rows, cols):
+        """This method empties the field for a new wall, keeping the brick arrays and the layer to be filled
+        again. Takes the number of rows and columns of the new wall as integers. Returns nothing."""
+
+        self.__rows = rows
+        self.__cols = cols
+        self.__offset = 0
+        self.__downshift_val = 2
+
+        # Marks every pooled brick as free.
+        self.__used = 0
+        self.__alive[:] = bytes(len(self.__alive))
+
+        # Initalizes the brick index of each cell, -1 when empty, and the number of live bricks in each row and
+        # column.
+        self.__cells = array.array("i", [-1]) * (rows * cols)
+        self.__row_counts = [0] * rows
+        self.__col_counts = [0] * cols
+        self.__count = 0
+
+        # Empties the layer over the whole lattice, which new bricks are drawn into as they are added.
+        if self.__layer:
+            self.__layer.reset(self.__get_lattice_rect())
+
+    def add(self, row, col, color, shape, hit_points=1):
+        """This method puts a brick in an empty cell, reviving a free brick of the pool when there is one. Takes
+        the row and column, the color index into COLORS, which also picks the score, the shape index into
+        SHAPES, and the hit points as integers. Returns the brick's index."""
+
+        index = self.__used
+        self.__used += 1
+        brick = (self.__origin[0] + col * self.__pitch[0], self.__origin[1] + row * self.__pitch[1], row, color,
+                 shape, hit_points, hit_points, BrickField.SCORE_VALUES[color], 1)
+        columns = (self.__x, self.__y, self.__row, self.__color, self.__shape, self.__hit_points,
+                   self.__full_hit_points, self.__score, self.__alive)
+
+        # Revives a pooled brick, or grows the pool.
+        if index < len(self.__alive):
+            for column, value in zip(columns, brick):
+                column[index] = value
+        else:
+            for column, value in zip(columns, brick):
+                column.append(value)
+
+        self.__cells[row * self.__cols + col] = index
+        self.__row_counts[row] += 1
+        self.__col_counts[col] += 1
+        self.__count += 1
+
+        # Draws the brick into the layer once the field is being drawn.
+        if self.__layer:
+            self.__layer.draw_brick(self.__get_image(index), self.get_rect(index))
+
+        return index
+
+    def get_rect(self, index):
+        """This method gets where a brick is now. Takes the brick's index as an integer. Returns a new Rect."""
+
+        return pygame.Rect(self.__x[index], self.__y[index] + self.__offset, *self.__size)
+
+    def hit(self, index, hud):
+        """This method takes a hit point from a brick, and once it has none left adds its score to the HUD and
+        breaks it. Takes the brick's index as an integer and the HUD. Returns nothing."""
+
+        self.__hit_points[index] -= 1
+
+        # Darkens a brick that still has hit points left.
+        if self.__hit_points[index]:
+            if self.__layer:
+                self.__layer.darken(self.get_rect(index))
+            return
+
+        hud.add_score(self.__score[index])
+        self.kill(index)
+
+    def kill(self, index):
+        """This method breaks a brick without scoring it. Takes the brick's index as an integer. Returns
+        nothing."""
+
+        if not self.__alive[index]:
+            return
+
+        self.__alive[index] = 0
+        row = self.__row[index]
+        col = (self.__x[index] - self.__origin[0]) // self.__pitch[0]
+        self.__cells[row * self.__cols + col] = -1
+        self.__row_counts[row] -= 1
+        self.__col_counts[col] -= 1
+        self.__count -= 1
+
+        # Erases the brick from the layer, and shrinks the layer once a whole row or column is empty.
+        if self.__layer:
+            self.__layer.erase(self.get_rect(index))
+            if self.__count and not (self.__row_counts[row] and self.__col_counts[col]):
+                self.__layer.crop(self.get_bounds())
+
+    def set_downshift_val(self, value):
+        """This method sets how far the wall moves down on each shift. Takes the new downshift value as an
+        integer parameter. Returns nothing."""
+
+        self.__downshift_val = value
+
+    def move_down(self):
+        """This method moves the wall down by the downshift value. Takes no parameters and returns nothing."""
+
+        self.__offset += self.__downshift_val
+
+        # Moves the layer with it.
+        if self.__layer:
+            self.__layer.move_down(self.__downshift_val)
+
+    def get_cell_rect(self, row, col):
+        """This method gets where a cell of the lattice is now, whether or not it holds a brick. Takes the row
+        and column as integers. Returns a new Rect."""
+
+        return pygame.Rect(self.__origin[0] + col * self.__pitch[0],
+                           self.__origin[1] + row * self.__pitch[1] + self.__offset, *self.__size)
+
+    def is_open(self, row, col):
+        """This method checks if a cell has an empty cell or the edge of the lattice beside it, above it, or
+        below it. Takes the row and column as integers. Returns a boolean."""
+
+        for near_row, near_col in ((row - 1, col), (row + 1, col), (row, col - 1), (row, col + 1)):
+            if not (0 <= near_row < self.__rows and 0 <= near_col < self.__cols):
+                return True
+            if self.__cells[near_row * self.__cols + near_col] < 0:
+                return True
+
+        return False
+
+    def get_offset(self):
+        """This method gets how far the wall has moved down. Takes no parameters and returns an integer."""
+
+        return self.__offset
+
+    def collide(self, rect):
+        """This method finds the live bricks overlapping a rect by only checking the cells the rect covers.
+        Takes the rect as a parameter. Returns a list of brick handles in wall order, top row first."""
+
+        # Finds the range of cells under the rect.
+        first_col = max((rect.left - self.__origin[0]) // self.__pitch[0], 0)
+        last_col = min((rect.right - 1 - self.__origin[0]) // self.__pitch[0], self.__cols - 1)
+        top = self.__origin[1] + self.__offset
+        first_row = max((rect.top - top) // self.__pitch[1], 0)
+        last_row = min((rect.bottom - 1 - top) // self.__pitch[1], self.__rows - 1)
+
+        # Checks the bricks in those cells.
+        collided = []
+        for row in range(first_row, last_row + 1):
+            if self.__row_counts[row]:
+                for col in range(first_col, last_col + 1):
+                    index = self.__cells[row * self.__cols + col]
+                    if index >= 0:
+                        brick_rect = self.get_rect(index)
+                        if brick_rect.colliderect(rect):
+                            collided.append(BrickHandle(self, index, brick_rect))
+
+        return collided
+
+    def reaches(self, rect):
+        """This method checks if any brick of the lowest row that still has live bricks overlaps a rect, which
+        only that row can do first. Takes the rect as a parameter. Returns a boolean."""
+
+        for row in range(self.__rows - 1, -1, -1):
+            if self.__row_counts[row]:
+                top = self.__origin[1] + row * self.__pitch[1] + self.__offset
+                if top >= rect.bottom or top + self.__size[1] <= rect.top:
+                    return False
+                cells = self.__cells[row * self.__cols:(row + 1) * self.__cols]
+                return any(self.get_rect(index).colliderect(rect) for index in cells if index >= 0)
+
+        return False
+
+    def get_bounds(self):
+        """This method gets the screen rect around the rows and columns that still have live bricks. Takes no
+        parameters and returns a new Rect."""
+
+        rows = [row for row in range(self.__rows) if self.__row_counts[row]] or [0]
+        cols = [col for col in range(self.__cols) if self.__col_counts[col]] or [0]
+
+        return pygame.Rect(self.__origin[0] + cols[0] * self.__pitch[0],
+                           self.__origin[1] + rows[0] * self.__pitch[1] + self.__offset,
+                           (cols[-1] - cols[0]) * self.__pitch[0] + self.__size[0],
+                           (rows[-1] - rows[0]) * self.__pitch[1] + self.__size[1])
+
+    def get_column_counts(self):
+        """This method gets how many live bricks each column of the lattice holds. Takes no parameters and returns
+        a new list of integers."""
+
+        return list(self.__col_counts)
+
+    def get_alive_mask(self):
+        """This method gets which cells of the lattice hold a live brick, row by row. Takes no parameters and
+        returns a bytes object with a 1 for each live brick and a 0 for each other cell."""
+
+        alive = self.__alive
+
+        return bytes([alive[index] if index >= 0 else 0 for index in self.__cells])
+
+    def get_alive_indices(self):
+        """This method gets the indices of the live bricks. Takes no parameters and returns a list of
+        integers."""
+
+        return list(itertools.compress(range(len(self.__alive)), self.__alive))
+
+    def get_remaining_score(self):
+        """This method adds up the score of the live bricks. Takes no parameters and returns an integer."""
+
+        return sum(itertools.compress(self.__score, self.__alive))
+
+    def get_count(self):
+        """This method gets the number of live bricks. Takes no parameters and returns an integer."""
+
+        return self.__count
+
+    def get_state(self):
+        """This method gets what a saved game needs to restore the wall, which is only valid until the field is
+        reset. Takes no parameters and returns a tuple of the offset, the downshift value, and the live flags
+        and hit points of the bricks as bytes."""
+
+        return (self.__offset, self.__downshift_val, bytes(self.__alive[:self.__used]),
+                bytes(self.__hit_points[:self.__used]))
+
+    def set_state(self, state):
+        """This method restores the wall from a saved game of the same wall, rebuilding the cell lookups and
+        redrawing the layer only when bricks changed. Takes a tuple from get_state. Returns nothing."""
+
+        offset, self.__downshift_val, alive, hit_points = state
+        moved = offset - self.__offset
+        self.__offset = offset
+
+        # Moves the layer with the wall when no brick changed.
+        if alive == self.__alive[:self.__used] and hit_points == self.__hit_points[:self.__used]:
+            if self.__layer and moved:
+                self.__layer.move_down(moved)
+            return
+
+        self.__alive[:self.__used] = alive
+        self.__hit_points[:self.__used] = hit_points
+
+        # Rebuilds the brick index of each cell and the live counts from the live flags.
+        self.__cells = array.array("i", [-1]) * (self.__rows * self.__cols)
+        self.__row_counts = [0] * self.__rows
+        self.__col_counts = [0] * self.__cols
+        self.__count = 0
+        for index in self.get_alive_indices():
+            row = self.__row[index]
+            col = (self.__x[index] - self.__origin[0]) // self.__pitch[0]
+            self.__cells[row * self.__cols + col] = index
+            self.__row_counts[row] += 1
+            self.__col_counts[col] += 1
+            self.__count += 1
+
+        # Redraws the layer from the live bricks, darkening each once per hit it has taken.
+        if self.__layer:
+            self.__layer.reset(self.__get_lattice_rect())
+            for index in self.get_alive_indices():
+                rect = self.get_rect(index)
+                self.__layer.draw_brick(self.__get_image(index), rect)
+                for hit in range(self.__full_hit_points[index] - self.__hit_points[index]):
+                    self.__layer.darken(rect)
+            if self.__count and self.get_bounds() != self.__layer.rect:
+                self.__layer.crop(self.get_bounds())
+
+    def get_layer(self):
+        """This method gets the sprite that draws the whole wall, drawing the live bricks into it the first time
+        it is called. Broken bricks are erased from it and it follows the wall down. Takes no parameters and
+        returns a brick layer sprite."""
+
+        if self.__layer is None:
+            self.__layer = game_sprites.BrickLayer(self.get_bounds())
+
+            # Draws each live brick into the layer.
+            for index in self.get_alive_indices():
+                self.__layer.draw_brick(self.__get_image(index), self.get_rect(index))
+
+        return self.__layer
+
+    def __get_lattice_rect(self):
+        """This helper method gets the screen rect around every cell of the lattice. Takes no parameters and
+        returns a new Rect."""
+
+        return pygame.Rect(self.__origin[0], self.__origin[1] + self.__offset,
+                           (self.__cols - 1) * self.__pitch[0] + self.__size[0],
+                           (self.__rows - 1) * self.__pitch[1] + self.__size[1])
+
+    def __get_image(self, index):
+        """This helper method gets the image of a brick's color and shape. Takes the brick's index as an
+        integer. Returns the image surface."""
+
+        color = BrickField.COLORS[self.__color[index]]
+        return assets.registry.get_image("imgs/" + color + BrickField.SHAPES[self.__shape[index]])
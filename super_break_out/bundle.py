@@ -0,0 +1,230 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module builds and reads the asset bundle of the super break-out game. The bundle packs the
+decoded images, the sound effects decoded to PCM in the mixer's format, and the music and font files into one
+file that the game memory-maps at startup instead of opening and decoding every loose file.
+
+Usage: python bundle.py build
+       python bundle.py check
+"""
+
+# Selects the dummy SDL drivers before pygame is imported when run as the build step.
+import os
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import hashlib
+import io
+import json
+import mmap
+import struct
+import pygame
+
+# Initalizes the bundle file layout: magic, version, content hash, and index length, then the JSON index and data.
+MAGIC = b"SBAB"
+VERSION = 1
+HEADER = struct.Struct("<4sB32sI")
+PATH = "assets.bundle"
+
+# Initalizes the folders packed into the bundle and how each kind of file is stored.
+SOURCES = (("imgs", ".png", "image"), ("sounds", ".mp3", "sound"), ("music", ".mp3", "file"),
+           ("fonts", ".ttf", "file"))
+
+
+def file_hash(path):
+    """This function hashes the contents of a file. Takes the file path as a string. Returns the hex digest."""
+
+    with open(path, "rb") as source_file:
+        return hashlib.sha256(source_file.read()).hexdigest()
+
+
+def iter_sources(root="."):
+    """This function finds the asset files to pack, in a fixed order. Takes the game folder as a string. Yields
+    tuples of the asset path relative to the game folder and how it is stored."""
+
+    for folder, extension, kind in SOURCES:
+        for name in sorted(os.listdir(os.path.join(root, folder))):
+            if name.endswith(extension):
+                yield folder + "/" + name, kind
+
+
+def build(path=PATH, root="."):
+    """This function builds the bundle from the loose asset files. Sound effects are decoded in the format of
+    the mixer this process opens, which must match the game's. Takes the bundle path and the game folder as
+    strings. Returns the bundle's content hash as a hex string."""
+
+    pygame.mixer.init()
+    entries = {}
+    blobs = []
+    offset = 0
+    digest = hashlib.sha256(struct.pack("<B3i", VERSION, *pygame.mixer.get_init()))
+
+    for name, kind in iter_sources(root):
+        source = os.path.join(root, name)
+        stat = os.stat(source)
+        entry = {"kind": kind, "hash": file_hash(source), "size": stat.st_size, "mtime": stat.st_mtime_ns}
+
+        # Decodes images to raw pixels and sound effects to raw samples, and keeps other files as they are.
+        if kind == "image":
+            image = pygame.image.load(source)
+            entry["format"] = "RGBA" if image.get_flags() & pygame.SRCALPHA else "RGB"
+            entry["dims"] = image.get_size()
+            data = pygame.image.tobytes(image, entry["format"])
+        elif kind == "sound":
+            data = pygame.mixer.Sound(source).get_raw()
+        else:
+            with open(source, "rb") as source_file:
+                data = source_file.read()
+
+        # Aligns every blob to eight bytes so the raw pixels and samples can be used in place.
+        padding = -len(data) % 8
+        entry["offset"] = offset
+        entry["length"] = len(data)
+        entries[name] = entry
+        blobs.append(data + bytes(padding))
+        offset += len(data) + padding
+        digest.update(name.encode() + entry["hash"].encode())
+
+    index = json.dumps({"mixer": pygame.mixer.get_init(), "entries": entries}).encode()
+    index += b" " * (-(HEADER.size + len(index)) % 8)
+
+    with open(os.path.join(root, path), "wb") as bundle_file:
+        bundle_file.write(HEADER.pack(MAGIC, VERSION, digest.digest(), len(index)))
+        bundle_file.write(index)
+        for blob in blobs:
+            bundle_file.write(blob)
+
+    return digest.hexdigest()
+
+
+class AssetBundle():
+    """This class defines a memory-mapped asset bundle."""
+
+    def __init__(self, path=PATH, root="."):
+        """Initalizes the bundle by mapping the file and reading its index. Takes the bundle path and the game
+        folder whose loose files it was built from as strings. Returns nothing. Raises OSError if the file
+        cannot be opened and ValueError if it is not a bundle of this version."""
+
+        self.__root = root
+        with open(os.path.join(root, path), "rb") as bundle_file:
+            self.__map = mmap.mmap(bundle_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        # Reads the header and index.
+        if len(self.__map) < HEADER.size:
+            raise ValueError("bundle is too short")
+        magic, version, digest, index_length = HEADER.unpack_from(self.__map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a version %d asset bundle" % VERSION)
+        index = json.loads(bytes(self.__map[HEADER.size:HEADER.size + index_length]))
+
+        self.__hash = digest.hex()
+        self.__mixer = tuple(index["mixer"])
+        self.__entries = index["entries"]
+        self.__data = memoryview(self.__map)[HEADER.size + index_length:]
+        self.__fresh = {}
+
+    def is_fresh(self, name):
+        """This method checks that a packed asset still matches its loose file. A loose file with a new size or
+        modification time is hashed again, and a missing loose file is trusted to be the packed one. Takes the
+        asset path as a string. Returns a boolean."""
+
+        if name not in self.__fresh:
+            entry = self.__entries.get(name)
+            source = os.path.join(self.__root, name)
+            if entry is None:
+                fresh = False
+            elif not os.path.exists(source):
+                fresh = True
+            else:
+                stat = os.stat(source)
+                fresh = ((stat.st_size, stat.st_mtime_ns) == (entry["size"], entry["mtime"])
+                         or file_hash(source) == entry["hash"])
+            self.__fresh[name] = fresh
+
+        return self.__fresh[name]
+
+    def get_data(self, name):
+        """This method gets the packed bytes of an asset without copying them. Takes the asset path as a
+        string. Returns a memoryview into the mapped file."""
+
+        entry = self.__entries[name]
+        return self.__data[entry["offset"]:entry["offset"] + entry["length"]]
+
+    def get_image(self, name):
+        """This method gets a packed image. Takes the asset path as a string. Returns a surface that reads its
+        pixels from the mapped file, or None if the image is not packed or out of date."""
+
+        if not self.is_fresh(name) or self.__entries[name]["kind"] != "image":
+            return None
+
+        entry = self.__entries[name]
+        return pygame.image.frombuffer(self.get_data(name), tuple(entry["dims"]), entry["format"])
+
+    def get_sound(self, name):
+        """This method gets a packed sound effect, or decodes a packed music file as a sound. Takes the asset
+        path as a string. Returns a Sound, or None if the sound is not packed, out of date, or was decoded for a
+        different mixer format."""
+
+        if not self.is_fresh(name):
+            return None
+
+        # Decodes packed files, which are kept compressed.
+        if self.__entries[name]["kind"] == "file":
+            return pygame.mixer.Sound(file=self.get_file(name))
+
+        if self.__entries[name]["kind"] != "sound" or pygame.mixer.get_init() != self.__mixer:
+            return None
+
+        return pygame.mixer.Sound(buffer=self.get_data(name))
+
+    def get_file(self, name):
+        """This method gets a packed file, such as music or a font, as a file object. Takes the asset path as a
+        string. Returns a binary file object, or None if the file is not packed or out of date."""
+
+        if not self.is_fresh(name):
+            return None
+
+        return io.BytesIO(self.get_data(name))
+
+    def get_hash(self):
+        """This method gets the content hash the bundle was built with. Takes no parameters and returns a hex
+        string."""
+
+        return self.__hash
+
+    def get_names(self):
+        """This method gets the paths of the packed assets. Takes no parameters and returns a list of
+        strings."""
+
+        return list(self.__entries)
+
+
+def main():
+    """This function parses the command line and builds or checks the bundle. Takes no parameters and returns
+    nothing."""
+
+    parser = argparse.ArgumentParser(description="Build or check the super break-out asset bundle.")
+    parser.add_argument("command", choices=("build", "check"))
+    parser.add_argument("--output", default=PATH, help="bundle file path")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        print("built %s (%s)" % (args.output, build(args.output)))
+    else:
+        bundle = AssetBundle(args.output)
+        stale = [name for name in bundle.get_names() if not bundle.is_fresh(name)]
+        missing = [name for name, kind in iter_sources() if name not in bundle.get_names()]
+        print("bundle %s: %d assets, %d out of date, %d not packed" % (bundle.get_hash()[:12],
+              len(bundle.get_names()), len(stale), len(missing)))
+        for name in stale + missing:
+            print("rebuild needed: " + name)
+        if stale or missing:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the swept collision tests for the super break-out game. They find when a
+moving box first touches a still box during a step, so fast balls cannot pass through thin paddles or corners.
+"""
+
+
+def axis_times(start, size, motion, low, high):
+    """This function finds when a moving span enters and leaves a still span along one axis. Takes the start and
+    size of the moving span, its motion for the step, and the low and high ends of the still span as numbers.
+    Returns a tuple of the entry and exit times as fractions of the step."""
+
+    if motion > 0:
+        return (low - (start + size)) / motion, (high - start) / motion
+    if motion < 0:
+        return (high - start) / motion, (low - (start + size)) / motion
+
+    # A span that is not moving overlaps the whole step or never.
+    if start + size <= low or start >= high:
+        return float("inf"), float("-inf")
+    return float("-inf"), float("inf")
+
+
+def sweep(position, size, motion, target):
+    """This function finds the first contact of a moving box with a still rect during a step. A box that already
+    overlaps the rect only counts if it is moving further into it. Takes the top left position and size of the
+    moving box and its motion for the step as tuple ordered pairs, and the target as a Rect. Returns a tuple of
+    the contact time as a fraction of the step and the axis of the contact as "x" or "y", or None."""
+
+    x_entry, x_exit = axis_times(position[0], size[0], motion[0], target.left, target.right)
+    y_entry, y_exit = axis_times(position[1], size[1], motion[1], target.top, target.bottom)
+    entry = max(x_entry, y_entry)
+    exit = min(x_exit, y_exit)
+
+    # Checks that both axes overlap at once during the step.
+    if entry >= exit or entry > 1 or exit <= 0:
+        return None
+
+    # The contact is on the axis that starts overlapping last.
+    axis = "x" if x_entry > y_entry else "y"
+
+    # Only pushes out of an overlap when moving towards the target's centre.
+    if entry < 0:
+        if axis == "x":
+            towards = (target.centerx - (position[0] + size[0] / 2)) * motion[0] > 0
+        else:
+            towards = (target.centery - (position[1] + size[1] / 2)) * motion[1] > 0
+        if not towards:
+            return None
+        entry = 0.0
+
+    return entry, axis
+
+
+def sweep_bounds(position, size, motion, bounds):
+    """This function finds when a moving box inside a rect first touches one of the rect's edges during a step.
+    Takes the top left position and size of the moving box and its motion for the step as tuple ordered pairs,
+    and the bounds as a Rect. Returns a tuple of the contact time as a fraction of the step and the axis of the
+    contact as "x" or "y", or None."""
+
+    contact = None
+
+    # Checks the left and right edges, then the top and bottom edges.
+    for axis, start, length, move, low, high in (("x", position[0], size[0], motion[0], bounds.left, bounds.right),
+                                                 ("y", position[1], size[1], motion[1], bounds.top, bounds.bottom)):
+        if move > 0:
+            time = (high - (start + length)) / move
+        elif move < 0:
+            time = (low - start) / move
+        else:
+            continue
+
+        time = max(time, 0.0)
+        if time <= 1 and (contact is None or time < contact[0]):
+            contact = (time, axis)
+
+    return contact
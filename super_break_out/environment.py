@@ -0,0 +1,203 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains a reinforcement learning environment for the super break-out game. It wraps the
+headless simulation that the game steps in a reset and step interface with no window, sound, or frame clock, so it
+runs as fast as the CPU allows. Observations are a compact state vector or the pixels of an off-screen 800x600
+surface, which are a view of the surface's own memory and are never copied.
+
+Usage: python environment.py --steps 10000 --observation pixels --frame-skip 4 --downsample 2
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import itertools
+import random
+import time
+import numpy
+import pygame
+import simulation
+import levels
+
+
+class Environment():
+    """This class defines a reset and step environment around a headless game of super break-out."""
+
+    # Initalizes the observation types as a constant class variable.
+    OBSERVATIONS = ("state", "pixels")
+
+    # Initalizes the inputs of each platform's actions, which are staying still, moving left, and moving right,
+    # as a constant class variable.
+    PLATFORM_ACTIONS = ((False, False), (True, False), (False, True))
+
+    # Initalizes the length of the state vector before the brick mask as a constant class variable. The vector
+    # holds the ball's rect and velocity, the left edge of each platform, and how far the wall has moved down,
+    # followed by a mask of live bricks on the largest lattice a level can have.
+    STATE_HEADER = 9
+    STATE_SIZE = STATE_HEADER + levels.MAX_ROWS * levels.MAX_COLS
+
+    # Initalizes the background color the pixels are drawn on as a constant class variable.
+    BACKGROUND = (73, 13, 97)
+
+    def __init__(self, difficulty=2, players=0, observation="state", frame_skip=1, downsample=1, life_penalty=10,
+                 swept=True, mode="single", level=None):
+        """Initalizes the game and the observation buffers. Takes the difficulty from 2 to 5 and the number of
+        players as 0 for one player or 1 for two players as integers, the observation type from OBSERVATIONS,
+        how many frames each action is held for, the step between the pixels kept in each direction, and the
+        reward taken away for each life lost. Also takes whether the ball uses swept collisions, the game mode,
+        and the level, which is the classic wall when it is None. Returns nothing."""
+
+        self.__difficulty = difficulty
+        self.__players = players
+        self.__observation = observation
+        self.__frame_skip = frame_skip
+        self.__life_penalty = life_penalty
+        self.__mode = mode
+        self.__level = level
+        self.__game = simulation.Simulation(difficulty, players, swept, 0, level, mode)
+
+        # Initalizes the actions, which move both platforms together in a two player game.
+        if players:
+            self.__actions = tuple(p1 + p2 for p1, p2 in itertools.product(Environment.PLATFORM_ACTIONS, repeat=2))
+        else:
+            self.__actions = tuple(p1 + (False, False) for p1 in Environment.PLATFORM_ACTIONS)
+
+        # Initalizes the off-screen surface, which is made on top of the pixel buffer so drawing it updates the
+        # observation in place. A pixels3d view would lock the surface for as long as the observation is held,
+        # which stops it from being drawn on again.
+        self.__pixels = None
+        if observation == "pixels":
+            size = simulation.Simulation.BOUNDS.size
+            self.__pixels = numpy.zeros((size[1], size[0], 4), dtype=numpy.uint8)
+            self.__surface = pygame.image.frombuffer(self.__pixels, size, "RGBX")
+            self.__view = self.__pixels[::downsample, ::downsample, :3]
+            self.__sprites = pygame.sprite.Group()
+
+        self.reset()
+
+    def reset(self, seed=None):
+        """This method starts a new game. Takes the seed of the game, which picks a fresh seed when it is None.
+        Returns the first observation."""
+
+        self.__game.reset(seed, self.__level, self.__mode)
+        self.__game.configure(self.__difficulty, self.__players)
+
+        # Draws the wall, platforms, and balls again, since the game takes out the sprites it is not using.
+        if self.__pixels is not None:
+            self.__sprites.add(self.__game.get_bricks().get_layer(), self.__game.get_players(),
+                               self.__game.get_balls())
+
+        return self.get_observation()
+
+    def step(self, action):
+        """This method holds an action for the frame skip, stopping early if the game ends. The reward is the
+        score gained less the life penalty for each life lost. Takes the index of the action in the actions.
+        Returns a tuple of the observation, the reward, whether the game is over, and a dictionary of the
+        score, lives, phase, frame, and whether the game was won."""
+
+        game = self.__game
+        hud = game.get_hud()
+        inputs = self.__actions[action]
+        score = hud.get_score()
+        lives = max(hud.get_lives(), 0)
+
+        for frame in range(self.__frame_skip):
+            if game.is_game_over():
+                break
+            game.step(inputs)
+
+        reward = hud.get_score() - score - self.__life_penalty * (lives - max(hud.get_lives(), 0))
+        info = {"score": hud.get_score(), "lives": hud.get_lives(), "phase": game.get_phase(),
+                "frame": game.get_frame(), "win": bool(hud.get_win())}
+
+        return self.get_observation(), reward, game.is_game_over(), info
+
+    def get_observation(self):
+        """This method gets the observation of the game now. The pixels are a view that the next step or reset
+        draws over, so they must be copied to be kept. Takes no parameters and returns the state vector as a
+        float32 array or the pixels as a uint8 array of rows, columns, and RGB."""
+
+        if self.__pixels is None:
+            return self.get_state()
+
+        # Draws the wall, platforms, and balls straight into the pixels.
+        layer = self.__game.get_bricks().get_layer()
+        layer.update()
+        self.__surface.fill(Environment.BACKGROUND)
+        self.__sprites.draw(self.__surface)
+
+        return self.__view
+
+    def get_state(self):
+        """This method gets the state vector of the game, using the first ball in play. Takes no parameters and
+        returns a float32 array of STATE_SIZE."""
+
+        game = self.__game
+        balls = game.get_balls_in_play()
+        ball = balls[0] if balls else game.get_ball()
+        bricks = game.get_bricks()
+        rows, cols = game.get_level().get_size()
+
+        state = numpy.zeros(Environment.STATE_SIZE, dtype=numpy.float32)
+        state[:Environment.STATE_HEADER] = tuple(ball.rect) + ball.get_velocity() + \
+                                           (game.get_player1().rect.x, game.get_player2().rect.x, bricks.get_offset())
+        mask = state[Environment.STATE_HEADER:].reshape(levels.MAX_ROWS, levels.MAX_COLS)
+        mask[:rows, :cols] = numpy.frombuffer(bricks.get_alive_mask(), dtype=numpy.uint8).reshape(rows, cols)
+
+        return state
+
+    def get_actions(self):
+        """This method gets the inputs of each action. Takes no parameters and returns a tuple of the inputs
+        tuples the game steps with."""
+
+        return self.__actions
+
+    def get_simulation(self):
+        """This method gets the game being played. Takes no parameters and returns the simulation."""
+
+        return self.__game
+
+
+def main():
+    """This function plays random actions in the environment and reports how fast it steps. Takes no parameters
+    and returns nothing."""
+
+    parser = argparse.ArgumentParser(description="Time the super break-out environment.")
+    parser.add_argument("--steps", type=int, default=10000, help="number of environment steps")
+    parser.add_argument("--observation", choices=Environment.OBSERVATIONS, default="state", help="observation type")
+    parser.add_argument("--frame-skip", type=int, default=1, help="frames each action is held for")
+    parser.add_argument("--downsample", type=int, default=1, help="step between the pixels kept")
+    parser.add_argument("--difficulty", type=int, choices=(2, 3, 4, 5), default=2,
+                        help="2 very easy, 3 easy, 4 medium, 5 hard")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1, help="number of players")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game and the actions")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    env = Environment(args.difficulty, args.players - 1, args.observation, args.frame_skip, args.downsample)
+    observation = env.reset(args.seed)
+    n_actions = len(env.get_actions())
+    games = 0
+    total = 0
+
+    start = time.perf_counter()
+    for step in range(args.steps):
+        observation, reward, done, info = env.step(rng.randrange(n_actions))
+        total += reward
+        if done:
+            games += 1
+            observation = env.reset(rng.getrandbits(64))
+    elapsed = time.perf_counter() - start
+
+    print("observation: %s %s" % (observation.dtype, observation.shape))
+    print("games:       %d (total reward %d)" % (games, total))
+    print("elapsed:     %.3fs (%.0f steps/s)" % (elapsed, args.steps / elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,10 +6,10 @@ Description: This module contains the sprites for the super break-out game.
 
 # Import and Initalize dependencies.
 import pygame
-import random
+import assets
 pygame.init()
 
-class Label(pygame.sprite.Sprite):
+class Label(pygame.sprite.DirtySprite):
     """This class defines the sprite for a label."""
 
     def __init__(self, text, font_size, pos):
@@ -23,12 +23,13 @@ class Label(pygame.sprite.Sprite):
         # Initalizes the attributes.
         self.__animate = False
         self.__pos = pos
-        self.__game_font = pygame.font.Font("fonts/press_start_2.ttf", font_size)
+        self.__font_size = font_size
         self.__text = text
         self.__color = (255, 255, 255)
         
         # Initalizes the image attribute.
-        self.image = self.__game_font.render(self.__text, True, self.__color)
+        self.image = assets.registry.render_text(self.__text, self.__font_size, self.__color)
+        self.__dirty = False
         
         # Initalizes the rect attributes
         self.rect = self.image.get_rect()
@@ -47,13 +48,17 @@ class Label(pygame.sprite.Sprite):
         """This method sets the text attribute of the label sprite. Takes the new text as a string parameter.
         Returns nothing."""
 
-        self.__text = text
+        if text != self.__text:
+            self.__text = text
+            self.__dirty = True
 
     def set_text_color(self, color):
         """This method sets the text color attribute of the label sprite. Takes the new color as a tuple
         with rgb values as a parameter."""
         
-        self.__color = color
+        if color != self.__color:
+            self.__color = color
+            self.__dirty = True
 
     def highlight(self):
         """This method highlights lets a label highlight itself. Takes no parameters and returns nothing."""
@@ -75,72 +80,125 @@ class Label(pygame.sprite.Sprite):
 
         if self.__animate:
             self.rect.y += self.__dy
+            self.dirty = 1
 
             if self.rect.top <= self.__upper or self.rect.bottom > self.__lower:
                 self.__dy = -self.__dy
         
-        self.image = self.__game_font.render(self.__text, True, self.__color)
-        self.rect = self.image.get_rect()
-        self.rect.center = self.__pos
+        # Renders the text again only if it has changed.
+        if self.__dirty:
+            self.image = assets.registry.render_text(self.__text, self.__font_size, self.__color)
+            self.__dirty = False
+            self.dirty = 1
+            
+            # Keeps the label centred on its position, or on its current height if it is animated.
+            centre_y = self.rect.centery if self.__animate else self.__pos[1]
+            self.rect = self.image.get_rect()
+            self.rect.center = (self.__pos[0], centre_y)
 
-class Brick(pygame.sprite.Sprite):
-    """This class defines the sprite for a brick."""
+class BrickLayer(pygame.sprite.DirtySprite):
+    """This class defines the sprite for a whole brick wall drawn once into a cached layer. The image is changed
+    in place, so its image version counts the updates that changed it for renderers that keep a copy of it."""
+
+    # Initalizes the brightness of a brick with hit points left after being hit as a constant class variable.
+    HIT_SHADE = (170, 170, 170, 255)
+
+    def __init__(self, rect):
+        """Initalizes the empty layer image and rect. Takes the screen rect the wall covers as a parameter.
+        Returns nothing."""
 
-    # Initalizes the tuple of brick colors as a constant class variable.
-    # Order: Purple, Red, Orange, Yellow, Green, Blue
-    COLORS = ("p", "r", "o", "y", "g", "b")
-    
-    # Initalizes the tuple of brick shapes as a constant class variable.
-    SHAPES = ("_rect.png", "_circle.png", "_star.png", "_pentagon.png", "_fish.png")
-    
-    # Initalizes the tuple of brick score values as a constant class variable.
-    # Order: Purple, Red, Orange, Yellow, Green, and Blue
-    SCORE_VALUES = (6, 5, 4, 3, 2, 1)
-    
-    def __init__(self, pos, row):
-        """Initalizes brick image and rect. Takes in the bricks position as a tuple and which row brick is as an integer.
-        Returns nothing"""
-        
         # Inherits the parent sprite class.
         super().__init__()
-        
-        # Initalizes the brick attributes.
-        self.__pos = pos
-        self.__score_value = Brick.SCORE_VALUES[row]
-        self.__downshift_val = 2
-        
-        # Initalizes the image attribute.
-        self.image = pygame.image.load("imgs/" + Brick.COLORS[row] + Brick.SHAPES[random.randrange(4)])
-        
-        # Initalizes the rect attribute.
-        self.rect = self.image.get_rect()
-        self.rect.center = self.__pos
-        
-    def set_downshift_val(self, value):
-        """This method sets the downshift value of the brick. Takes the new downshift value as a integer
-        parameter. Returns nothing."""
-        
-        self.__downshift_val = value
-    
-    def move_down(self):
-        """This method moves the brick down by the screen by the downshift value. Takes no parameters and
-        returns nothing."""
-        
-        self.rect.y += self.__downshift_val
-        
-    def remove_brick(self, hud):
-        """This method adds the score value of the brick into the HUD score and removes the brick object.
-        Takes no parameters and returns nothing."""
-        
-        hud.add_score(self.__score_value)
-        self.kill()
 
-class Platform(pygame.sprite.Sprite):
+        # Initalizes the screen rects changed since the last frame.
+        self.__damage = []
+
+        # Initalizes the image and rect attributes and the image's version.
+        self.image = None
+        self.image_version = 0
+        self.reset(rect)
+
+    def reset(self, rect):
+        """This method empties the layer for a new wall, keeping its image when the wall is the same size.
+        Takes the screen rect the new wall covers as a parameter. Returns nothing."""
+
+        # Makes a new image for a wall of a new size. The image is run-length encoded, so drawing it skips the
+        # empty runs between bricks and is only encoded again after a brick changes.
+        if self.image is None or self.image.get_size() != rect.size:
+            self.image = pygame.Surface(rect.size, pygame.SRCALPHA)
+            if pygame.display.get_surface():
+                self.image = self.image.convert_alpha()
+            self.image.set_alpha(255, pygame.RLEACCEL)
+        else:
+            self.image.fill((0, 0, 0, 0))
+
+        self.rect = pygame.Rect(rect)
+        self.__damage.clear()
+        self.image_version += 1
+        self.dirty = 1
+
+    def draw_brick(self, image, rect):
+        """This method draws a brick into the layer. Takes the brick image and its screen rect as parameters.
+        Returns nothing."""
+
+        self.image.blit(image, rect.move(-self.rect.x, -self.rect.y))
+        self.__damage.append(pygame.Rect(rect))
+
+    def erase(self, rect):
+        """This method erases a broken brick from the layer. Takes the brick's screen rect as a parameter.
+        Returns nothing."""
+
+        self.image.fill((0, 0, 0, 0), rect.move(-self.rect.x, -self.rect.y))
+        self.__damage.append(pygame.Rect(rect))
+
+    def darken(self, rect):
+        """This method darkens a brick of the layer to show it has been hit but not broken. Takes the brick's
+        screen rect as a parameter. Returns nothing."""
+
+        self.image.fill(BrickLayer.HIT_SHADE, rect.move(-self.rect.x, -self.rect.y),
+                        special_flags=pygame.BLEND_RGBA_MULT)
+        self.__damage.append(pygame.Rect(rect))
+
+    def crop(self, rect):
+        """This method shrinks the layer to the part of it under a rect, so less of the screen is drawn and
+        cleared for it. Takes the screen rect to keep, which must be inside the layer, as a parameter. Returns
+        nothing."""
+
+        self.image = self.image.subsurface(rect.move(-self.rect.x, -self.rect.y)).copy()
+        self.image.set_alpha(255, pygame.RLEACCEL)
+        self.rect = pygame.Rect(rect)
+        self.dirty = 1
+
+    def move_down(self, value):
+        """This method moves the whole layer down the screen. Takes the distance as an integer. Returns
+        nothing."""
+
+        self.rect.y += value
+        self.dirty = 1
+
+    def update(self):
+        """This method asks the dirty rectangle groups drawing the layer to repaint only the bricks that
+        changed, so the rest of the layer is not drawn again. Takes no parameters and returns nothing."""
+
+        # Repaints the changed bricks unless the whole layer is being drawn anyway.
+        if not self.dirty:
+            for group in self.groups():
+                if isinstance(group, pygame.sprite.LayeredDirty):
+                    for rect in self.__damage:
+                        group.repaint_rect(rect)
+        if self.__damage:
+            self.image_version += 1
+        self.__damage.clear()
+
+class Platform(pygame.sprite.DirtySprite):
     """This class defines the sprite for a player controlled platform."""
     
     # Initalizes the tuple of platform sizez as a constant class variable.
     # Order: Super Easy, Easy, Medium, Hard
     SIZES = {2: (160, 10), 3: (120, 10), 4: (80, 15), 5: (40, 10)}
+
+    # Initalizes how far the platform moves each step as a constant class variable.
+    SPEED = 10
     
     
     def __init__(self, pos):
@@ -153,7 +211,7 @@ class Platform(pygame.sprite.Sprite):
         # Initalizes the platform attributes.
         self.__size = Platform.SIZES[2]
         self.__color = (255, 255, 255)
-        self.__dx = 10
+        self.__dx = Platform.SPEED
         self.__pos = pos
         
         # Initalizes the image attribute.
@@ -164,14 +222,25 @@ class Platform(pygame.sprite.Sprite):
         self.rect = self.image.get_rect()
         self.rect.center = self.__pos
     
+    def restart(self, pos):
+        """This method restores the platform to the size, color, and position it starts a game with. Takes the
+        position as a tuple ordered pair. Returns nothing."""
+
+        self.__size = Platform.SIZES[2]
+        self.__color = (255, 255, 255)
+        self.__pos = pos
+        self.update_platform()
+
     def move(self, direction):
         """This method moves the platform left or right by the preset dx speed. Takes the direction of
         movement as a string parameter. Returns nothing."""
         
         if direction == "left" and self.rect.left > 0:
             self.rect.x -= self.__dx
+            self.dirty = 1
         elif direction == "right" and self.rect.right < 800:
             self.rect.x += self.__dx
+            self.dirty = 1
             
     def third_phase(self):
         """This method changes the platform for third phase difficulty by halfing the platform size and
@@ -201,6 +270,25 @@ class Platform(pygame.sprite.Sprite):
         self.__pos = pos
         self.update_platform()
         
+    def get_state(self):
+        """This method gets what a saved game needs to restore the platform. Takes no parameters and returns a
+        tuple of the centre, size, and color."""
+
+        return self.rect.center, self.__size, self.__color
+
+    def set_state(self, state):
+        """This method restores the platform from a saved game, only making a new image when its size or color
+        changed. Takes a tuple from get_state. Returns nothing."""
+
+        self.__pos, size, color = state
+        if (size, color) != (self.__size, self.__color):
+            self.__size = size
+            self.__color = color
+            self.update_platform()
+        elif self.rect.center != self.__pos:
+            self.rect.center = self.__pos
+            self.dirty = 1
+
     def update_platform(self):
         """Updates the platform image and rect attributes. Takes no parameters and returns nothing."""
         
@@ -208,10 +296,14 @@ class Platform(pygame.sprite.Sprite):
         self.image.fill(self.__color)
         self.rect = self.image.get_rect()
         self.rect.center = self.__pos
+        self.dirty = 1
         
-class Ball(pygame.sprite.Sprite):
+class Ball(pygame.sprite.DirtySprite):
     """This class defines the sprite for a moving ball."""
     
+    # Initalizes the fastest a platform bounce sends the ball sideways as a constant class variable.
+    MAX_BOUNCE_DX = 4
+    
     def __init__(self):
         """Initalizes the ball image and rect. Takes no parameters and returns nothing."""
         
@@ -223,12 +315,15 @@ class Ball(pygame.sprite.Sprite):
         self.__dy = 6
         
         # Initalizes the image attributes.
-        self.image = pygame.image.load("imgs/ball.png")
-        self.image.set_colorkey((0,0,0))
+        self.image = assets.registry.get_image("imgs/ball.png", colorkey=(0, 0, 0))
         
         # Initalizes the rect attributes.
         self.rect = self.image.get_rect()
         self.rect.center = (400, 400)
+        
+        # Initalizes the exact position used by swept movement.
+        self.__x = float(self.rect.x)
+        self.__y = float(self.rect.y)
     
     def change_direction(self, collided_item):
         """This method changes the movement direction of the ball based on the point of collision
@@ -244,7 +339,7 @@ class Ball(pygame.sprite.Sprite):
         collision_spot = (collision_spot * 2) - 1 
 
         # Adjust the horizontal velocity based on the collision point.
-        self.__dx = collision_spot * 4
+        self.__dx = collision_spot * Ball.MAX_BOUNCE_DX
         
     def increase_speed(self, amount):
         """This method increases the speed of the movement direction of the ball. Takes the amount
@@ -256,15 +351,68 @@ class Ball(pygame.sprite.Sprite):
         else:
             self.__dy -= amount
     
-    def reset(self):
-        """This method resets the ball to the centre of the screen. Takes no parameters and returns
-        nothing."""
+    def reset(self, center=(400, 400)):
+        """This method resets the ball to where it is served, which is the centre of the screen unless
+        another centre is given as a tuple ordered pair. Returns nothing."""
         
-        self.rect.center = (400, 400)
+        self.rect.center = center
+        self.__x = float(self.rect.x)
+        self.__y = float(self.rect.y)
+        self.dirty = 1
+        
+    def restart(self, center=(400, 400), direction=1):
+        """This method restores the ball to the speed it starts a game with and resets it to where it is
+        served. Takes the serve centre as a tuple ordered pair, which is the centre of the screen by default,
+        and the horizontal direction as 1 for right or -1 for left. Returns nothing."""
+
+        self.__dx = 4 * direction
+        self.__dy = 6
+        self.reset(center)
+
+    def get_position(self):
+        """This method gets the exact position of the top left corner of the ball, which the rect rounds.
+        Takes no parameters and returns a tuple ordered pair of floats."""
+        
+        return (self.__x, self.__y)
+    
+    def set_position(self, pos):
+        """This method sets the exact position of the top left corner of the ball and rounds the rect to it.
+        Takes the position as a tuple ordered pair. Returns nothing."""
+        
+        self.__x, self.__y = pos
+        self.rect.x = self.__x
+        self.rect.y = self.__y
+        self.dirty = 1
+        
+    def get_velocity(self):
+        """This method gets the movement of the ball per frame. Takes no parameters and returns a tuple
+        ordered pair."""
+        
+        return (self.__dx, self.__dy)
+    
+    def get_state(self):
+        """This method gets what a saved game needs to restore the ball. Takes no parameters and returns a
+        tuple of the rect's top left corner, the exact position, and the velocity."""
+
+        return self.rect.topleft, self.__x, self.__y, self.__dx, self.__dy
+
+    def set_state(self, state):
+        """This method restores the ball from a saved game. Takes a tuple from get_state. Returns nothing."""
+
+        self.rect.topleft, self.__x, self.__y, self.__dx, self.__dy = state
+        self.dirty = 1
+
+    def bounce(self, axis):
+        """This method reverses the ball along one axis. Takes the axis as "x" or "y". Returns nothing."""
+        
+        if axis == "x":
+            self.__dx = -self.__dx
+        else:
+            self.__dy = -self.__dy
                 
-    def update(self):
-        """This method will be called automatically to reposition the ball sprite on the screen.
-        Takes no parameters and returns nothing."""
+    def move(self):
+        """This method repositions the ball by one frame of movement and bounces it off the screen
+        edges. Takes no parameters and returns nothing."""
         
         # Check for collisions with the left and right screen edges
         if self.rect.left <= 0 or self.rect.right >= 800:
@@ -289,8 +437,11 @@ class Ball(pygame.sprite.Sprite):
         
         # Move the ball vertically
         self.rect.y += self.__dy
+        self.__x = float(self.rect.x)
+        self.__y = float(self.rect.y)
+        self.dirty = 1
         
-class Loss_zone(pygame.sprite.Sprite):
+class Loss_zone(pygame.sprite.DirtySprite):
     """This class defines the sprite for a loss zone."""
     
     def __init__(self):
@@ -309,8 +460,12 @@ class Loss_zone(pygame.sprite.Sprite):
         self.rect.center = (400, 595)
         
 
-class Hud(pygame.sprite.Sprite):
-    """This class defines the sprite for the HUD."""
+class Hud(pygame.sprite.DirtySprite):
+    """This class defines the sprite for the HUD. The image is redrawn in place, so its image version counts the
+    redraws for renderers that keep a copy of it."""
+    
+    # Initalizes the score that wins the classic wall as a constant class variable.
+    WIN_SCORE = 378
     
     def __init__(self):
         """Initalizes the HUD image and rect. Takes no parameters and returns nothing."""
@@ -321,39 +476,50 @@ class Hud(pygame.sprite.Sprite):
         self.__score = 0
         self.__lives = 3
         self.__win = False
+        self.__win_score = Hud.WIN_SCORE
         
         # Initalizes the image attributes.
         self.image = pygame.Surface((180, 100))
         self.image.fill((0, 0, 0))
         self.image.set_colorkey((0,0,0))
         
-        # Initalizes the HUD Text font.
-        self.__game_font = pygame.font.Font("fonts/press_start_2.ttf", 20)
-        
         # Initalizes the HUD elements.
-        self.score_text = self.__game_font.render(str(self.__score), True, (255, 255, 255))
-        self.lives_text = self.__game_font.render(str(self.__lives), True, (255, 255, 255))
-        self.score_label = self.__game_font.render("Score", True, (255, 255, 255))
-        self.heart_img = pygame.transform.scale(pygame.image.load("imgs/heart.png"), (25, 25))
-        self.x_text = self.__game_font.render("x", True, (255, 255, 255))
+        self.score_label = assets.registry.render_text("Score", 20, (255, 255, 255))
+        self.heart_img = assets.registry.get_image("imgs/heart.png", (25, 25))
+        self.x_text = assets.registry.render_text("x", 20, (255, 255, 255))
+        self.__dirty = True
+        self.image_version = 0
         
         # # Initalizes the rect attributes..
         self.rect = self.image.get_rect()
         self.rect.center = (120, 530)
     
+    def restart(self):
+        """This method zeroes the score and restores the lives for a new game. Takes no parameters and returns
+        nothing."""
+
+        self.__score = 0
+        self.__lives = 3
+        self.__win = False
+        self.__dirty = True
+
     def add_score(self, new_values):
         """Increases the score by the specified amount. Takes the amount as a parameter and
         returns nothing."""
 
         # Adds the new values to the current score.
-        self.__score += new_values
+        if new_values:
+            self.__score += new_values
+            self.__dirty = True
 
     def remove_life(self, amount):
         """This method removes a specified number of lives. Takes the amount as a parameter
         and returns nothing."""
 
         # Decreases the number of lives by the specified amount.
-        self.__lives -= amount
+        if amount:
+            self.__lives -= amount
+            self.__dirty = True
 
     def get_score(self):
         """This method returns the current score. Takes no parameters and returns the value
@@ -369,6 +535,12 @@ class Hud(pygame.sprite.Sprite):
         # Returns the current number of lives.
         return self.__lives
 
+    def set_win_score(self, score):
+        """This method sets the score that wins the game. Takes the score as an integer parameter and
+        returns nothing."""
+
+        self.__win_score = score
+
     def get_win(self):
         """This method gets whether the player has won the game. Takes no parameters and
         returns the value stored in the win attribute."""
@@ -376,12 +548,26 @@ class Hud(pygame.sprite.Sprite):
         # Returns the win status (True if the player has won, False otherwise).
         return self.__win
 
+    def get_state(self):
+        """This method gets what a saved game needs to restore the HUD. Takes no parameters and returns a tuple
+        of the score, lives, win, and win score."""
+
+        return self.__score, self.__lives, self.__win, self.__win_score
+
+    def set_state(self, state):
+        """This method restores the HUD from a saved game, redrawing it if the score or lives changed. Takes a
+        tuple from get_state. Returns nothing."""
+
+        if state[:2] != (self.__score, self.__lives):
+            self.__dirty = True
+        self.__score, self.__lives, self.__win, self.__win_score = state
+
     def check_game_over(self):
         """This method checks if the game is over based on the score or remaining lives. Takes
         no parameters and returns nothing."""
 
         # Checks if the player has won.
-        if self.__score == 378:
+        if self.__score >= self.__win_score:
             self.__win = True 
             return True  
 
@@ -394,12 +580,19 @@ class Hud(pygame.sprite.Sprite):
         """This method updates the HUD elements on the screen, rendering the score and lives.
         Takes no parameters and returns nothing."""
         
+        # Only redraws the HUD when the score or lives have changed.
+        if not self.__dirty:
+            return
+        self.__dirty = False
+        self.dirty = 1
+        self.image_version += 1
+        
         # Clears HUD.
         self.image.fill((0, 0, 0, 0))
         
         # Blits HUD elements onto HUD.
-        self.image.blit(self.__game_font.render(str(self.__score), True, (255, 255, 255)), (0, 20))
-        self.image.blit(self.__game_font.render("Score", True, (255, 255, 255)), (80, 20))
+        self.image.blit(assets.registry.render_text(str(self.__score), 20, (255, 255, 255)), (0, 20))
+        self.image.blit(self.score_label, (80, 20))
         self.image.blit(self.heart_img, (5, 65))
-        self.image.blit(self.__game_font.render("x", True, (255, 255, 255)), (45, 70))
-        self.image.blit(self.__game_font.render(str(self.__lives), True, (255, 255, 255)), (80, 70))
+        self.image.blit(self.x_text, (45, 70))
+        self.image.blit(assets.registry.render_text(str(self.__lives), 20, (255, 255, 255)), (80, 70))
@@ -0,0 +1,243 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This program plays the super break-out game rules headlessly for a number of frames and reports
+how fast they ran. It is meant for soak tests and has no window, sound, or frame cap.
+
+Usage: python headless.py --frames 100000 --difficulty 2 --players 1 --policy track
+       python headless.py --frames 10000 --batch 4096 --policy random
+       python headless.py --frames 10000 --mode stress --policy track
+       python headless.py --frames 1000000 --difficulty 5 --players 2 --policy autopilot
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import random
+import time
+import simulation
+import levels
+import replay
+import autopilot
+
+
+def idle_policy(game, rng):
+    """This function never presses anything. Takes the simulation and a random generator as parameters and
+    returns the inputs tuple."""
+
+    return (False, False, False, False)
+
+
+def random_policy(game, rng):
+    """This function presses random directions. Takes the simulation and a random generator as parameters
+    and returns the inputs tuple."""
+
+    return (rng.random() < 0.5, rng.random() < 0.5, rng.random() < 0.5, rng.random() < 0.5)
+
+
+def track_policy(game, rng):
+    """This function moves each platform towards the lowest ball in play. Takes the simulation and a random
+    generator as parameters and returns the inputs tuple."""
+
+    balls = game.get_balls_in_play()
+    ball_x = (max(balls, key=lambda ball: ball.rect.bottom) if balls else game.get_ball()).rect.centerx
+    inputs = []
+    for player in (game.get_player1(), game.get_player2()):
+        inputs.append(ball_x < player.rect.centerx - 5)
+        inputs.append(ball_x > player.rect.centerx + 5)
+
+    return tuple(inputs)
+
+
+# Initalizes the autopilots of the two platforms as a constant, which keep the point they aim at between steps.
+AUTOPILOTS = (autopilot.Autopilot(0), autopilot.Autopilot(1))
+
+
+def autopilot_policy(game, rng):
+    """This function moves each platform to where the ball will land, lined up to bounce it towards the most
+    bricks. Takes the simulation and a random generator as parameters and returns the inputs tuple."""
+
+    return AUTOPILOTS[0].get_inputs(game) + AUTOPILOTS[1].get_inputs(game)
+
+
+# Initalizes the dictionary of input policies by name.
+POLICIES = {"idle": idle_policy, "random": random_policy, "track": track_policy, "autopilot": autopilot_policy}
+
+
+def batch_idle_policy(games, rng):
+    """This function never presses anything in any game. Takes the batch simulation and a NumPy random
+    generator as parameters and returns the inputs array."""
+
+    import numpy
+
+    return numpy.zeros((games.get_n_games(), 4), dtype=bool)
+
+
+def batch_random_policy(games, rng):
+    """This function presses random directions in every game. Takes the batch simulation and a NumPy random
+    generator as parameters and returns the inputs array."""
+
+    return rng.random((games.get_n_games(), 4)) < 0.5
+
+
+def batch_track_policy(games, rng):
+    """This function moves each platform towards the ball in every game. Takes the batch simulation and a
+    NumPy random generator as parameters and returns the inputs array."""
+
+    import numpy
+
+    ball_x = games.get_ball_positions()[:, :1] + games.BALL_SIZE // 2
+    paddle_x = games.get_paddle_positions() + games.get_paddle_widths() // 2
+    inputs = numpy.empty((games.get_n_games(), 4), dtype=bool)
+    inputs[:, 0::2] = ball_x < paddle_x - 5
+    inputs[:, 1::2] = ball_x > paddle_x + 5
+
+    return inputs
+
+
+# Initalizes the dictionary of batched input policies by name.
+BATCH_POLICIES = {"idle": batch_idle_policy, "random": batch_random_policy, "track": batch_track_policy}
+
+
+def new_game(difficulty, players, swept, rng, record_dir, level=None, game=None, mode="single"):
+    """This function starts a seeded game and its recorder if games are being recorded. Takes the difficulty,
+    players, whether to use swept collisions, the random generator that picks the seed, the directory to
+    record to or None, the level or None for the classic level, an optional finished simulation to reset in
+    place instead of making a new one, and the mode. Returns a tuple of the simulation and the recorder or
+    None."""
+
+    seed = rng.getrandbits(64)
+    if game:
+        game.reset(seed, level, mode)
+        game.configure(difficulty, players)
+    else:
+        game = simulation.Simulation(difficulty, players, swept, seed, level, mode)
+    recorder = replay.ReplayRecorder(seed, difficulty, players, swept, level, mode) if record_dir else None
+
+    return game, recorder
+
+
+def run(frames, difficulty, players, policy, seed=None, swept=True, record_dir=None, pack=None, mode="single"):
+    """This function plays the given number of frames, starting a new game whenever one ends. Takes the
+    number of frames, difficulty from 2 to 5, players as 0 or 1, the policy function, an optional random
+    seed, whether to use swept collisions, an optional directory to save a replay of every finished game to,
+    an optional level pack whose levels are played in turn, and the mode. Returns a dictionary of results."""
+
+    rng = random.Random(seed)
+    level = pack.get_level(0) if pack else None
+    game, recorder = new_game(difficulty, players, swept, rng, record_dir, level, None, mode)
+    results = {"frames": frames, "games": 0, "wins": 0, "best_score": 0}
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        inputs = policy(game, rng)
+        if recorder:
+            recorder.record(inputs)
+        game.step(inputs)
+
+        # Records the finished game and starts a new one.
+        if game.is_game_over():
+            hud = game.get_hud()
+            results["games"] += 1
+            results["wins"] += hud.get_win()
+            results["best_score"] = max(results["best_score"], hud.get_score())
+            # Names the replay by its seed as well, so a later run into the same directory does not overwrite it.
+            if recorder:
+                name = "game_%06d_%016x%s" % (results["games"], recorder.get_seed(), replay.EXTENSION)
+                recorder.save(os.path.join(record_dir, name), hud.get_score(), hud.get_win())
+            if pack:
+                level = pack.get_level(results["games"] % pack.get_count())
+            game, recorder = new_game(difficulty, players, swept, rng, record_dir, level, game, mode)
+    elapsed = time.perf_counter() - start
+
+    results["last_score"] = game.get_hud().get_score()
+    results["seconds"] = elapsed
+    results["fps"] = frames / elapsed if elapsed else float("inf")
+
+    return results
+
+
+def run_batch(frames, n_games, difficulty, players, policy, seed=None):
+    """This function plays the given number of frames in every game of a batch, restarting games as they
+    end. Takes the number of frames, number of games, difficulty from 2 to 5, players as 0 or 1, the batched
+    policy function, and an optional random seed. Returns a dictionary of results."""
+
+    # Imports NumPy and the batched simulator only here, so single games do not need NumPy.
+    import numpy
+    import batch_simulation
+
+    rng = numpy.random.default_rng(seed)
+    games = batch_simulation.BatchSimulation(n_games, difficulty, players)
+    results = {"frames": frames * n_games, "games": 0, "wins": 0, "best_score": 0}
+
+    start = time.perf_counter()
+    for frame in range(frames):
+        games.step(policy(games, rng))
+
+        # Records the finished games and starts new ones.
+        done = games.get_done()
+        if done.any():
+            scores = games.get_scores()
+            results["games"] += int(done.sum())
+            results["wins"] += int((done & games.get_win()).sum())
+            results["best_score"] = max(results["best_score"], int(scores[done].max()))
+            games.reset(done)
+    elapsed = time.perf_counter() - start
+
+    results["last_score"] = int(games.get_scores().max())
+    results["seconds"] = elapsed
+    results["fps"] = frames * n_games / elapsed if elapsed else float("inf")
+
+    return results
+
+
+def main():
+    """This function parses the command line and runs the headless game. Takes no parameters and returns
+    nothing."""
+
+    parser = argparse.ArgumentParser(description="Play super break-out headlessly.")
+    parser.add_argument("--frames", type=int, default=10000, help="number of frames to play")
+    parser.add_argument("--difficulty", type=int, choices=(2, 3, 4, 5), default=2,
+                        help="2 very easy, 3 easy, 4 medium, 5 hard")
+    parser.add_argument("--players", type=int, choices=(1, 2), default=1, help="number of players")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="track", help="input policy")
+    parser.add_argument("--seed", type=int, default=None, help="seed for the random policy")
+    parser.add_argument("--batch", type=int, default=0,
+                        help="step this many games together with NumPy, which always uses discrete collisions")
+    parser.add_argument("--collision", choices=("swept", "discrete"), default="swept",
+                        help="collision test for the ball")
+    parser.add_argument("--record-dir", default=None, help="save a replay of every finished game here")
+    parser.add_argument("--levels", default=None, help="play the levels of this level pack in turn")
+    parser.add_argument("--mode", choices=simulation.Simulation.MODES, default="single", help="game mode")
+    args = parser.parse_args()
+    if args.batch and args.levels:
+        parser.error("the batched simulator only plays the classic level")
+    if args.batch and args.mode != "single":
+        parser.error("the batched simulator only plays single mode")
+    if args.batch and args.policy not in BATCH_POLICIES:
+        parser.error("the batched simulator has no %s policy" % args.policy)
+
+    # Runs one game at a time or a NumPy batch of games.
+    if args.batch:
+        results = run_batch(args.frames, args.batch, args.difficulty, args.players - 1,
+                            BATCH_POLICIES[args.policy], args.seed)
+    else:
+        if args.record_dir:
+            os.makedirs(args.record_dir, exist_ok=True)
+        pack = levels.LevelPack(args.levels) if args.levels else None
+        results = run(args.frames, args.difficulty, args.players - 1, POLICIES[args.policy], args.seed,
+                      args.collision == "swept", args.record_dir, pack, args.mode)
+
+    print("frames:     %d" % results["frames"])
+    print("games:      %d (%d won)" % (results["games"], results["wins"]))
+    print("best score: %d" % results["best_score"])
+    print("last score: %d" % results["last_score"])
+    print("elapsed:    %.3fs (%.0f frames/s)" % (results["seconds"], results["fps"]))
+
+
+if __name__ == "__main__":
+    main()
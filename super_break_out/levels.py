@@ -0,0 +1,261 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module reads and writes level packs for the super break-out game. A pack is one binary file
+with a header, a table of level offsets, and per level its grid size, phase and win scores, and one byte per
+cell holding the brick's color, shape, and hit points. Packs are memory-mapped, so opening a pack and
+switching levels reads only the bytes of that level without copying them.
+
+Usage: python levels.py generate community.sblp --count 5000 --seed 1
+       python levels.py info community.sblp
+"""
+
+# Selects the dummy SDL drivers before pygame is imported when run from the command line.
+import os
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import mmap
+import random
+import struct
+import brick_field
+
+# Initalizes the pack layout: magic, version, and level count, then a table of level offsets and the levels.
+MAGIC = b"SBLP"
+VERSION = 1
+HEADER = struct.Struct("<4sBI")
+OFFSET = struct.Struct("<Q")
+EXTENSION = ".sblp"
+
+# Initalizes the level layout: rows, columns, phase two score, phase three score, and win score, then the cells.
+LEVEL = struct.Struct("<BBHHI")
+
+# Initalizes the largest wall that fits the screen above the players.
+MAX_ROWS = 12
+MAX_COLS = 18
+
+# Initalizes the shape value that lets the session's random generator pick the shape, as the classic wall does.
+RANDOM_SHAPE = 7
+
+
+def pack_cell(color, shape, hit_points):
+    """This function packs a cell into a byte: the color in the low three bits, the shape in the next three,
+    and the hit points in the top two, where 0 hit points is an empty cell. Takes the color index into
+    BrickField.COLORS, the shape index into BrickField.SHAPES or RANDOM_SHAPE, and the hit points from 0 to 3 as
+    integers. Returns an integer from 0 to 255."""
+
+    return hit_points << 6 | shape << 3 | color
+
+
+def unpack_cell(byte):
+    """This function unpacks a cell byte. Takes the byte as an integer. Returns a tuple of the color, shape,
+    and hit points."""
+
+    return byte & 7, byte >> 3 & 7, byte >> 6
+
+
+def brick_score(cells):
+    """This function checks each brick of a wall and adds up their scores. Takes the cell bytes as a bytes-like
+    object. Returns the score of breaking every brick as an integer. Raises ValueError if a cell is not a valid
+    brick."""
+
+    total = 0
+    for byte in cells:
+        color, shape, hit_points = unpack_cell(byte)
+        if hit_points:
+            if color >= len(brick_field.BrickField.COLORS) or (shape >= 4 and shape != RANDOM_SHAPE):
+                raise ValueError("invalid brick cell %d" % byte)
+            total += brick_field.BrickField.SCORE_VALUES[color]
+
+    return total
+
+
+class Level():
+    """This class defines a level: a brick wall and the scores that change its phases and win it."""
+
+    def __init__(self, rows, cols, cells, phase_two, phase_three, win_score=None):
+        """Initalizes the level. Takes the number of rows and columns as integers, the cell bytes in row order
+        as a bytes-like object that is kept without copying, the phase two and phase three scores as integers,
+        and the win score, which is the score of every brick when it is None. Returns nothing. Raises
+        ValueError if the level does not fit the screen, a cell is not a valid brick, or the level cannot be
+        played through its phases to the win."""
+
+        if not (0 < rows <= MAX_ROWS and 0 < cols <= MAX_COLS) or len(cells) != rows * cols:
+            raise ValueError("level grid must be at most %dx%d" % (MAX_ROWS, MAX_COLS))
+
+        # Checks that the phases are reached in turn before the win, which the bricks can score.
+        total = brick_score(cells)
+        if win_score is None:
+            win_score = total
+        if not 0 < phase_two <= phase_three < win_score <= total:
+            raise ValueError("level phase scores %d and %d and win score %d do not fit its brick score of %d"
+                             % (phase_two, phase_three, win_score, total))
+
+        self.__rows = rows
+        self.__cols = cols
+        self.__cells = cells
+        self.__phase_scores = (phase_two, phase_three)
+        self.__win_score = win_score
+
+    def get_size(self):
+        """This method gets the grid size. Takes no parameters and returns a tuple of the rows and columns."""
+
+        return self.__rows, self.__cols
+
+    def get_cell(self, row, col):
+        """This method gets a cell of the wall. Takes the row and column as integers. Returns a tuple of the
+        color, shape, and hit points, or None if the cell is empty."""
+
+        cell = unpack_cell(self.__cells[row * self.__cols + col])
+        return cell if cell[2] else None
+
+    def get_phase_scores(self):
+        """This method gets the scores that start phase two and phase three. Takes no parameters and returns a
+        tuple of integers."""
+
+        return self.__phase_scores
+
+    def get_win_score(self):
+        """This method gets the score that wins the level. Takes no parameters and returns an integer."""
+
+        return self.__win_score
+
+    def to_bytes(self):
+        """This method builds the level's record as stored in a pack. Takes no parameters and returns the
+        bytes."""
+
+        return LEVEL.pack(self.__rows, self.__cols, *self.__phase_scores, self.__win_score) + bytes(self.__cells)
+
+
+def read_level(buffer, offset=0):
+    """This function reads a level record. Takes a bytes-like object and the offset of the record in it. Returns
+    the Level, whose cells are a view into the buffer. Raises ValueError if the record is cut short or is not a
+    playable level."""
+
+    view = memoryview(buffer)
+    if len(view) < offset + LEVEL.size:
+        raise ValueError("level record is cut short")
+
+    rows, cols, phase_two, phase_three, win_score = LEVEL.unpack_from(view, offset)
+    start = offset + LEVEL.size
+    if len(view) < start + rows * cols:
+        raise ValueError("level record is cut short")
+
+    return Level(rows, cols, view[start:start + rows * cols], phase_two, phase_three, win_score)
+
+
+def classic_level():
+    """This function builds the original wall: six rows of eighteen bricks, one color per row, each with a
+    shape picked by the session's random generator. Takes no parameters and returns the Level."""
+
+    cells = bytes(pack_cell(row, RANDOM_SHAPE, 1) for row in range(6) for col in range(18))
+    return Level(6, 18, cells, 80, 189)
+
+
+# Initalizes the level played when no pack is given.
+CLASSIC = classic_level()
+
+
+def random_level(rng):
+    """This function builds a random level for testing packs. Takes a random generator. Returns the Level."""
+
+    # Draws walls until one scores enough to have phases before its win.
+    win_score = 0
+    while win_score < 2:
+        rows = rng.randint(3, MAX_ROWS)
+        cols = rng.randint(6, MAX_COLS)
+        cells = bytes(pack_cell(rng.randrange(6), rng.randrange(4), rng.choice((0, 1, 1, 1, 2, 3)))
+                      for cell in range(rows * cols))
+        win_score = brick_score(cells)
+
+    # Puts the phase changes at the same share of the wall as the classic level.
+    phase_two = max(win_score * 80 // 378, 1)
+    return Level(rows, cols, cells, phase_two, max(win_score * 189 // 378, phase_two), win_score)
+
+
+def write_pack(path, levels):
+    """This function writes a level pack. Takes the file path as a string and the levels as a list. Returns
+    nothing."""
+
+    records = [level.to_bytes() for level in levels]
+    offset = HEADER.size + OFFSET.size * len(records)
+
+    with open(path, "wb") as pack_file:
+        pack_file.write(HEADER.pack(MAGIC, VERSION, len(records)))
+        for record in records:
+            pack_file.write(OFFSET.pack(offset))
+            offset += len(record)
+        for record in records:
+            pack_file.write(record)
+
+
+class LevelPack():
+    """This class defines a memory-mapped level pack."""
+
+    def __init__(self, path):
+        """Initalizes the pack by mapping the file and reading its header. Takes the file path as a string.
+        Returns nothing. Raises OSError if the file cannot be opened and ValueError if it is not a level pack
+        of this version."""
+
+        with open(path, "rb") as pack_file:
+            self.__map = mmap.mmap(pack_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self.__map) < HEADER.size:
+            raise ValueError("level pack is too short")
+        magic, version, count = HEADER.unpack_from(self.__map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("not a version %d level pack" % VERSION)
+        if len(self.__map) < HEADER.size + OFFSET.size * count:
+            raise ValueError("level pack is cut short")
+
+        self.__count = count
+
+    def get_count(self):
+        """This method gets the number of levels in the pack. Takes no parameters and returns an integer."""
+
+        return self.__count
+
+    def get_level(self, index):
+        """This method reads one level, looking up its offset in the table. Takes the level index as an
+        integer. Returns the Level, whose cells are a view into the mapped file. Raises IndexError if there is
+        no such level."""
+
+        if not 0 <= index < self.__count:
+            raise IndexError("level %d is not in the pack" % index)
+
+        offset = OFFSET.unpack_from(self.__map, HEADER.size + OFFSET.size * index)[0]
+        return read_level(self.__map, offset)
+
+
+def main():
+    """This function parses the command line and generates or describes a level pack. Takes no parameters and
+    returns nothing."""
+
+    parser = argparse.ArgumentParser(description="Generate or describe super break-out level packs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    generate_parser = commands.add_parser("generate", help="write a pack of the classic level and random levels")
+    generate_parser.add_argument("path")
+    generate_parser.add_argument("--count", type=int, default=100, help="number of levels")
+    generate_parser.add_argument("--seed", type=int, default=None, help="seed for the random levels")
+    info_parser = commands.add_parser("info", help="list the levels of a pack")
+    info_parser.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        rng = random.Random(args.seed)
+        write_pack(args.path, [CLASSIC] + [random_level(rng) for index in range(args.count - 1)])
+        print("wrote %d levels to %s" % (args.count, args.path))
+    else:
+        pack = LevelPack(args.path)
+        print("%d levels" % pack.get_count())
+        for index in range(min(pack.get_count(), 20)):
+            level = pack.get_level(index)
+            print("%5d: %2dx%-2d phases at %d and %d, won at %d" % ((index,) + level.get_size()
+                  + level.get_phase_scores() + (level.get_win_score(),)))
+
+
+if __name__ == "__main__":
+    main()
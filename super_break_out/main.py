@@ -6,9 +6,24 @@ This recreation features a multiplayer mode, 4 difficulties, progressively incre
 """
 
 # Initalizes and imports dependencies.
+import argparse
+import math
+import os
+import random
+import time
 import pygame
+import assets
 import game_sprites
-import time
+import simulation
+import scheduler
+import soundbank
+import music_controller
+import replay
+import levels
+import profiler
+import netplay
+import autopilot
+import render_backend
 pygame.init()
 pygame.mixer.init()
 screen = pygame.display.set_mode((960, 720))
@@ -17,17 +32,113 @@ screen = pygame.display.set_mode((960, 720))
 class main():
     """This is the mainline logic."""
 
-    def __init__(self):
-        """Initalizes the IDEA/ALTER logic."""
+    def __init__(self, render_mode="flip", dirty_threshold=0.5, fps=30, max_catch_up=5, record_dir=None,
+                 start=True, profile=None, profile_frames=600, profile_overlay=False, sound_stats=False,
+                 music_fade=500, level_pack=None, level=0, mode="single", netplay_options=None, autopilot_players=(),
+                 attract_delay=20000, renderer_driver=None, cache_stats=False):
+        """Initalizes the IDEA/ALTER logic. Takes these parameters, in order:
+
+        render_mode: "flip" to redraw the whole display every frame, "dirty" to only push the changed rectangles,
+            or "texture" to draw with an SDL2 renderer, as a string.
+        dirty_threshold: the fraction of the display that may change before the dirty mode flips the whole display
+            anyway, as a float.
+        fps: the render frame rate as an integer.
+        max_catch_up: the most physics steps to run in one frame as an integer.
+        record_dir: an optional directory to save a replay of every finished game to.
+        start: whether to start the game loop right away, or leave the game to be driven one frame at a time.
+        profile: an optional path to save the frame profile to.
+        profile_frames: the number of frames the profile keeps as an integer.
+        profile_overlay: whether to show the frame time overlay. The profiler is only on when a profile path is
+            given or the overlay is shown.
+        sound_stats: whether to print the sound bank's channel use and music transitions on exit.
+        music_fade: how long the background music crossfades for in milliseconds as an integer.
+        level_pack: an optional level pack path. A won level moves on to the next one.
+        level: the index of the level pack's first level to play as an integer.
+        mode: the game mode as one of Simulation.MODES.
+        netplay_options: an optional tuple of the local player as 0 or 1, the local UDP port, the peer's address,
+            and the seed both peers share, which turns on netplay.
+        autopilot_players: the players whose platforms the autopilot plays as a tuple of 0 for player 1 and 1
+            for player 2.
+        attract_delay: how long the menu waits without a key press before the autopilot plays an attract demo in
+            milliseconds, which is never when it is 0.
+        renderer_driver: the SDL render driver the texture mode uses, such as "software", which picks the best
+            driver when it is None.
+        cache_stats: whether to print the asset and text cache counters on exit.
+
+        Returns nothing."""
 
         # Initializes the display background
         pygame.display.set_caption("Super Break Out")
+        
+        # Initializes the rendering options.
+        self.__render_mode = render_mode
+        self.__dirty_threshold = dirty_threshold * screen.get_width() * screen.get_height()
+        
+        # Initializes the render backend that the flip and texture modes draw with.
+        if render_mode == "texture":
+            self.__backend = render_backend.TextureBackend("Super Break Out", screen.get_size(),\
+                                                           simulation.Simulation.BOUNDS.size, renderer_driver)
+        else:
+            self.__backend = render_backend.SoftwareBackend(screen)
+        
+        # Initializes the frame rate options. Physics always steps at the simulation tick rate.
+        self.__fps = fps
+        self.__max_catch_up = max_catch_up
+        self.__step_time = 1000 / simulation.Simulation.TICK_RATE
+        
+        # Initializes the scheduler once; each reset cancels whatever the last game left scheduled.
+        self.__scheduler = scheduler.Scheduler()
+        
+        # Initializes the level pack, which plays the classic level when there is none.
+        self.__level_pack = levels.LevelPack(level_pack) if level_pack else None
+        self.__level_index = level
+        
+        # Initializes the game mode, which picks how many balls are served and held in the wall.
+        self.__mode = mode
+        
+        # Initializes the netplay session, where the local paddle uses the arrow keys and the other paddle is
+        # played by the peer.
+        self.__netplay = None
+        if netplay_options:
+            self.__netplay = netplay.RollbackSession(*netplay_options)
+        
+        # Initializes the autopilots of both platforms, the platforms they play, and the attract demo delay.
+        self.__pilots = (autopilot.Autopilot(0), autopilot.Autopilot(1))
+        self.__autopilot_players = autopilot_players
+        self.__attract_delay = attract_delay
+        
+        # Initializes the replay recording options.
+        self.__record_dir = record_dir
+        self.__recorder = None
+        
+        # Initializes the frame profiler.
+        self.__profile_path = profile
+        self.__profile_overlay = profile_overlay
+        self.__profiler = None
+        if profile or profile_overlay:
+            self.__profiler = profiler.FrameProfiler(profile_frames)
+        
+        # Initializes the sound bank once so its channel groups and counts last across resets.
+        self.__sound_bank = soundbank.SoundBank()
+        self.__sound_stats = sound_stats
+        self.__cache_stats = cache_stats
+        
+        # Initializes the music controller.
+        self.__music = music_controller.MusicController(self.__sound_bank.get_reserved(), music_fade)
 
         # Initializes the entities.
         self.entities()
+        
+        # Starts decoding the game music, which is known ahead of time, once the menu music is playing.
+        for music_file in ("music/phase_one_music.mp3", "music/phase_two_music.mp3", "music/phase_three_music.mp3",\
+                           "music/menu_music.mp3"):
+            self.__music.preload(music_file)
 
         # Displays the menu.
-        self.alter()
+        if start:
+            self.alter()
+        else:
+            self.assign()
 
     def entities(self):
         """This method initializes the entities. Takes no parameters and returns nothing."""
@@ -37,11 +148,11 @@ class main():
         self.__background = self.__background.convert()
         self.__background.fill((73, 13, 97))
         screen.blit(self.__background, (0, 0))
+        self.__backend.set_background(self.__background)
+        self.__repaint = True
         
         # Initalizes the background music.
-        pygame.mixer.music.load("music/menu_music.mp3")
-        pygame.mixer.music.set_volume(0.5)
-        pygame.mixer.music.play(-1)
+        self.__music.play("music/menu_music.mp3", 0)
         
         # Initalizes the sfxs.
         self.sfx_entities()
@@ -70,18 +181,60 @@ class main():
         # The game loop.
         while self.__keep_going:
 
-            # Initializes the FPS.
-            self.__clock.tick(30)
-
-            # Checks and handles events.
-            self.events()
+            # Initializes the FPS and runs one frame.
+            self.frame(self.__clock.tick(self.__fps))
 
-            # Updates and refresh the display.
-            self.refresh()
+        # Saves the frame profile.
+        if self.__profile_path:
+            self.__profiler.dump(self.__profile_path)
+        
+        # Prints the sound bank's channel use.
+        if self.__sound_stats:
+            print("Sound bank: " + str(self.__sound_bank.get_stats()))
+            for transition in self.__music.get_transitions():
+                print("Music: " + str(transition))
+        
+        # Prints how often the asset and text caches were hit.
+        if self.__cache_stats:
+            print("Assets: " + str(assets.registry.get_stats()))
+            print("Text cache: " + str(assets.registry.get_text_stats()))
+        
+        # Prints the netplay round trip, rollback, and desync metrics.
+        if self.__netplay:
+            print("Netplay: " + str(self.__netplay.get_metrics()))
+            self.__netplay.close()
 
         # Quits the game.
         pygame.quit()
         
+    def frame(self, frame_time):
+        """This method runs one frame of the game loop. Takes the milliseconds since the last frame as a
+        number and returns nothing."""
+        
+        # Starts timing the frame when profiling.
+        profiler = self.__profiler
+        if profiler:
+            profiler.begin_frame(self.__display_state)
+        
+        # Runs the scheduled actions that are due.
+        self.__frame_time = frame_time
+        self.__scheduler.tick(frame_time)
+
+        # Checks and handles events.
+        self.events()
+        if profiler:
+            profiler.mark("events")
+        
+        # Keeps answering the netplay peer after the game ends, since it may still need the last inputs to
+        # confirm the game over.
+        if self.__netplay and self.__display_state == 4:
+            self.__netplay.update()
+
+        # Updates and refresh the display.
+        self.refresh()
+        if profiler:
+            profiler.end_frame()
+        
     def assign(self):
         """This method assigns the instance variables used in the game loop. Takes no
         parameters and returns nothing."""
@@ -89,6 +242,8 @@ class main():
         # Initializes the game loop variables.
         self.__keep_going = True
         self.__clock = pygame.time.Clock()
+        self.__frame_time = 0
+        self.__accumulator = 0
         self.__display_state = 0
         self.__last_display_state = 0
         
@@ -104,8 +259,10 @@ class main():
         self.__selected_difficulty = None
         self.__selected_players = None
         
-        # Initializes the game display variables.
-        self.__phase = 1
+        # Schedules the attract demo, which each key press on the menu puts off.
+        self.__demo = False
+        self.__attract_ticket = 0
+        self.schedule_demo()
         
         # Hides cursor.
         pygame.mouse.set_visible(not self.__keep_going)
@@ -117,9 +274,18 @@ class main():
         for event in pygame.event.get():
             
             # Checks for quit events.
-            if event.type == pygame.QUIT:
+            if event.type in (pygame.QUIT, pygame.WINDOWCLOSE):
                 self.__keep_going = False
             
+            # Checks for the profiler hotkeys.
+            if event.type == pygame.KEYDOWN and self.__profiler:
+                self.profiler_events_handler(event)
+            
+            # Ends the attract demo on any key press.
+            if event.type == pygame.KEYDOWN and self.__demo:
+                self.reset()
+                continue
+            
             # Checks for key press events.
             if event.type == pygame.KEYDOWN:
                 if self.__display_state in (0, 1, 2, 4):
@@ -133,44 +299,149 @@ class main():
         """This method refreshes the display with the correct page. Takes no parameters and
         returns nothing."""
         
-        # Clear previous screens if needed.
-        if self.__last_display_state != self.__display_state:
-            self.all_sprite_groups[self.__display_state - 1].clear(screen, self.__background)
-            self.__last_display_state = self.__display_state           
+        # Only pushes the changed rectangles in dirty mode.
+        if self.__render_mode == "dirty":
+            self.refresh_dirty()
+            return
         
-        # Clear, update, and draw sprites.
-        self.all_sprite_groups[self.__display_state].clear(screen, self.__background)
-        self.all_sprite_groups[self.__display_state].update()
-        self.all_sprite_groups[self.__display_state].draw(screen)
+        # Update and draw sprites. The backend erases whatever it drew last frame, even on another page.
+        sprites = self.all_sprite_groups[self.__display_state]
+        sprites.update()
+        if self.__profiler:
+            self.__profiler.mark("update")
+        self.interpolate_positions()
+        self.__backend.draw(sprites)
+        self.restore_positions()
         
         # Updates the text features on game options
         if self.__display_state == 1:
             self.update_option_text()
+        
+        # Draws the frame time overlay.
+        if self.__profiler:
+            if self.__profile_overlay:
+                self.__backend.draw_overlay(self.__profiler, self.__display_state)
+            self.__profiler.mark("draw")
 
-        # Flips the display.
-        pygame.display.flip()
+        # Shows the frame.
+        self.__backend.present()
+        if self.__profiler:
+            self.__profiler.mark("display")
         
         # Sets the mouse to be visible when program ends.
         pygame.mouse.set_visible(not self.__keep_going)
         
+    def refresh_dirty(self):
+        """This helper method refreshes the display by redrawing only the sprites that changed and pushing
+        only their rectangles to the display. Takes no parameters and returns nothing."""
+        
+        sprites = self.all_sprite_groups[self.__display_state]
+        
+        # Repaints the whole page when it is new.
+        repaint = self.__repaint or self.__last_display_state != self.__display_state
+        if repaint:
+            sprites.repaint_rect(screen.get_rect())
+            self.__last_display_state = self.__display_state
+            self.__repaint = False
+        
+        # Update and draw the changed sprites over the background.
+        sprites.update()
+        if self.__profiler:
+            self.__profiler.mark("update")
+        self.interpolate_positions()
+        changed = sprites.draw(screen, self.__background)
+        self.restore_positions()
+        
+        # Updates the text features on game options
+        if self.__display_state == 1:
+            self.update_option_text()
+        
+        # Draws the frame time overlay and adds it to the changed rectangles.
+        if self.__profiler:
+            overlay = self.draw_profile_overlay(repaint)
+            if overlay:
+                changed.append(overlay)
+            self.__profiler.mark("draw")
+        
+        # Flips the whole display if too much has changed, otherwise updates the changed rectangles.
+        if sum(rect.width * rect.height for rect in changed) > self.__dirty_threshold:
+            pygame.display.flip()
+        elif changed:
+            pygame.display.update(changed)
+        if self.__profiler:
+            self.__profiler.mark("display")
+        
+        # Sets the mouse to be visible when program ends.
+        pygame.mouse.set_visible(not self.__keep_going)
+        
+    def snapshot_positions(self):
+        """This helper method remembers the positions of the moving sprites before a physics step.
+        Takes no parameters and returns nothing."""
+        
+        self.__previous_positions = [sprite.rect.center for sprite in self.__moving_sprites]
+        
+    def interpolate_positions(self):
+        """This helper method moves the moving sprites to where they are between the last two physics
+        steps for drawing. Does nothing outside the game. Takes no parameters and returns nothing."""
+        
+        self.__physics_positions = None
+        if self.__display_state != 3:
+            return
+        
+        # Blends the previous and current positions by how far into the next step the frame is.
+        alpha = self.__accumulator / self.__step_time
+        self.__physics_positions = []
+        for sprite, previous in zip(self.__moving_sprites, self.__previous_positions):
+            current = sprite.rect.center
+            self.__physics_positions.append(current)
+            if current != previous:
+                sprite.rect.center = (round(previous[0] + (current[0] - previous[0]) * alpha),\
+                                      round(previous[1] + (current[1] - previous[1]) * alpha))
+                sprite.dirty = 1
+        
+    def restore_positions(self):
+        """This helper method puts the moving sprites back at their physics positions after drawing.
+        Takes no parameters and returns nothing."""
+        
+        if self.__physics_positions is not None:
+            for sprite, current in zip(self.__moving_sprites, self.__physics_positions):
+                sprite.rect.center = current
+        
+    def sprite_group(self):
+        """This helper method creates a sprite group for the current render mode. Takes no parameters and
+        returns a LayeredDirty group in dirty mode or a plain group otherwise."""
+        
+        if self.__render_mode == "dirty":
+            # Keeps the group in dirty rectangle mode since the threshold is handled by refresh_dirty.
+            return pygame.sprite.LayeredDirty(_use_update=True, _time_threshold=float("inf"))
+        
+        return pygame.sprite.Group()
+        
     def sfx_entities(self):
         """This helper method initializes the sound effect entites and assigns each an
         instance variable.Takes no parameters and returns nothing."""
         
-        self.__select_opt_sfx = pygame.mixer.Sound("sounds/select.mp3")
-        self.__intro_sfx = pygame.mixer.Sound("sounds/intro.mp3")
-        self.__bounce_sfx = pygame.mixer.Sound("sounds/bounce.mp3")
-        self.__brick_break_sfx = pygame.mixer.Sound("sounds/brick_break.mp3")
-        self.__transition_sfx = pygame.mixer.Sound("sounds/transition.mp3")
-        self.__damage_sfx = pygame.mixer.Sound("sounds/damage.mp3")
-        self.__lose_sfx = pygame.mixer.Sound("sounds/lose.mp3")
-        self.__win_sfx = pygame.mixer.Sound("sounds/win.mp3")
+        self.__select_opt_sfx = assets.registry.get_sound("sounds/select.mp3")
+        self.__intro_sfx = assets.registry.get_sound("sounds/intro.mp3")
+        self.__bounce_sfx = assets.registry.get_sound("sounds/bounce.mp3")
+        self.__brick_break_sfx = assets.registry.get_sound("sounds/brick_break.mp3")
+        self.__transition_sfx = assets.registry.get_sound("sounds/transition.mp3")
+        self.__damage_sfx = assets.registry.get_sound("sounds/damage.mp3")
+        self.__lose_sfx = assets.registry.get_sound("sounds/lose.mp3")
+        self.__win_sfx = assets.registry.get_sound("sounds/win.mp3")
+        
+        # Registers the sfxs in the sound bank. Collision sounds get more voices and merge repeated hits.
+        self.__sound_bank.register(self.__select_opt_sfx, "ui")
+        self.__sound_bank.register(self.__bounce_sfx, "impact", 2, 50)
+        self.__sound_bank.register(self.__brick_break_sfx, "impact", 2, 50)
+        for sound in (self.__intro_sfx, self.__transition_sfx, self.__damage_sfx, self.__lose_sfx, self.__win_sfx):
+            self.__sound_bank.register(sound, "stinger")
 
     def menu_entities(self):
         """This helper method initializes the menu sprites into a group. Takes no parameters
         and returns nothing."""
         
-        self.__menu_sprites = pygame.sprite.Group()
+        self.__menu_sprites = self.sprite_group()
         
         # Initalizes the title label.
         self.__menu_sprites.add(game_sprites.Label("SUPER BREAK OUT", 50, (400, 250)))
@@ -186,7 +457,7 @@ class main():
         """This helper method initializes the game option sprites into a group. Takes no
         parameters and returns nothing."""
         
-        self.__game_opt_sprites = pygame.sprite.Group()
+        self.__game_opt_sprites = self.sprite_group()
         
         # Initalize the title label.
         self.__opt_title = game_sprites.Label("Game Options", 40, (400, 75))
@@ -218,7 +489,7 @@ class main():
         """This helper method initializes the game instructions sprites into a group. Takes no
         parameters and returns nothing."""
         
-        self.__game_instr_sprites = pygame.sprite.Group()
+        self.__game_instr_sprites = self.sprite_group()
         
         self.__game_instr_sprites.add(game_sprites.Label("Welcome to Super Break Out!", 20, (400, 100)),
                                     game_sprites.Label("Your goal is to destroy all of the bricks", 15, (400, 175)),
@@ -235,45 +506,43 @@ class main():
         """This helper method initializes the game sprites into a group. Takes no parameters and
         returns nothing."""
         
-        # Initalize game entity sprite groups.
-        self.__game_sprites = pygame.sprite.Group()
-        self.__game_bricks = pygame.sprite.Group()
-        self.__game_players = pygame.sprite.Group()
-        self.__game_loss_zone = game_sprites.Loss_zone()
+        # Initalizes the game simulation which owns the game entities, seeded so the game can be replayed.
+        self.__seed = random.getrandbits(64)
+        level = self.__level_pack.get_level(self.__level_index) if self.__level_pack else None
+        self.__simulation = simulation.Simulation(seed=self.__seed, level=level, mode=self.__mode)
+        self.__hud = self.__simulation.get_hud()
         
-        # Initalizes the game HUD.
-        self.__hud = game_sprites.Hud()
+        # Initalizes the sprites whose drawn positions are interpolated between physics steps.
+        self.moving_entities()
         
-        # Initalizes the game bricks.
-        for row in range(6):
-            for col in range(18):
-                pos_x = (col * (40 + 5)) + 40 // 2
-                pos_y = (row * (24 + 5)) + 34 // 2
-                
-                brick = game_sprites.Brick((pos_x, pos_y), row)
-                
-                self.__game_bricks.add(brick)
-                      
-        # Initalizes the players
-        self.__game_player1 = game_sprites.Platform((200, 580))
-        self.__game_player2 = game_sprites.Platform((600, 560))
-        self.__game_players.add(self.__game_player1, self.__game_player2)
-        
-        # Initalizes the ball.
-        self.__game_ball = game_sprites.Ball()
+        # Initalizes the countdown label shown while the game is frozen and the label of the attract demo.
+        self.__freeze_text = game_sprites.Label("", 40, (400, 470))
+        self.__demo_text = game_sprites.Label("", 15, (400, 520))
         
         # Adds game sprites everything into the game sprites group.
-        self.__game_sprites.add(self.__game_bricks,\
-                                self.__game_players,\
-                                self.__game_ball,\
-                                self.__game_loss_zone,\
-                                self.__hud)
+        self.__game_sprites = self.sprite_group()
+        self.__game_sprites.add(self.__simulation.get_bricks().get_layer(),\
+                                self.__simulation.get_players(),\
+                                self.__simulation.get_balls(),\
+                                self.__simulation.get_loss_zone(),\
+                                self.__hud,\
+                                self.__freeze_text,\
+                                self.__demo_text)
+        
+    def moving_entities(self):
+        """This helper method gathers the sprites whose drawn positions are interpolated between physics
+        steps, which are the game's balls and platforms, and remembers where they are. Takes no parameters
+        and returns nothing."""
+        
+        self.__moving_sprites = tuple(self.__simulation.get_balls()) +\
+                                (self.__simulation.get_player1(), self.__simulation.get_player2())
+        self.snapshot_positions()
         
     def game_over_entities(self):
         """This helper method initalizes the game over sprites. Takes no parameters and returns
         nothing."""
         
-        self.game_over_sprites = pygame.sprite.Group()
+        self.game_over_sprites = self.sprite_group()
         
         self.__result_text = game_sprites.Label("", 80, (400, 175))
         self.__score_text = game_sprites.Label("", 40, (400, 300))
@@ -291,10 +560,47 @@ class main():
         """This helper method handles the events for menu. Takes the event as a list parameter
         and returns nothing."""
             
+        # Puts off the attract demo.
+        self.schedule_demo()
+        
         # Switch to game options screen on SPACE key press.
         if event.key == pygame.K_SPACE:
             self.__display_state = 1
     
+    def schedule_demo(self):
+        """This method schedules the attract demo to start once the menu has waited the attract delay, which
+        cancels the demo scheduled before. Takes no parameters and returns nothing."""
+        
+        # Netplay games are only started by the players.
+        if not self.__attract_delay or self.__netplay:
+            return
+        
+        # Only the latest ticket starts the demo.
+        self.__attract_ticket += 1
+        ticket = self.__attract_ticket
+        self.__scheduler.call_later(self.__attract_delay, lambda: self.start_demo(ticket))
+        
+    def start_demo(self, ticket):
+        """This method starts the attract demo, where the autopilot plays both platforms of an easy game
+        until a key is pressed or the game ends. Takes the ticket of the demo as an integer, which only
+        starts it if no other demo was scheduled since and the menu is still shown. Returns nothing."""
+        
+        if ticket != self.__attract_ticket or self.__display_state != 0:
+            return
+        
+        # Repaints the background over the menu, which is not the page before the game.
+        screen.blit(self.__background, (0, 0))
+        self.__repaint = True
+        
+        # Starts a two player game on easy.
+        self.__demo = True
+        self.__selected_players = 1
+        self.__selected_difficulty = 3
+        self.__display_state = 3
+        self.change_background_music("music/phase_one_music.mp3")
+        self.update_game()
+        self.__demo_text.set_text("DEMO - Press any key")
+    
     def game_opt_events_handler(self, event):
         """This helper method handles the events for game options. Takes the event as a list
         parameter and returns nothing."""
@@ -315,18 +621,18 @@ class main():
         if event.key == pygame.K_s:
             if self.__highlighted_option == 0 or self.__highlighted_option == 1:
                 self.__selected_players = self.__highlighted_option
-                self.__select_opt_sfx.play()
+                self.play_sfx(self.__select_opt_sfx)
             elif self.__highlighted_option > 1 or self.__highlighted_option < 6:
                 self.__selected_difficulty = self.__highlighted_option
-                self.__select_opt_sfx.play()
+                self.play_sfx(self.__select_opt_sfx)
 
         # Switch to game instructions screen on SPACE key press.
         # Validates if the user has selected options.
         if event.key == pygame.K_SPACE:
             if (self.__selected_players is not None) and (self.__selected_difficulty is not None):
                 self.__display_state = 2
-                pygame.mixer.music.stop()
-                self.__intro_sfx.play()
+                self.__music.stop(0)
+                self.play_sfx(self.__intro_sfx)
         
     def game_instr_events_handler(self, event):
         """This helper method handles the events for game instructions. Takes the event as a list
@@ -344,112 +650,105 @@ class main():
         """This helper method handles the events for the game. Takes no parameters and returns
         nothing."""
  
-         # Left/Right movement for player 1.
+        # Left/Right movement for player 1.
         keyboard_keys = pygame.key.get_pressed()
-        if keyboard_keys[pygame.K_LEFT]:
-            self.__game_player1.move("left")
-        if keyboard_keys[pygame.K_RIGHT]:
-            self.__game_player1.move("right")
-        
-        # Checks if player 2 exists.
-        if self.__selected_players == 1:
-            # Left/Right movement for player 2.
+        inputs = [keyboard_keys[pygame.K_LEFT], keyboard_keys[pygame.K_RIGHT], False, False]
+        
+        # Left/Right movement for player 2 if player 2 exists and plays on this machine.
+        if self.__selected_players == 1 and not self.__netplay:
             mouse_keys = pygame.mouse.get_pressed()
-            if mouse_keys[0]:
-                self.__game_player2.move("left")
-            if mouse_keys[2]:
-                self.__game_player2.move("right")
-            
-        # Increase difficulty after player reaches halfway score.
-        if (self.__hud.get_score() >= 189) and (self.__phase == 2):
-            
-            # Increases to next phase.
-            self.__phase = 3
-            
-            # Play transition sounds and swap background music.
-            self.freeze_and_sfx(self.__transition_sfx, self.__transition_sfx.get_length(), False)
-            self.change_background_music("music/phase_three_music.mp3")
-            
-            # Adjustments to game entities.
-            self.__game_player1.third_phase()
-            if self.__selected_players == 1:
-                self.__game_player2.third_phase()
-            self.__game_ball.increase_speed(2)
-            for brick in self.__game_bricks:
-                brick.set_downshift_val(8)
-        
-        # Increases difficulty after player reaches phase 1.
-        if (self.__hud.get_score() >= 80) and (self.__phase == 1):
-            
-            # Increases to next phase.
-            self.__phase += 1
-            
-            # Phase transition sounds.
-            self.freeze_and_sfx(self.__transition_sfx, self.__transition_sfx.get_length(), False)
-            self.change_background_music("music/phase_two_music.mp3")
+            inputs[2] = mouse_keys[0]
+            inputs[3] = mouse_keys[2]
+        
+        # Lets the autopilot play its platforms, or both platforms in the attract demo.
+        for player in ((0, 1) if self.__demo else self.__autopilot_players):
+            inputs[2 * player:2 * player + 2] = self.__pilots[player].get_inputs(self.__simulation)
+        
+        # Holds the game logic still and shows a countdown while the game is frozen.
+        if self.__scheduler.is_frozen():
+            if self.__netplay:
+                self.__netplay.update()
+                self.game_events(self.__netplay.pop_events())
+                if self.__display_state != 3:
+                    return
+            self.__freeze_text.set_text(str(math.ceil(self.__scheduler.get_remaining() / 1000)))
+            self.__accumulator = 0
+            self.snapshot_positions()
+            return
+        self.__freeze_text.set_text("")
+        
+        # Steps the game rules at the fixed tick rate for the time that has passed.
+        self.__accumulator += self.__frame_time
+        steps = 0
+        while self.__accumulator >= self.__step_time and steps < self.__max_catch_up:
+            self.__accumulator -= self.__step_time
+            steps += 1
+            self.game_step(tuple(inputs))
             
-            # Adjustments to game entities.
-            self.__game_ball.increase_speed(1)
-            for brick in self.__game_bricks:
-                brick.set_downshift_val(4)
-
-        # Checks if end condition is present.
-        if self.__hud.check_game_over():
-            pygame.mixer.music.stop()
-            self.update_game_over()
-            self.__display_state = 4
-
-        # Checks for collisions with other game sprites.
-
-        # Player-ball collisions.
-        collided_platform = pygame.sprite.spritecollide(self.__game_ball, self.__game_players, False)
-        if collided_platform:
-
-            # Plays sfx.
-            self.__bounce_sfx.play()
-            
-            # Changes ball direction.
-            self.__game_ball.change_direction(collided_platform[0])
-
-            # Shifts all bricks down.
-            for bricks in self.__game_bricks:
-                bricks.move_down()
-                
-        # Ball-brick collisions.
-        broken_bricks = pygame.sprite.spritecollide(self.__game_ball, self.__game_bricks, False)
-        if broken_bricks:
-            
-            # Plays sfx.
-            self.__bounce_sfx.play()
-            self.__brick_break_sfx.play()
+            # Stops stepping once the game freezes or ends.
+            if self.__scheduler.is_frozen() or self.__display_state != 3:
+                self.__accumulator = 0
+                break
+        
+        # Drops the time that could not be caught up on so a slow frame cannot snowball.
+        if steps == self.__max_catch_up:
+            self.__accumulator %= self.__step_time
+        
+    def game_step(self, inputs):
+        """This helper method steps the game rules once and reacts to what happened during the step.
+        Takes the player inputs as a tuple of booleans and returns nothing."""
+        
+        # Remembers where the moving sprites were for render interpolation.
+        self.snapshot_positions()
+        
+        # Records the inputs for the replay.
+        if self.__recorder:
+            self.__recorder.record(inputs)
+        
+        # Steps the game rules, through the netplay session if there is one. Its events are the ones of the
+        # frames both peers have confirmed, which may be a few frames behind and are never rolled back.
+        if self.__netplay:
+            self.__netplay.tick(inputs[0], inputs[1])
+            events = self.__netplay.pop_events()
+        else:
+            events = self.__simulation.step(inputs)
+        self.game_events(events)
+    
+    def game_events(self, events):
+        """This helper method reacts to what happened in the game rules with sounds, freezes, music swaps, and
+        the game over screen. Takes the list of event names from Simulation.EVENTS and returns nothing."""
+        
+        for event in events:
             
-            # Removes brick and adds to score.
-            for brick in broken_bricks: 
-                brick.remove_brick(self.__hud)
+            # Phase transition sounds and background music swaps.
+            if event == "phase_two":
+                self.freeze_and_sfx(self.__transition_sfx, self.__transition_sfx.get_length(), False)
+                self.change_background_music("music/phase_two_music.mp3", self.__transition_sfx.get_length())
+            elif event == "phase_three":
+                self.freeze_and_sfx(self.__transition_sfx, self.__transition_sfx.get_length(), False)
+                self.change_background_music("music/phase_three_music.mp3", self.__transition_sfx.get_length())
             
-            # Reverse ball direction.
-            self.__game_ball.change_direction(broken_bricks[0])
-
-        # Loss zone-brick collisions.
-        if pygame.sprite.spritecollide(self.__game_loss_zone, self.__game_bricks, False):
+            # Checks if end condition is present, which goes back to the menu in the attract demo.
+            elif event == "game_over" and self.__demo:
+                self.reset()
+                return
+            elif event == "game_over":
+                self.save_replay()
+                self.__music.stop(0)
+                self.update_game_over()
+                self.__display_state = 4
             
-            # Removes all lifes.
-            self.__hud.remove_life(3)
-
-        # Ball-loss zone collisions.
-        if self.__game_ball.rect.colliderect(self.__game_loss_zone):
+            # Collision sounds.
+            elif event == "bounce" or event == "release":
+                self.play_sfx(self.__bounce_sfx)
+            elif event == "brick_break":
+                self.play_sfx(self.__bounce_sfx)
+                self.play_sfx(self.__brick_break_sfx)
             
-            # Checks if player has enough lives to keep playing.
-            if self.__hud.get_lives() > 1:
-                
-                # Plays sfx.
+            # Freezes the game after the player loses a life.
+            elif event == "damage":
                 self.freeze_and_sfx(self.__damage_sfx, 2, True)
-                
-                # Resets ball to center of display.
-                self.__game_ball.reset()
-                
-            # Removes a life.
-            self.__hud.remove_life(1)
+                self.snapshot_positions()
              
     def game_over_events_handler(self, event):
         """This helper method handles the events for game over. Takes the event as a list parameter
@@ -479,21 +778,49 @@ class main():
             self.__opt_selectables[self.__selected_difficulty].set_text_color((235, 207, 52))
     
     def reset(self):
-        """This method resets the program entities and variables. Takes no parameters and returns
-        nothing."""
+        """This method resets the program for a new game in place. The background, sfxs, labels, and
+        sprite groups are kept, and the game entities are restored by the simulation. Takes no
+        parameters and returns nothing."""
         
-        # Calls entities and assign again to reset them.
-        self.entities()
+        # Repaints the background.
+        screen.blit(self.__background, (0, 0))
+        self.__repaint = True
+        
+        # Restarts the menu music, which is decoded by now.
+        self.__music.play("music/menu_music.mp3", 0)
+        
+        # Starts a new game with a new seed, reviving the bricks and sprites of the last one.
+        self.__seed = random.getrandbits(64)
+        level = self.__level_pack.get_level(self.__level_index) if self.__level_pack else None
+        self.__simulation.reset(self.__seed, level, self.__mode)
+        self.__game_sprites.add(self.__simulation.get_players(), self.__simulation.get_balls())
+        self.__freeze_text.set_text("")
+        self.__demo_text.set_text("")
+        
+        # Gathers the moving sprites again, since the new game may have a different set of balls.
+        self.moving_entities()
+        
+        # Cancels the freezes, music changes, and demo the last game scheduled.
+        self.__scheduler.clear()
+        
+        # Calls assign again to reset the game loop variables.
         self.assign()
     
-    def change_background_music(self, music_file):
+    def change_background_music(self, music_file, delay=0):
         """This methed chages the background music and play new background music. Takes the new
-        background music as an object parameter and returns nothing."""
-        
-        pygame.mixer.music.stop()
-        pygame.mixer.music.load(music_file)
-        pygame.mixer.music.set_volume(0.5)
-        pygame.mixer.music.play(-1)
+        background music as an object parameter and an optional delay in seconds to wait before
+        swapping, and returns nothing."""
+        
+        # Schedules the swap for later without blocking the game loop.
+        if delay:
+            self.__scheduler.call_later(int(delay * 1000), lambda: self.change_background_music(music_file))
+            return
+        
+        # Crossfades to the new music, which is already decoded if it was preloaded.
+        start = time.perf_counter()
+        self.__music.play(music_file)
+        if self.__profiler:
+            self.__profiler.add("audio", time.perf_counter() - start)
             
     def freeze_and_sfx(self, sound, length, continue_playing):
         """This method freezes the game and plays a sound effect. Takes the sound effect to play,
@@ -502,30 +829,90 @@ class main():
         
         # Checks if background music will stop permanently.
         if continue_playing:
-            pygame.mixer.music.pause()
+            self.__music.pause()
         else:
-            pygame.mixer.music.stop()
+            self.__music.stop()
         
-        # Plays sfx and freezes program.
-        sound.play()
-        time.sleep(length)
+        # Plays sfx and freezes the game logic while the loop keeps running.
+        self.play_sfx(sound)
         
-        # Unpauses background music if necessary.
+        # Unpauses background music afterwards if necessary.
         if continue_playing:
-            pygame.mixer.music.unpause()
+            self.__scheduler.freeze(int(length * 1000), self.__music.unpause)
+        else:
+            self.__scheduler.freeze(int(length * 1000))
         
     def update_game(self):
         """This method updates the game entities with the player's selected option. Takes no
         parameters and returns nothing."""
         
-        # Checks how many players and sets difficulty of game.
-        if self.__selected_players == 0:
-            self.__game_player1.change_platform_size(self.__selected_difficulty)
-            self.__game_player1.set_platform_pos((400, 580))
-            self.__game_player2.remove_platform()
-        elif self.__selected_players == 1:
-            self.__game_player1.change_platform_size(self.__selected_difficulty)
-            self.__game_player2.change_platform_size(self.__selected_difficulty)
+        # Starts the netplay game, which is always two players and uses the seed both peers share.
+        if self.__netplay:
+            self.__selected_players = 1
+            self.__netplay.start(self.__simulation)
+            self.__seed = self.__netplay.get_seed()
+            self.__simulation.reset(self.__seed, self.__simulation.get_level(), self.__mode)
+            self.snapshot_positions()
+        
+        # Sets the number of players and difficulty of game.
+        self.__simulation.configure(self.__selected_difficulty, self.__selected_players)
+        
+        # Starts recording the game if replays are being saved. Netplay games are not recorded since their
+        # inputs are only final once the peer's inputs arrive, and neither are attract demos.
+        if self.__record_dir and not self.__netplay and not self.__demo:
+            self.__recorder = replay.ReplayRecorder(self.__seed, self.__selected_difficulty, self.__selected_players,
+                                                    level=self.__simulation.get_level(), mode=self.__mode)
+        
+    def save_replay(self):
+        """This method saves the replay of the game that just ended if replays are being recorded. Takes no
+        parameters and returns nothing."""
+        
+        if self.__recorder:
+            os.makedirs(self.__record_dir, exist_ok=True)
+            name = time.strftime("%Y%m%d_%H%M%S_") + "%016x" % self.__seed + replay.EXTENSION
+            self.__recorder.save(os.path.join(self.__record_dir, name), self.__hud.get_score(), self.__hud.get_win())
+            self.__recorder = None
+        
+    def play_sfx(self, sound):
+        """This method plays a sound effect through the sound bank, charging the time it takes to the audio
+        stage when profiling. Takes the sound effect as an object parameter and returns nothing."""
+        
+        start = time.perf_counter()
+        self.__sound_bank.play(sound)
+        if self.__profiler:
+            self.__profiler.add("audio", time.perf_counter() - start)
+        
+    def profiler_events_handler(self, event):
+        """This helper method handles the profiler hotkeys: [F3] shows or hides the frame time overlay and
+        [F12] saves the frame profile. Takes the event as a list parameter and returns nothing."""
+        
+        # Shows or hides the overlay.
+        if event.key == pygame.K_F3:
+            self.__profile_overlay = not self.__profile_overlay
+            if not self.__profile_overlay:
+                erased = self.__profiler.erase(screen, self.__background)
+                if erased:
+                    pygame.display.update(erased)
+        
+        # Saves the frame profile.
+        elif event.key == pygame.K_F12:
+            path = self.__profile_path or "profile.csv"
+            self.__profiler.dump(path)
+            print("Saved frame profile to " + path)
+        
+    def draw_profile_overlay(self, force):
+        """This helper method draws the frame time percentiles of the current page when the overlay is shown.
+        Takes whether to redraw it even if it is fresh as a boolean. Returns the changed Rect or None."""
+        
+        if not self.__profile_overlay:
+            return None
+        
+        return self.__profiler.draw(screen, self.__background, self.__display_state, force)
+        
+    def get_simulation(self):
+        """This method gets the game simulation. Takes no parameters and returns the simulation."""
+        
+        return self.__simulation
         
     def update_game_over(self):
         """This method updates the game over entities with the result of the user's last game.
@@ -533,14 +920,71 @@ class main():
         
         # Checks and updates result label for win or loss.
         if self.__hud.get_win():
-            self.__win_sfx.play()
+            self.play_sfx(self.__win_sfx)
             self.__result_text.set_text("YOU WIN!")
+            
+            # Moves on to the next level of the pack for the next game.
+            if self.__level_pack:
+                self.__level_index = (self.__level_index + 1) % self.__level_pack.get_count()
         else:
-            self.__lose_sfx.play()
+            self.play_sfx(self.__lose_sfx)
             self.__result_text.set_text("YOU LOST!")
         
         # Update score label with final score.
         self.__score_text.set_text("Final Score: " + str(self.__hud.get_score()))
 
 # Creates a game object.
-game = main()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Super Break Out")
+    parser.add_argument("--render", choices=("flip", "dirty", "texture"), default="flip",
+                        help="flip the whole display, only update the changed rectangles, or draw with SDL2 textures")
+    parser.add_argument("--renderer-driver", default=None,
+                        help="SDL render driver of the texture mode, such as software, opengl or opengles2")
+    parser.add_argument("--dirty-threshold", type=float, default=0.5,
+                        help="fraction of the display that may change before dirty mode flips anyway")
+    parser.add_argument("--fps", type=int, default=30, help="render frame rate")
+    parser.add_argument("--max-catch-up", type=int, default=5,
+                        help="most physics steps to run in one frame after a slow frame")
+    parser.add_argument("--record-dir", default=None, help="save a replay of every finished game here")
+    parser.add_argument("--profile", default=None,
+                        help="profile every frame and save the last frames here on exit or [F12] (.csv or .json)")
+    parser.add_argument("--profile-frames", type=int, default=600, help="number of frames the profile keeps")
+    parser.add_argument("--profile-overlay", action="store_true",
+                        help="show frame time percentiles on screen, toggled with [F3]")
+    parser.add_argument("--sound-stats", action="store_true",
+                        help="print the sound channel use and music transition times on exit")
+    parser.add_argument("--cache-stats", action="store_true",
+                        help="print the asset and text cache hit counts on exit")
+    parser.add_argument("--music-fade", type=int, default=500, help="background music crossfade in milliseconds")
+    parser.add_argument("--levels", default=None, help="play the levels of this level pack")
+    parser.add_argument("--level", type=int, default=0, help="index of the first level to play from the pack")
+    parser.add_argument("--mode", choices=simulation.Simulation.MODES, default="single",
+                        help="serve one or two balls, hold balls in the wall to free, or serve 256 balls")
+    parser.add_argument("--netplay", type=netplay.parse_address, default=None,
+                        help="play two players against this peer host:port over UDP")
+    parser.add_argument("--netplay-port", type=int, default=7000, help="local UDP port for netplay")
+    parser.add_argument("--netplay-player", type=int, choices=(1, 2), default=1,
+                        help="which paddle this machine plays in netplay")
+    parser.add_argument("--netplay-seed", type=int, default=0, help="seed both netplay peers share")
+    parser.add_argument("--autopilot", choices=("1", "2", "both"), default=None,
+                        help="let the autopilot play player 1, player 2, or both platforms")
+    parser.add_argument("--attract-delay", type=int, default=20000,
+                        help="milliseconds the menu waits before the autopilot plays a demo, or 0 for never")
+    args = parser.parse_args()
+    if args.autopilot and args.netplay:
+        parser.error("the autopilot cannot play a netplay game")
+    
+    # Collects the netplay options when a peer is given.
+    netplay_options = None
+    if args.netplay:
+        netplay_options = (args.netplay_player - 1, args.netplay_port, args.netplay, args.netplay_seed)
+    
+    # Collects the platforms the autopilot plays.
+    autopilot_players = {None: (), "1": (0,), "2": (1,), "both": (0, 1)}[args.autopilot]
+    
+    game = main(args.render, args.dirty_threshold, args.fps, args.max_catch_up, args.record_dir,
+                profile=args.profile, profile_frames=args.profile_frames, profile_overlay=args.profile_overlay,
+                sound_stats=args.sound_stats, music_fade=args.music_fade, level_pack=args.levels, level=args.level,
+                mode=args.mode, netplay_options=netplay_options, autopilot_players=autopilot_players,
+                attract_delay=args.attract_delay, renderer_driver=args.renderer_driver,
+                cache_stats=args.cache_stats)
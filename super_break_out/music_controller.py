@@ -0,0 +1,126 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the background music controller of the super break-out game. Tracks that are
+known ahead of time are decoded on a background thread and played on reserved mixer channels, so switching to
+them crossfades without loading anything in the frame loop. Other tracks stream from the music player.
+"""
+
+# Import and Initalize dependencies.
+import threading
+import time
+import pygame
+import assets
+
+
+class MusicController():
+    """This class defines a player of background music that preloads tracks and crossfades between them."""
+
+    # Initalizes the music volume as a constant class variable.
+    VOLUME = 0.5
+
+    def __init__(self, first_channel, fade_ms=500):
+        """Initalizes the two music channels and reserves them so sound effects cannot take them. Takes the
+        index of the first of the two channels to use and the default crossfade duration in milliseconds as
+        integers. Returns nothing."""
+
+        # Reserves the two channels the tracks crossfade between.
+        if pygame.mixer.get_num_channels() <= first_channel + 2:
+            pygame.mixer.set_num_channels(first_channel + 3)
+        pygame.mixer.set_reserved(first_channel + 2)
+        self.__channels = (pygame.mixer.Channel(first_channel), pygame.mixer.Channel(first_channel + 1))
+        for channel in self.__channels:
+            channel.set_volume(MusicController.VOLUME)
+
+        # Initalizes the channel of the current track, which is None when it streams from the music player.
+        self.__active = None
+        self.__fade_ms = fade_ms
+        self.__tracks = {}
+        self.__loading = {}
+        self.__transitions = []
+
+    def preload(self, path):
+        """This method starts decoding a track on a background thread so it is ready to play later. Takes the
+        track path as a string. Returns nothing."""
+
+        if path in self.__tracks or path in self.__loading:
+            return
+
+        self.__loading[path] = threading.Thread(target=self.__decode, args=(path,), daemon=True)
+        self.__loading[path].start()
+
+    def __decode(self, path):
+        """This helper method decodes a track. It runs on a background thread. Takes the track path as a string.
+        Returns nothing."""
+
+        self.__tracks[path] = assets.registry.get_sound(path)
+
+    def is_ready(self, path):
+        """This method checks if a track has been decoded. Takes the track path as a string. Returns a
+        boolean."""
+
+        return path in self.__tracks
+
+    def play(self, path, fade_ms=None):
+        """This method switches to a track, fading the current track out while the new one fades in. A track
+        that is not decoded yet streams from the music player instead, which cannot overlap another streamed
+        track. Takes the track path as a string and an optional fade duration in milliseconds as an integer.
+        Returns nothing."""
+
+        start = time.perf_counter()
+        fade_ms = self.__fade_ms if fade_ms is None else fade_ms
+        track = self.__tracks.get(path)
+        self.stop(fade_ms)
+
+        # Plays a decoded track on the channel that is not fading out.
+        if track is not None:
+            self.__active = 1 if self.__active == 0 else 0
+            self.__channels[self.__active].play(track, loops=-1, fade_ms=fade_ms)
+
+        # Streams the track.
+        else:
+            self.__active = None
+            assets.registry.load_music(path)
+            pygame.mixer.music.set_volume(MusicController.VOLUME)
+            pygame.mixer.music.play(-1, fade_ms=fade_ms)
+
+        self.__transitions.append({"track": path, "preloaded": track is not None, "fade_ms": fade_ms,
+                                   "ms": (time.perf_counter() - start) * 1000})
+
+    def stop(self, fade_ms=None):
+        """This method fades out the current track. Takes an optional fade duration in milliseconds as an
+        integer, where 0 stops it at once. Returns nothing."""
+
+        fade_ms = self.__fade_ms if fade_ms is None else fade_ms
+
+        # Fades out the channels and the music player.
+        for channel in self.__channels:
+            if fade_ms and channel.get_busy():
+                channel.fadeout(fade_ms)
+            else:
+                channel.stop()
+        if fade_ms and pygame.mixer.music.get_busy():
+            pygame.mixer.music.fadeout(fade_ms)
+        else:
+            pygame.mixer.music.stop()
+
+    def pause(self):
+        """This method pauses the current track. Takes no parameters and returns nothing."""
+
+        pygame.mixer.music.pause()
+        for channel in self.__channels:
+            channel.pause()
+
+    def unpause(self):
+        """This method resumes the current track after a pause. Takes no parameters and returns nothing."""
+
+        pygame.mixer.music.unpause()
+        for channel in self.__channels:
+            channel.unpause()
+
+    def get_transitions(self):
+        """This method gets a record of every track switch with the track, whether it was preloaded, the fade
+        duration, and how long the switch took the frame loop in milliseconds. Takes no parameters and returns
+        a list of dictionaries."""
+
+        return list(self.__transitions)
@@ -0,0 +1,524 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module runs two-player netplay for the super break-out game over UDP. Each peer steps the game
+every frame with its own paddle input right away and a prediction of the other peer's input, which repeats the
+last input received. When the real input of an earlier frame arrives and differs from the prediction, the game
+is rolled back to that frame and run forward again. The events of a frame, which the display reacts to, are
+only handed out once both inputs of the frame are known, so both peers see the same events exactly once even
+when a frame was run again. Every packet carries the recent inputs again so a lost packet
+costs nothing, and a hash of the game state at the last frame with both inputs known, so the peers can tell when
+their games no longer agree.
+
+Usage: python netplay.py loopback --frames 3000 --lag 3 --loss 0.1
+       python netplay.py peer --port 7001 --peer 127.0.0.1:7000 --player 2 --frames 3000
+"""
+
+# Selects the dummy SDL drivers before pygame is imported when run from the command line.
+import os
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import random
+import socket
+import struct
+import time
+import simulation
+
+# Initalizes the packet layout: magic, version, sender's player, game number, frame of the first input, frames
+# of the receiver's inputs the sender has, hash frame, state hash, send time, echoed send time, how long the echo
+# was held, and the number of inputs, followed by one byte per input.
+MAGIC = b"SBNP"
+VERSION = 1
+PACKET = struct.Struct("<4sBBBIIIIIIHB")
+
+# Initalizes the echo hold time that marks a packet with nothing to echo.
+NO_ECHO = 0xFFFF
+
+
+def parse_address(text):
+    """This function parses a peer address. Takes the address as a "host:port" string. Returns a tuple of the
+    host and the port as an integer."""
+
+    host, port = text.rsplit(":", 1)
+    return host or "127.0.0.1", int(port)
+
+
+def get_time():
+    """This function gets the clock packets are stamped with. Takes no parameters and returns the milliseconds
+    as a 32 bit integer."""
+
+    return int(time.perf_counter() * 1000) & 0xFFFFFFFF
+
+
+class RollbackSession():
+    """This class defines one peer of a netplay game with rollback."""
+
+    # Initalizes the most frames the game can run ahead of the other peer's inputs, which is also the most
+    # frames one tick re-runs, as a constant class variable.
+    MAX_ROLLBACK = 8
+
+    # Initalizes the most inputs one packet carries as a constant class variable.
+    MAX_INPUTS = 64
+
+    def __init__(self, player, port, peer, seed=0, link=None):
+        """Initalizes the session and binds its socket. Takes the local player as 0 for player 1 or 1 for
+        player 2, the local UDP port as an integer, the peer's address as a tuple of the host and port, the seed
+        both peers derive each game's seed from as an integer, and an optional object with the socket's
+        sendto and recvfrom methods to send through instead of a new socket. Returns nothing. Raises OSError if
+        the port cannot be bound."""
+
+        self.__player = player
+        self.__peer = peer
+        self.__seed = seed
+        self.__game = 0
+        self.__simulation = None
+
+        # Initalizes the non-blocking socket.
+        if link is None:
+            link = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            link.bind(("", port))
+            link.setblocking(False)
+        self.__link = link
+
+        # Initalizes the round trip time and the echo of the peer's last send time.
+        self.__rtt = None
+        self.__echo = None
+
+        # Initalizes the counters that last across games.
+        self.__metrics = {"rollbacks": 0, "resimulated_frames": 0, "max_rollback_frames": 0, "stalls": 0,
+                          "desyncs": 0, "first_desync_frame": None, "packets_sent": 0, "packets_received": 0,
+                          "packets_dropped": 0}
+
+    def start(self, game_simulation):
+        """This method starts a new game, which both peers must do with the same seed and options. Takes the
+        simulation to run, which is reset with get_seed before the first tick. Returns nothing."""
+
+        self.__simulation = game_simulation
+        self.__game = (self.__game + 1) & 0xFF
+
+        # Initalizes the frame to step next and the frames both inputs are known for.
+        self.__frame = 0
+        self.__confirmed = 0
+        self.__peer_has = 0
+        self.__rollback_to = None
+        self.__last_rollback = 0
+
+        # Initalizes the inputs and predictions by frame and the saved state before each unconfirmed frame.
+        self.__local_inputs = {}
+        self.__remote_inputs = {}
+        self.__predictions = {}
+        self.__states = {}
+
+        # Initalizes the events of each unconfirmed frame from its latest run, and the events of the confirmed
+        # frames not handed out yet.
+        self.__events = {}
+        self.__confirmed_events = []
+
+        # Initalizes the state hashes of confirmed frames, both this peer's and the other peer's.
+        self.__hashes = {}
+        self.__peer_hashes = {}
+        self.__hash_frame = 0
+        self.__hash = 0
+
+    def get_seed(self):
+        """This method gets the seed of the game being started, which both peers derive the same way. Takes no
+        parameters and returns an integer."""
+
+        return self.__seed * 256 + self.__game
+
+    def tick(self, left, right):
+        """This method runs one frame with the local paddle's input, first rolling the game back and running it
+        forward again if inputs received from the other peer differ from their predictions. The game waits
+        instead when it is too far ahead of the other peer. Takes whether the local left and right keys are held
+        as booleans. Returns the list of events of the new frame, which may still be rolled back, or None if the
+        game waited. The events to show are the ones from pop_events."""
+
+        self.receive()
+        self.__roll_back()
+
+        # Waits for the other peer rather than running further ahead than a rollback can undo.
+        if self.__frame - self.__confirmed >= RollbackSession.MAX_ROLLBACK:
+            self.__metrics["stalls"] += 1
+            self.__confirm()
+            self.send()
+            return None
+
+        # Runs the new frame.
+        self.__local_inputs[self.__frame] = bool(left) | bool(right) << 1
+        events = self.__step(self.__frame)
+        self.__frame += 1
+
+        self.__confirm()
+        self.send()
+
+        return events
+
+    def update(self):
+        """This method keeps the session going without running a new frame, such as while the game is frozen
+        or over: it reads the other peer's inputs, rolls back if they were mispredicted, and sends the local
+        inputs again. Takes no parameters and returns nothing."""
+
+        self.receive()
+        self.__roll_back()
+        self.__confirm()
+        self.send()
+
+    def __roll_back(self):
+        """This helper method rolls the game back to the first mispredicted frame and runs it forward again with
+        the inputs now known. Takes no parameters and returns nothing."""
+
+        self.__last_rollback = 0
+        if self.__rollback_to is None:
+            return
+
+        rollback = self.__frame - self.__rollback_to
+        self.__simulation.set_state(self.__states[self.__rollback_to])
+        for frame in range(self.__rollback_to, self.__frame):
+            self.__step(frame)
+        self.__rollback_to = None
+
+        # Counts the frames run again against the rollback budget.
+        self.__last_rollback = rollback
+        self.__metrics["rollbacks"] += 1
+        self.__metrics["resimulated_frames"] += rollback
+        self.__metrics["max_rollback_frames"] = max(self.__metrics["max_rollback_frames"], rollback)
+
+    def __step(self, frame):
+        """This helper method saves the state before a frame and steps the game with the local input and the
+        other peer's input, or its prediction if it has not arrived. Takes the frame as an integer. Returns
+        the list of events."""
+
+        self.__states[frame] = self.__simulation.get_state()
+        remote = self.__remote_inputs.get(frame)
+        if remote is None:
+            remote = self.__remote_inputs.get(self.__confirmed - 1, 0)
+            self.__predictions[frame] = remote
+
+        # Orders the inputs as player 1 then player 2, and keeps the events in place of the last run's.
+        local = self.__local_inputs[frame]
+        first, second = (local, remote) if self.__player == 0 else (remote, local)
+        events = self.__simulation.step((bool(first & 1), bool(first & 2), bool(second & 1), bool(second & 2)))
+        self.__events[frame] = events
+
+        return events
+
+    def __confirm(self):
+        """This helper method hashes the state after each newly confirmed frame, which has both inputs known,
+        checks it against the other peer's hash of the same frame, and forgets what no rollback can need any
+        more. Takes no parameters and returns nothing."""
+
+        confirmed = min(self.__confirmed, self.__frame)
+        for frame in range(self.__hash_frame + 1, confirmed + 1):
+            state = self.__states[frame] if frame < self.__frame else None
+            self.__hash_frame = frame
+            self.__hash = self.__simulation.get_state_hash(state)
+            self.__hashes[frame] = self.__hash
+            self.__check_hash(frame)
+
+        # Moves the events of the newly confirmed frames, which no rollback can change, to be handed out.
+        for frame in sorted(frame for frame in self.__events if frame < confirmed):
+            self.__confirmed_events += self.__events.pop(frame)
+
+        # Forgets the states, inputs, and hashes older than the confirmed frame.
+        for frame in [frame for frame in self.__states if frame < confirmed]:
+            del self.__states[frame]
+            self.__predictions.pop(frame, None)
+        oldest = min(confirmed, self.__peer_has) - 1
+        for inputs in (self.__local_inputs, self.__remote_inputs):
+            for frame in [frame for frame in inputs if frame < oldest]:
+                del inputs[frame]
+        for hashes in (self.__hashes, self.__peer_hashes):
+            for frame in [frame for frame in hashes if frame < confirmed - 4 * RollbackSession.MAX_ROLLBACK]:
+                del hashes[frame]
+
+    def __check_hash(self, frame):
+        """This helper method compares this peer's and the other peer's state hash of a frame once both are
+        known, counting a desync when they differ. Takes the frame as an integer. Returns nothing."""
+
+        if frame in self.__hashes and frame in self.__peer_hashes:
+            if self.__hashes.pop(frame) != self.__peer_hashes.pop(frame):
+                self.__metrics["desyncs"] += 1
+                if self.__metrics["first_desync_frame"] is None:
+                    self.__metrics["first_desync_frame"] = frame
+
+    def send(self):
+        """This method sends the local inputs the other peer does not have yet, with the latest state hash and
+        the timing used to measure the round trip. Takes no parameters and returns nothing."""
+
+        first = max(self.__peer_has, self.__frame - RollbackSession.MAX_INPUTS)
+        inputs = bytes(self.__local_inputs[frame] for frame in range(first, self.__frame))
+
+        # Echoes the other peer's last send time with how long it was held.
+        echo, hold = 0, NO_ECHO
+        if self.__echo:
+            echo = self.__echo[0]
+            hold = min((get_time() - self.__echo[1]) & 0xFFFFFFFF, NO_ECHO - 1)
+
+        packet = PACKET.pack(MAGIC, VERSION, self.__player, self.__game, first, self.__confirmed,
+                             self.__hash_frame, self.__hash, get_time(), echo, hold, len(inputs)) + inputs
+        try:
+            self.__link.sendto(packet, self.__peer)
+            self.__metrics["packets_sent"] += 1
+        except OSError:
+            self.__metrics["packets_dropped"] += 1
+
+    def receive(self):
+        """This method reads every packet waiting on the socket, storing the other peer's new inputs and noting
+        the first frame whose prediction was wrong. Takes no parameters and returns nothing."""
+
+        while True:
+            try:
+                packet, address = self.__link.recvfrom(PACKET.size + RollbackSession.MAX_INPUTS)
+            except (BlockingIOError, InterruptedError):
+                return
+            except OSError:
+                self.__metrics["packets_dropped"] += 1
+                continue
+
+            # Drops packets that are not from the other peer's side of this game.
+            if len(packet) < PACKET.size:
+                self.__metrics["packets_dropped"] += 1
+                continue
+            (magic, version, player, game, first, peer_has, hash_frame, state_hash, sent, echo, hold,
+             count) = PACKET.unpack_from(packet)
+            if (magic != MAGIC or version != VERSION or player == self.__player or game != self.__game
+                    or len(packet) != PACKET.size + count or self.__simulation is None):
+                self.__metrics["packets_dropped"] += 1
+                continue
+            self.__metrics["packets_received"] += 1
+
+            # Measures the round trip from the echo of this peer's send time.
+            now = get_time()
+            self.__echo = (sent, now)
+            if hold != NO_ECHO:
+                rtt = ((now - echo) & 0xFFFFFFFF) - hold
+                self.__rtt = rtt if self.__rtt is None else self.__rtt * 0.875 + rtt * 0.125
+
+            self.__peer_has = max(self.__peer_has, peer_has)
+            if hash_frame:
+                self.__peer_hashes[hash_frame] = state_hash
+                self.__check_hash(hash_frame)
+
+            # Stores the new inputs, rolling back to the first already run frame that was mispredicted.
+            for frame, bits in enumerate(packet[PACKET.size:], first):
+                if frame < self.__confirmed or frame in self.__remote_inputs:
+                    continue
+                self.__remote_inputs[frame] = bits
+                if frame < self.__frame and self.__predictions.pop(frame) != bits:
+                    if self.__rollback_to is None or frame < self.__rollback_to:
+                        self.__rollback_to = frame
+            while self.__confirmed in self.__remote_inputs:
+                self.__confirmed += 1
+
+    def pop_events(self):
+        """This method hands out the events of the frames confirmed since it was last called, in frame order.
+        Both peers get the same events, since they are from frames with both inputs known. Takes no parameters
+        and returns a list of event names from Simulation.EVENTS."""
+
+        events = self.__confirmed_events
+        self.__confirmed_events = []
+
+        return events
+
+    def get_frame(self):
+        """This method gets the number of frames run in the current game. Takes no parameters and returns an
+        integer."""
+
+        return self.__frame
+
+    def get_metrics(self):
+        """This method gets the session's metrics: the round trip time in milliseconds, the frames re-run by
+        the last tick and the most re-run by one tick against the rollback budget, the rollbacks, re-run frames,
+        waits, and desyncs so far, and the packets sent, received, and dropped. Takes no parameters and returns
+        a dictionary."""
+
+        metrics = dict(self.__metrics)
+        metrics.update({"frame": self.__frame if self.__simulation else 0, "rtt_ms": self.__rtt,
+                        "confirmed_frame": self.__confirmed if self.__simulation else 0,
+                        "rollback_frames": self.__last_rollback if self.__simulation else 0,
+                        "rollback_budget": RollbackSession.MAX_ROLLBACK})
+
+        return metrics
+
+    def close(self):
+        """This method closes the session's socket. Takes no parameters and returns nothing."""
+
+        self.__link.close()
+
+
+class LossyLink():
+    """This class defines a UDP socket that holds back and drops sent packets, to try netplay on one machine
+    with the lag and loss of a real network."""
+
+    def __init__(self, port, lag=0, loss=0.0, seed=None):
+        """Initalizes the link and binds its socket. Takes the local UDP port and the number of ticks to hold
+        each packet as integers, the fraction of packets to drop as a float, and an optional seed for the
+        drops. Returns nothing."""
+
+        self.__socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.__socket.bind(("127.0.0.1", port))
+        self.__socket.setblocking(False)
+        self.__lag = lag
+        self.__loss = loss
+        self.__rng = random.Random(seed)
+        self.__queue = []
+
+    def sendto(self, packet, address):
+        """This method queues a packet to be sent after the lag, unless it is dropped. Takes the packet as
+        bytes and the address as a tuple. Returns nothing."""
+
+        if self.__rng.random() >= self.__loss:
+            self.__queue.append([self.__lag, packet, address])
+
+    def get_port(self):
+        """This method gets the port the link is bound to. Takes no parameters and returns an integer."""
+
+        return self.__socket.getsockname()[1]
+
+    def recvfrom(self, size):
+        """This method receives a packet from the socket. Takes the largest packet size as an integer. Returns
+        a tuple of the packet and the sender's address."""
+
+        return self.__socket.recvfrom(size)
+
+    def advance(self):
+        """This method moves time on by one tick and sends the packets that are due. Takes no parameters and
+        returns nothing."""
+
+        queue = []
+        for item in self.__queue:
+            if item[0] <= 0:
+                self.__socket.sendto(item[1], item[2])
+            else:
+                item[0] -= 1
+                queue.append(item)
+        self.__queue = queue
+
+    def close(self):
+        """This method closes the link's socket. Takes no parameters and returns nothing."""
+
+        self.__socket.close()
+
+
+def random_inputs(rng):
+    """This function holds random paddle keys for a bot peer. Takes a random generator. Returns a tuple of the
+    left and right keys as booleans."""
+
+    return rng.random() < 0.5, rng.random() < 0.5
+
+
+def run_loopback(frames, lag, loss, seed, difficulty, mode):
+    """This function plays one netplay game between two bot peers in this process over localhost, then checks
+    both peers ended the same, and handed out the same events, as a game run offline with the inputs they agreed
+    on. Takes the number of frames, the ticks each packet is held and the fraction dropped, the seed, the
+    difficulty, and the mode. Returns a tuple of whether the games matched and both peers' metrics."""
+
+    links = [LossyLink(0, lag, loss, seed), LossyLink(0, lag, loss, None if seed is None else seed + 1)]
+    ports = [link.get_port() for link in links]
+    sessions = [RollbackSession(player, 0, ("127.0.0.1", ports[1 - player]), seed or 0, links[player])
+                for player in (0, 1)]
+    games = []
+    for session in sessions:
+        game = simulation.Simulation(mode=mode)
+        session.start(game)
+        game.reset(session.get_seed(), None, mode)
+        game.configure(difficulty, 1)
+        games.append(game)
+
+    # Ticks both peers until both have run every frame and know every input, recording the inputs used and the
+    # events handed out.
+    rngs = [random.Random(seed), random.Random(None if seed is None else seed + 2)]
+    played = [[], []]
+    events = [[], []]
+    while min(session.get_metrics()["confirmed_frame"] for session in sessions) < frames:
+        for player, session in enumerate(sessions):
+            if session.get_frame() < frames:
+                keys = random_inputs(rngs[player])
+                if session.tick(*keys) is not None:
+                    played[player].append(keys)
+            else:
+                session.update()
+            events[player] += session.pop_events()
+            links[player].advance()
+        time.sleep(0.0005)
+
+    # Replays the agreed inputs offline and compares every game's end and events.
+    offline = simulation.Simulation(mode=mode)
+    offline.reset(sessions[0].get_seed(), None, mode)
+    offline.configure(difficulty, 1)
+    offline_events = []
+    for frame in range(frames):
+        offline_events += offline.step(played[0][frame] + played[1][frame])
+    matched = games[0].get_state_hash() == games[1].get_state_hash() == offline.get_state_hash() and \
+              events[0] == events[1] == offline_events
+
+    for session in sessions:
+        session.close()
+
+    return matched, [session.get_metrics() for session in sessions]
+
+
+def run_peer(port, peer, player, frames, seed, difficulty, mode):
+    """This function plays one netplay game as a bot peer at the game's tick rate, for playing against the game
+    over the network. Takes the local port, the peer's address, the local player, the number of frames, the
+    seed, the difficulty, and the mode. Returns the session's metrics."""
+
+    session = RollbackSession(player, port, peer, seed)
+    game = simulation.Simulation(mode=mode)
+    session.start(game)
+    game.reset(session.get_seed(), None, mode)
+    game.configure(difficulty, 1)
+    rng = random.Random(seed)
+
+    # Ticks at the tick rate until the game ends or runs out of frames.
+    tick_time = 1 / simulation.Simulation.TICK_RATE
+    next_tick = time.perf_counter()
+    while session.get_frame() < frames and not game.is_game_over():
+        session.tick(*random_inputs(rng))
+        next_tick += tick_time
+        time.sleep(max(next_tick - time.perf_counter(), 0))
+    metrics = session.get_metrics()
+    session.close()
+
+    return metrics
+
+
+def main():
+    """This function parses the command line and runs a loopback test or a bot peer. Takes no parameters and
+    returns nothing."""
+
+    parser = argparse.ArgumentParser(description="Run super break-out netplay between bots.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    loopback_parser = commands.add_parser("loopback", help="play two bot peers against each other on localhost")
+    loopback_parser.add_argument("--lag", type=int, default=2, help="ticks each packet is held")
+    loopback_parser.add_argument("--loss", type=float, default=0.0, help="fraction of packets dropped")
+    peer_parser = commands.add_parser("peer", help="play as a bot peer against another machine")
+    peer_parser.add_argument("--port", type=int, default=7001, help="local UDP port")
+    peer_parser.add_argument("--peer", type=parse_address, default=("127.0.0.1", 7000), help="peer host:port")
+    peer_parser.add_argument("--player", type=int, choices=(1, 2), default=2, help="which paddle to play")
+    for command_parser in (loopback_parser, peer_parser):
+        command_parser.add_argument("--frames", type=int, default=3000, help="number of frames to play")
+        command_parser.add_argument("--seed", type=int, default=0, help="seed both peers share")
+        command_parser.add_argument("--difficulty", type=int, choices=(2, 3, 4, 5), default=2,
+                                    help="2 very easy, 3 easy, 4 medium, 5 hard")
+        command_parser.add_argument("--mode", choices=simulation.Simulation.MODES, default="single",
+                                    help="game mode")
+    args = parser.parse_args()
+
+    if args.command == "loopback":
+        matched, metrics = run_loopback(args.frames, args.lag, args.loss, args.seed, args.difficulty, args.mode)
+        for player, peer_metrics in enumerate(metrics):
+            print("player %d: %s" % (player + 1, peer_metrics))
+        print("result: %s" % ("match" if matched else "DESYNC"))
+        if not matched:
+            raise SystemExit(1)
+    else:
+        print(run_peer(args.port, args.peer, args.player - 1, args.frames, args.seed, args.difficulty, args.mode))
+
+
+if __name__ == "__main__":
+    main()
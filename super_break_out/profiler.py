@@ -0,0 +1,185 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the frame profiler for the super break-out game. It records how long each
+stage of each frame took into a fixed-size ring buffer, shows frame time percentiles on screen, and saves the
+buffer as CSV or JSON.
+"""
+
+# Import and Initalize dependencies.
+import array
+import csv
+import json
+import time
+import assets
+
+
+class FrameProfiler():
+    """This class defines a profiler of the stages of the game loop's frames."""
+
+    # Initalizes the stages of a frame and the recorded columns as constant class variables.
+    STAGES = ("events", "audio", "update", "draw", "display")
+    COLUMNS = ("frame", "state") + STAGES + ("total",)
+
+    # Initalizes the display state names as a constant class variable.
+    STATE_NAMES = ("menu", "options", "instructions", "game", "game over")
+
+    # Initalizes the overlay options as constant class variables.
+    OVERLAY_POSITION = (812, 8)
+    OVERLAY_SIZE = 10
+    OVERLAY_COLOR = (255, 255, 255)
+    OVERLAY_INTERVAL = 15
+
+    def __init__(self, capacity=600):
+        """Initalizes the ring buffer and the running frame. Takes the number of frames to keep as an integer.
+        Returns nothing."""
+
+        self.__capacity = capacity
+        self.__width = len(FrameProfiler.COLUMNS)
+        self.__buffer = array.array("d", bytes(8 * capacity * self.__width))
+        self.__frames = 0
+
+        # Initalizes the running frame.
+        self.__state = 0
+        self.__start = 0.0
+        self.__last = 0.0
+        self.__nested = 0.0
+        self.__stages = dict.fromkeys(FrameProfiler.STAGES, 0.0)
+
+        # Initalizes the overlay.
+        self.__overlay_rect = None
+        self.__overlay_age = FrameProfiler.OVERLAY_INTERVAL
+
+    def begin_frame(self, state):
+        """This method starts timing a frame. Takes the display state of the frame as an integer. Returns
+        nothing."""
+
+        self.__state = state
+        self.__start = self.__last = time.perf_counter()
+        self.__nested = 0.0
+        for stage in FrameProfiler.STAGES:
+            self.__stages[stage] = 0.0
+
+    def mark(self, stage):
+        """This method ends a stage of the running frame, charging it the time since the last mark less any
+        time added to other stages inside it. Takes the stage name as a string. Returns nothing."""
+
+        now = time.perf_counter()
+        self.__stages[stage] += now - self.__last - self.__nested
+        self.__last = now
+        self.__nested = 0.0
+
+    def add(self, stage, seconds):
+        """This method charges time spent inside another stage, such as audio calls made while handling
+        events, to a stage. Takes the stage name as a string and the time in seconds as a float. Returns
+        nothing."""
+
+        self.__stages[stage] += seconds
+        self.__nested += seconds
+
+    def end_frame(self):
+        """This method finishes the running frame and writes it into the ring buffer, over the oldest frame
+        once the buffer is full. Takes no parameters and returns nothing."""
+
+        total = time.perf_counter() - self.__start
+        offset = (self.__frames % self.__capacity) * self.__width
+        buffer = self.__buffer
+
+        buffer[offset] = self.__frames
+        buffer[offset + 1] = self.__state
+        for index, stage in enumerate(FrameProfiler.STAGES, 2):
+            buffer[offset + index] = self.__stages[stage] * 1000
+        buffer[offset + self.__width - 1] = total * 1000
+
+        self.__frames += 1
+        self.__overlay_age += 1
+
+    def rows(self):
+        """This method gets the recorded frames from oldest to newest. Takes no parameters and returns a list
+        of tuples ordered as the columns, with times in milliseconds."""
+
+        count = min(self.__frames, self.__capacity)
+        first = self.__frames - count
+        rows = []
+        for frame in range(first, self.__frames):
+            offset = (frame % self.__capacity) * self.__width
+            row = self.__buffer[offset:offset + self.__width]
+            rows.append((int(row[0]), int(row[1])) + tuple(row[2:]))
+
+        return rows
+
+    def percentiles(self, state=None):
+        """This method finds the 50th, 95th, and 99th percentile frame times of the recorded frames. Takes an
+        optional display state as an integer to only count its frames. Returns a dictionary of the percentile
+        times in milliseconds and the frame count."""
+
+        totals = sorted(row[-1] for row in self.rows() if state is None or row[1] == state)
+        result = {"frames": len(totals)}
+        for name, fraction in (("p50", 0.50), ("p95", 0.95), ("p99", 0.99)):
+            result[name] = totals[min(int(fraction * len(totals)), len(totals) - 1)] if totals else 0.0
+
+        return result
+
+    def draw(self, surface, background, state, force=False):
+        """This method draws the frame time percentiles of a display state in the top right corner, refreshing
+        them every few frames. Takes the surface to draw on, the background to erase the last overlay with,
+        the display state as an integer, and whether to draw even if the overlay is fresh. Returns the
+        changed Rect, or None if nothing was drawn."""
+
+        if not force and self.__overlay_age < FrameProfiler.OVERLAY_INTERVAL:
+            return None
+        self.__overlay_age = 0
+
+        # Renders the lines directly so the numbers do not churn the shared text cache.
+        stats = self.percentiles(state)
+        font = assets.registry.get_font(FrameProfiler.OVERLAY_SIZE)
+        lines = [FrameProfiler.STATE_NAMES[state], "%d frames" % stats["frames"]]
+        lines += ["%s %6.2fms" % (name, stats[name]) for name in ("p50", "p95", "p99")]
+
+        # Erases the last overlay and draws the new one.
+        changed = self.erase(surface, background)
+        x, y = FrameProfiler.OVERLAY_POSITION
+        rects = [changed] if changed else []
+        for line in lines:
+            text = font.render(line, True, FrameProfiler.OVERLAY_COLOR)
+            rects.append(surface.blit(text, (x, y)))
+            y += text.get_height() + 4
+        self.__overlay_rect = rects[0].unionall(rects[1:])
+
+        return self.__overlay_rect
+
+    def erase(self, surface, background):
+        """This method erases the overlay. Takes the surface it was drawn on and the background to erase it with.
+        Returns the erased Rect, or None if there was no overlay."""
+
+        rect = self.__overlay_rect
+        if rect is not None:
+            surface.blit(background, rect, rect)
+            self.__overlay_rect = None
+
+        return rect
+
+    def dump(self, path):
+        """This method saves the recorded frames, as JSON if the path ends in .json and as CSV otherwise.
+        Takes the file path as a string. Returns nothing."""
+
+        rows = self.rows()
+
+        if path.endswith(".json"):
+            report = {"columns": FrameProfiler.COLUMNS, "states": FrameProfiler.STATE_NAMES,
+                      "percentiles": {FrameProfiler.STATE_NAMES[state]: self.percentiles(state)
+                                      for state in sorted(set(row[1] for row in rows))},
+                      "frames": rows}
+            with open(path, "w") as profile_file:
+                json.dump(report, profile_file, indent=1)
+        else:
+            with open(path, "w", newline="") as profile_file:
+                writer = csv.writer(profile_file)
+                writer.writerow(FrameProfiler.COLUMNS)
+                writer.writerows(rows)
+
+    def get_frames(self):
+        """This method gets the number of frames profiled so far. Takes no parameters and returns an
+        integer."""
+
+        return self.__frames
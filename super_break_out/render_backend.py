@@ -0,0 +1,169 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the render backends that draw a page of sprites for the super break-out game
+each frame. The software backend draws onto the display surface, erasing the last frame and drawing the new one
+in a single batch of blits. The texture backend draws with an SDL2 renderer. It keeps every sprite image as a
+texture that is uploaded once, and again only when the image changes, and draws the game at its logical 800x600
+size, which SDL scales to the window.
+"""
+
+# Import and Initalize dependencies.
+import functools
+import pygame
+from pygame._sdl2 import video
+
+
+class SoftwareBackend():
+    """This class defines a backend that blits the sprites onto the display surface."""
+
+    def __init__(self, surface):
+        """Initalizes the backend with nothing drawn yet. Takes the display surface as a parameter. Returns
+        nothing."""
+
+        self.__surface = surface
+        self.__background = None
+        self.__drawn = []
+
+        # Uses fblits where pygame has it, which does not make a rect for each blit, and blits otherwise.
+        if hasattr(surface, "fblits"):
+            self.__blit = surface.fblits
+        else:
+            self.__blit = functools.partial(surface.blits, doreturn=False)
+
+    def set_background(self, background):
+        """This method sets the background the sprites are erased with. Takes the background surface as a
+        parameter. Returns nothing."""
+
+        self.__background = background
+
+    def draw(self, sprites):
+        """This method erases the sprites drawn last frame and draws the new ones, in one batch of blits. Takes
+        the sprite group to draw. Returns nothing."""
+
+        # Erases the last frame, clipped to the background.
+        bounds = self.__background.get_rect()
+        blits = []
+        for rect in self.__drawn:
+            rect = rect.clip(bounds)
+            if rect:
+                blits.append((self.__background.subsurface(rect), rect))
+
+        # Draws the sprites, remembering where so the next frame can erase them.
+        self.__drawn = []
+        for sprite in sprites:
+            blits.append((sprite.image, sprite.rect))
+            self.__drawn.append(sprite.rect.copy())
+        self.__blit(blits)
+
+    def draw_overlay(self, profiler, state):
+        """This method draws the frame profiler's overlay onto the display surface. Takes the FrameProfiler and
+        the display state as an integer. Returns nothing."""
+
+        profiler.draw(self.__surface, self.__background, state)
+
+    def present(self):
+        """This method shows the frame by flipping the display. Takes no parameters and returns nothing."""
+
+        pygame.display.flip()
+
+
+class TextureBackend():
+    """This class defines a backend that draws the sprites as textures with an SDL2 renderer."""
+
+    def __init__(self, title, size, logical_size, driver=None):
+        """Initalizes the window and its renderer. The display module's window is hidden, since SDL cannot
+        render to a window that has a display surface. Takes the window title as a string, the window size and
+        the logical size the game is drawn at as tuple ordered pairs, and the name of the SDL render driver,
+        such as "software", which picks the best driver when it is None. Returns nothing."""
+
+        if pygame.display.get_surface():
+            video.Window.from_display_module().hide()
+        self.__window = video.Window(title, size)
+
+        # Initalizes the renderer with the named driver.
+        index = -1
+        if driver is not None:
+            names = [info.name for info in video.get_drivers()]
+            if driver not in names:
+                raise ValueError("no SDL render driver named %s, the drivers are %s" % (driver, ", ".join(names)))
+            index = names.index(driver)
+        self.__renderer = video.Renderer(self.__window, index)
+        self.__renderer.logical_size = logical_size
+
+        # Initalizes the textures by the id of their surface, each with the surface and its image version, and
+        # the ids of the textures drawn this frame.
+        self.__textures = {}
+        self.__used = set()
+
+        # Initalizes the background and the profiler overlay, which is drawn on a copy of the background.
+        self.__logical_rect = pygame.Rect((0, 0), logical_size)
+        self.__background = None
+        self.__overlay = None
+        self.__overlay_rect = None
+        self.__overlay_texture = None
+
+    def set_background(self, background):
+        """This method sets the background drawn behind the sprites. Only its top left corner the logical size
+        of the renderer is drawn. Takes the background surface as a parameter. Returns nothing."""
+
+        self.__background = background
+        self.__overlay = background.copy()
+
+    def get_texture(self, image, version=0):
+        """This method gets the texture of a surface, uploading it the first time and again when its version
+        changes. Takes the surface and the version of its contents. Returns the Texture."""
+
+        self.__used.add(id(image))
+        entry = self.__textures.get(id(image))
+        if entry is not None and entry[0] is image:
+            if entry[1] == version:
+                return entry[2]
+
+            # Uploads the new contents into the texture.
+            entry[2].update(image)
+            self.__textures[id(image)] = (image, version, entry[2])
+            return entry[2]
+
+        texture = video.Texture.from_surface(self.__renderer, image)
+        self.__textures[id(image)] = (image, version, texture)
+
+        return texture
+
+    def draw(self, sprites):
+        """This method draws the background and the sprites. Takes the sprite group to draw. Returns nothing."""
+
+        self.__renderer.clear()
+        self.get_texture(self.__background).draw(self.__logical_rect, self.__logical_rect)
+        for sprite in sprites:
+            # Skips empty sprites, such as blank labels, since SDL cannot make a texture with no pixels.
+            if sprite.rect:
+                self.get_texture(sprite.image, getattr(sprite, "image_version", 0)).draw(dstrect=sprite.rect)
+
+    def draw_overlay(self, profiler, state):
+        """This method draws the frame profiler's overlay in the top right corner of the logical size, uploading
+        it again each time the profiler redraws it. Takes the FrameProfiler and the display state as an integer.
+        Returns nothing."""
+
+        # Erases the last overlay from the copy, since the profiler forgets it when the overlay is hidden, and
+        # uploads the overlay when it was redrawn, forcing it to be drawn when it has not been uploaded yet.
+        if self.__overlay_rect:
+            self.__overlay.blit(self.__background, self.__overlay_rect, self.__overlay_rect)
+        rect = profiler.draw(self.__overlay, self.__background, state, self.__overlay_texture is None)
+        if rect:
+            self.__overlay_rect = rect
+            self.__overlay_texture = video.Texture.from_surface(self.__renderer, self.__overlay.subsurface(rect))
+
+        # Draws the overlay against the right edge of the logical size, since the profiler places it to the right
+        # of the game.
+        rect = self.__overlay_rect
+        self.__overlay_texture.draw(dstrect=(self.__logical_rect.right - rect.width - 8, rect.y))
+
+    def present(self):
+        """This method shows the frame and lets go of the textures of surfaces that were not drawn in it. Takes
+        no parameters and returns nothing."""
+
+        self.__renderer.present()
+        if len(self.__textures) > len(self.__used):
+            self.__textures = {key: self.__textures[key] for key in self.__used}
+        self.__used = set()
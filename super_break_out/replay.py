@@ -0,0 +1,289 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module records, replays, and analyzes games of super break-out. A replay holds the session
+seed, options, level, and mode and a per-frame input log packed into four bits per frame and run-length encoded.
+Replaying it headlessly rebuilds the exact same game.
+
+Usage: python replay.py play replays/game.sbr
+       python replay.py analyze replays --verify
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import struct
+import time
+import levels
+import simulation
+
+# Initalizes the replay file layout: magic, version, difficulty, players, swept, won, seed, frames, score, the
+# length of the level record that follows, which is 0 for the classic level, and the index of the mode in
+# Simulation.MODES.
+MAGIC = b"SBOR"
+VERSION = 1
+HEADER = struct.Struct("<4sBBBBBQIIHB")
+EXTENSION = ".sbr"
+
+
+def pack_inputs(inputs):
+    """This function packs one frame of inputs into four bits. Takes the inputs as a tuple of booleans ordered
+    as player 1 left, player 1 right, player 2 left, and player 2 right. Returns an integer from 0 to 15."""
+
+    return (bool(inputs[0]) | bool(inputs[1]) << 1 | bool(inputs[2]) << 2 | bool(inputs[3]) << 3)
+
+
+def unpack_inputs(bits):
+    """This function unpacks four bits into one frame of inputs. Takes an integer from 0 to 15. Returns the
+    inputs as a tuple of booleans."""
+
+    return (bool(bits & 1), bool(bits & 2), bool(bits & 4), bool(bits & 8))
+
+
+def encode_run(bits, length):
+    """This function encodes a run of identical frames as a variable length integer holding the input bits in
+    its low four bits and the run length above them. Takes the input bits and run length as integers. Returns
+    the encoded bytes."""
+
+    value = length << 4 | bits
+    encoded = bytearray()
+    while value > 0x7F:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+    encoded.append(value)
+
+    return bytes(encoded)
+
+
+def iter_runs(stream):
+    """This function reads runs from a stream of encoded runs without reading the whole stream at once. Takes
+    a binary file object positioned at the first run. Yields tuples of the input bits and run length."""
+
+    value = 0
+    shift = 0
+    while True:
+        chunk = stream.read(4096)
+        if not chunk:
+            return
+        for byte in chunk:
+            value |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                yield value & 0xF, value >> 4
+                value = 0
+                shift = 0
+
+
+class ReplayRecorder():
+    """This class defines a recorder of the inputs of one game."""
+
+    def __init__(self, seed, difficulty, players, swept=True, level=None, mode="single"):
+        """Initalizes the recorder for a session. Takes the session seed, difficulty from 2 to 5, players as 0
+        for one player or 1 for two players as integers, whether the game uses swept collisions as a boolean,
+        the level being played, which is the classic level when it is None, and the mode as one of
+        Simulation.MODES. Returns nothing."""
+
+        self.__seed = seed
+        self.__difficulty = difficulty
+        self.__players = players
+        self.__swept = swept
+        self.__level = b"" if level is None or level is levels.CLASSIC else level.to_bytes()
+        self.__mode = simulation.Simulation.MODES.index(mode)
+        self.__frames = 0
+        self.__runs = bytearray()
+        self.__run_bits = None
+        self.__run_length = 0
+
+    def record(self, inputs):
+        """This method records the inputs of one frame. Takes the inputs as a tuple of booleans. Returns
+        nothing."""
+
+        bits = pack_inputs(inputs)
+        self.__frames += 1
+
+        # Extends the current run or closes it and starts a new one.
+        if bits == self.__run_bits:
+            self.__run_length += 1
+        else:
+            if self.__run_length:
+                self.__runs += encode_run(self.__run_bits, self.__run_length)
+            self.__run_bits = bits
+            self.__run_length = 1
+
+    def get_seed(self):
+        """This method gets the seed of the recorded session. Takes no parameters and returns the seed as an
+        integer."""
+
+        return self.__seed
+
+    def to_bytes(self, score, won):
+        """This method builds the replay file contents. Takes the final score as an integer and whether the game
+        was won as a boolean. Returns the bytes."""
+
+        runs = bytes(self.__runs)
+        if self.__run_length:
+            runs += encode_run(self.__run_bits, self.__run_length)
+
+        return HEADER.pack(MAGIC, VERSION, self.__difficulty, self.__players, self.__swept, won,
+                           self.__seed, self.__frames, score, len(self.__level), self.__mode) + self.__level + runs
+
+    def save(self, path, score, won):
+        """This method writes the replay to a file. Takes the file path as a string, the final score as an
+        integer, and whether the game was won as a boolean. Returns nothing."""
+
+        with open(path, "wb") as replay_file:
+            replay_file.write(self.to_bytes(score, won))
+
+    def get_frames(self):
+        """This method gets the number of frames recorded. Takes no parameters and returns an integer."""
+
+        return self.__frames
+
+
+def read_header(stream):
+    """This function reads a replay header and its level. Takes a binary file object at the start of a replay.
+    Returns a dictionary of the recorded session settings and results, with the level as None for the classic
+    level."""
+
+    data = stream.read(HEADER.size)
+    if len(data) != HEADER.size:
+        raise ValueError("replay is too short")
+
+    magic, version, difficulty, players, swept, won, seed, frames, score, level_length, mode = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("not a version %d replay" % VERSION)
+    if mode >= len(simulation.Simulation.MODES):
+        raise ValueError("unknown replay mode %d" % mode)
+
+    # Reads the level, which the classic level leaves out.
+    level = None
+    if level_length:
+        level = levels.read_level(stream.read(level_length))
+
+    return {"difficulty": difficulty, "players": players, "swept": bool(swept), "won": bool(won), "seed": seed,
+            "frames": frames, "score": score, "level": level, "mode": simulation.Simulation.MODES[mode]}
+
+
+def play(path):
+    """This function re-runs a replay headlessly as fast as possible and checks it ends the way it was
+    recorded. Takes the replay file path as a string. Returns a dictionary with the recorded header, the
+    replayed score, frames, win, whether it matched, and the time it took."""
+
+    start = time.perf_counter()
+    with open(path, "rb") as replay_file:
+        header = read_header(replay_file)
+        game = simulation.Simulation(header["difficulty"], header["players"], header["swept"], header["seed"],
+                                     header["level"], header["mode"])
+        step = game.step
+
+        # Steps the game once per recorded frame.
+        for bits, length in iter_runs(replay_file):
+            inputs = unpack_inputs(bits)
+            for frame in range(length):
+                step(inputs)
+
+    hud = game.get_hud()
+    result = dict(header)
+    result["replayed_score"] = hud.get_score()
+    result["replayed_frames"] = game.get_frame()
+    result["replayed_won"] = hud.get_win()
+    result["matched"] = (result["replayed_score"] == header["score"] and result["replayed_won"] == header["won"])
+    result["seconds"] = time.perf_counter() - start
+
+    return result
+
+
+def iter_replays(directory):
+    """This function finds the replay files in a directory one at a time. Takes the directory path as a
+    string. Yields the file paths."""
+
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_file() and entry.name.endswith(EXTENSION):
+                yield entry.path
+
+
+def analyze(directory, verify=False):
+    """This function streams through a directory of replays and totals their stats, holding one replay at a
+    time. Takes the directory path as a string and whether to replay each game to check it. Returns a
+    dictionary of stats."""
+
+    stats = {"replays": 0, "frames": 0, "wins": 0, "best_score": 0, "total_score": 0, "by_difficulty": {},
+             "verified": 0, "mismatched": [], "unreadable": []}
+
+    for path in iter_replays(directory):
+        try:
+            if verify:
+                header = play(path)
+            else:
+                with open(path, "rb") as replay_file:
+                    header = read_header(replay_file)
+        except (OSError, ValueError) as error:
+            stats["unreadable"].append((path, str(error)))
+            continue
+
+        # Adds the replay to the totals.
+        stats["replays"] += 1
+        stats["frames"] += header["frames"]
+        stats["wins"] += header["won"]
+        stats["best_score"] = max(stats["best_score"], header["score"])
+        stats["total_score"] += header["score"]
+        stats["by_difficulty"][header["difficulty"]] = stats["by_difficulty"].get(header["difficulty"], 0) + 1
+
+        # Records the result of checking the replay.
+        if verify:
+            stats["verified"] += 1
+            if not header["matched"]:
+                stats["mismatched"].append(path)
+
+    stats["mean_score"] = stats["total_score"] / stats["replays"] if stats["replays"] else 0.0
+
+    return stats
+
+
+def main():
+    """This function parses the command line and plays or analyzes replays. Takes no parameters and returns
+    nothing."""
+
+    parser = argparse.ArgumentParser(description="Play back and analyze super break-out replays.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    play_parser = commands.add_parser("play", help="re-run one replay and check its final score")
+    play_parser.add_argument("path")
+    analyze_parser = commands.add_parser("analyze", help="total the stats of a directory of replays")
+    analyze_parser.add_argument("directory")
+    analyze_parser.add_argument("--verify", action="store_true", help="re-run every replay to check it")
+    args = parser.parse_args()
+    if args.command == "play" and not os.path.isfile(args.path):
+        parser.error("no replay file named %s" % args.path)
+    if args.command == "analyze" and not os.path.isdir(args.directory):
+        parser.error("no replay directory named %s" % args.directory)
+
+    if args.command == "play":
+        result = play(args.path)
+        print("frames: %d recorded, %d replayed" % (result["frames"], result["replayed_frames"]))
+        print("score:  %d recorded, %d replayed" % (result["score"], result["replayed_score"]))
+        print("result: %s (%.3fs)" % ("match" if result["matched"] else "MISMATCH", result["seconds"]))
+        if not result["matched"]:
+            raise SystemExit(1)
+    else:
+        stats = analyze(args.directory, args.verify)
+        print("replays:    %d (%d won)" % (stats["replays"], stats["wins"]))
+        print("frames:     %d" % stats["frames"])
+        print("best score: %d, mean score %.1f" % (stats["best_score"], stats["mean_score"]))
+        print("difficulty: %s" % ", ".join("%d: %d" % item for item in sorted(stats["by_difficulty"].items())))
+        for path, error in stats["unreadable"]:
+            print("unreadable: %s (%s)" % (path, error))
+        if args.verify:
+            print("verified:   %d, %d mismatched" % (stats["verified"], len(stats["mismatched"])))
+            for path in stats["mismatched"]:
+                print("mismatch:   %s" % path)
+            if stats["mismatched"]:
+                raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
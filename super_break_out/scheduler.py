@@ -0,0 +1,67 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the frame-driven scheduler for the super break-out game. It runs delayed
+actions and timed freezes from the game loop so the loop never has to sleep.
+"""
+
+# Import and Initalize dependencies.
+import heapq
+
+
+class Scheduler():
+    """This class defines a scheduler of delayed actions and freezes driven by the frame time."""
+
+    def __init__(self):
+        """Initalizes the scheduler clock and the empty queue of actions. Takes no parameters and returns
+        nothing."""
+
+        self.__now = 0
+        self.__frozen_until = 0
+        self.__actions = []
+        self.__count = 0
+
+    def tick(self, elapsed):
+        """This method advances the scheduler clock and runs every action that has become due, in the order
+        they are due. Takes the milliseconds since the last tick as an integer parameter. Returns nothing."""
+
+        self.__now += elapsed
+
+        while self.__actions and self.__actions[0][0] <= self.__now:
+            action = heapq.heappop(self.__actions)[2]
+            action()
+
+    def call_later(self, delay, action):
+        """This method schedules an action to run after a delay. Takes the delay in milliseconds as an integer
+        and the action as a function that takes no parameters. Returns nothing."""
+
+        # The count keeps actions that are due at the same time in the order they were scheduled.
+        self.__count += 1
+        heapq.heappush(self.__actions, (self.__now + delay, self.__count, action))
+
+    def freeze(self, duration, on_resume=None):
+        """This method freezes the game for a duration, or extends the current freeze. Takes the duration in
+        milliseconds as an integer and an optional action to run when the freeze ends. Returns nothing."""
+
+        self.__frozen_until = max(self.__frozen_until, self.__now + duration)
+
+        if on_resume is not None:
+            self.call_later(self.__frozen_until - self.__now, on_resume)
+
+    def is_frozen(self):
+        """This method checks if the game is frozen. Takes no parameters and returns a boolean."""
+
+        return self.__now < self.__frozen_until
+
+    def get_remaining(self):
+        """This method gets how long the current freeze has left. Takes no parameters and returns the time in
+        milliseconds, which is 0 when the game is not frozen."""
+
+        return max(self.__frozen_until - self.__now, 0)
+
+    def clear(self):
+        """This method cancels every scheduled action and ends any freeze. Takes no parameters and returns
+        nothing."""
+
+        self.__actions.clear()
+        self.__frozen_until = self.__now
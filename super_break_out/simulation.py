@@ -0,0 +1,611 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the headless simulation core for the super break-out game. It runs the game
+rules without a display, mixer, or frame clock so the game can be stepped as fast as the CPU allows. The state
+of a game can be saved and restored within that game, which lets netplay roll back and re-run frames.
+"""
+
+# Import and Initalize dependencies.
+import random
+import zlib
+import pygame
+import game_sprites
+import brick_field
+import collision
+import levels
+
+
+class Simulation():
+    """This class defines the pure game logic of a single game of super break-out."""
+
+    # Initalizes the number of steps per second the speeds are tuned for as a constant class variable.
+    TICK_RATE = 30
+
+    # Initalizes the score thresholds for the phase changes of the classic level as constant class variables.
+    PHASE_TWO_SCORE = 80
+    PHASE_THREE_SCORE = 189
+
+    # Initalizes the screen area the ball bounces inside as a constant class variable.
+    BOUNDS = pygame.Rect(0, 0, 800, 600)
+
+    # Initalizes the most contacts the ball can make in one swept step as a constant class variable.
+    MAX_CONTACTS = 8
+
+    # Initalizes the tuple of events that step can report as a constant class variable.
+    EVENTS = ("bounce", "brick_break", "phase_two", "phase_three", "damage", "game_over", "release")
+
+    # Initalizes the game modes and how many balls each serves as constant class variables. Double serves two
+    # balls, cavity also holds two captive balls in the wall, and stress serves hundreds to test collisions.
+    MODES = ("single", "double", "cavity", "stress")
+    SERVE_BALLS = {"single": 1, "double": 2, "cavity": 1, "stress": 256}
+
+    # Initalizes the sideways distance allowed for a ball to reach in one step as a constant class variable,
+    # which is twice the fastest a platform bounce sends it sideways to leave a margin.
+    REACH_DX = 2 * game_sprites.Ball.MAX_BOUNCE_DX
+
+    def __init__(self, difficulty=None, players=None, swept=True, seed=None, level=None, mode="single"):
+        """Initalizes the game entities and state. Takes the difficulty from 2 to 5 and the number of players
+        as 0 for one player or 1 for two players as integer parameters. The entities keep their menu defaults
+        until configure is called when either is None. Also takes whether the ball uses swept collisions or
+        the original overlap tests after each move as a boolean, and the seed for the session's random
+        generator, which picks a fresh seed when it is None, the level to play, which is the classic wall
+        when it is None, and the game mode from MODES. Returns nothing."""
+
+        # Initalizes the session's random generator, which reset seeds so a seed always rebuilds the same game.
+        self.__rng = random.Random()
+        self.__swept = swept
+
+        # Initalizes the game entity sprite groups, sized for the largest level so every level fits.
+        self.__bricks = brick_field.BrickField(levels.MAX_ROWS, levels.MAX_COLS, (0, 34 // 2 - 24 // 2),
+                                               (40 + 5, 24 + 5))
+        self.__players = pygame.sprite.Group()
+        self.__loss_zone = game_sprites.Loss_zone()
+
+        # Initalizes the game HUD.
+        self.__hud = game_sprites.Hud()
+
+        # Initalizes the players.
+        self.__player1 = game_sprites.Platform((200, 580))
+        self.__player2 = game_sprites.Platform((600, 560))
+
+        # Initalizes the pool of balls, the group of balls in play, the captive balls with their cavities, and
+        # the groups outside the simulation each lost ball was drawn in.
+        self.__ball = game_sprites.Ball()
+        self.__balls = [self.__ball]
+        self.__in_play = pygame.sprite.Group()
+        self.__captives = []
+        self.__drawn_groups = {}
+
+        # Initalizes the game state and the wall.
+        self.reset(seed, level, mode)
+
+        # Applies the selected options if they are known.
+        if difficulty is not None and players is not None:
+            self.configure(difficulty, players)
+
+    def reset(self, seed=None, level=None, mode="single"):
+        """This method starts a new game in place, keeping the entities, the pooled bricks of the field, and the
+        pooled balls. The options go back to their menu defaults until configure is called. Takes the seed for
+        the session's random generator, which picks a fresh seed when it is None, the level to play, which is
+        the classic wall when it is None, and the game mode from MODES. Returns nothing. Raises ValueError if
+        the mode is unknown."""
+
+        if mode not in Simulation.MODES:
+            raise ValueError("unknown game mode %r" % mode)
+        self.__mode = mode
+        self.__rng.seed(seed)
+
+        # Initalizes the level.
+        self.__level = levels.CLASSIC if level is None else level
+        rows, cols = self.__level.get_size()
+        self.__phase_two_score, self.__phase_three_score = self.__level.get_phase_scores()
+        self.__hud.restart()
+        self.__hud.set_win_score(self.__level.get_win_score())
+
+        # Initalizes the game bricks from the level's cells, in row order, leaving the cavities empty.
+        cavities = self.__get_cavities(rows, cols) if mode == "cavity" else ()
+        self.__bricks.reset(rows, cols)
+        for row in range(rows):
+            for col in range(cols):
+                cell = self.__level.get_cell(row, col)
+                if cell is None or (row, col) in cavities:
+                    continue
+                color, shape, hit_points = cell
+                if shape == levels.RANDOM_SHAPE:
+                    shape = self.__rng.randrange(4)
+
+                self.__bricks.add(row, col, color, shape, hit_points)
+
+        # Lets the wall be won without the bricks the cavities replaced.
+        if cavities:
+            self.__hud.set_win_score(min(self.__level.get_win_score(), self.__bricks.get_remaining_score()))
+
+        # Puts the players back where a game starts.
+        self.__player1.restart((200, 580))
+        self.__player2.restart((600, 560))
+        self.__players.add(self.__player1, self.__player2)
+
+        # Takes enough balls from the pool for the mode, and takes the rest out of the game.
+        serve_balls = Simulation.SERVE_BALLS[mode]
+        while len(self.__balls) < serve_balls + len(cavities):
+            self.__balls.append(game_sprites.Ball())
+        for ball in self.__balls[serve_balls + len(cavities):]:
+            ball.kill()
+            self.__drawn_groups.pop(ball, None)
+        self.__mode_balls = self.__balls[:serve_balls + len(cavities)]
+
+        # Serves the balls in play and puts the captive balls in their cavities.
+        self.__in_play.empty()
+        for index, ball in enumerate(self.__mode_balls[:serve_balls]):
+            ball.restart(self.__get_serve_center(index), 1 if index % 2 == 0 else -1)
+            self.__put_back(ball)
+            self.__in_play.add(ball)
+        self.__captives = []
+        for index, (row, col) in enumerate(cavities):
+            ball = self.__mode_balls[serve_balls + index]
+            ball.restart(self.__bricks.get_cell_rect(row, col).center, 1 if index % 2 == 0 else -1)
+            self.__put_back(ball)
+            self.__captives.append((ball, row, col))
+
+        # Initalizes the game state variables.
+        self.__phase = 1
+        self.__frame = 0
+        self.__wall_moved = False
+        self.__game_over = False
+        self.__selected_players = None
+
+    def configure(self, difficulty, players):
+        """This method updates the game entities with the selected options. Takes the difficulty from 2 to 5
+        and the number of players as 0 for one player or 1 for two players as integer parameters. Returns
+        nothing."""
+
+        self.__selected_players = players
+
+        # Checks how many players and sets difficulty of game.
+        if players == 0:
+            self.__player1.change_platform_size(difficulty)
+            self.__player1.set_platform_pos((400, 580))
+            self.__player2.remove_platform()
+        elif players == 1:
+            self.__player1.change_platform_size(difficulty)
+            self.__player2.change_platform_size(difficulty)
+
+    def serve(self):
+        """This method puts the balls the mode serves back in play where they are served, keeping their speed.
+        Takes no parameters and returns nothing."""
+
+        for index, ball in enumerate(self.__mode_balls[:Simulation.SERVE_BALLS[self.__mode]]):
+            ball.reset(self.__get_serve_center(index))
+            self.__put_back(ball)
+            self.__in_play.add(ball)
+
+    def __get_serve_center(self, index):
+        """This helper method gets where a served ball starts, which is the centre of the screen for the first
+        ball and spread out below the wall for the others. Takes the ball's index as an integer. Returns a tuple
+        ordered pair."""
+
+        return (60 + (340 + 97 * index) % 680, 400 - (29 * index) % 40)
+
+    def __get_cavities(self, rows, cols):
+        """This helper method picks the cells the captive balls start in: two cells of the middle row a
+        quarter of the way in from each side. Takes the number of rows and columns as integers. Returns a tuple
+        of row and column pairs, which is empty when the wall is too small to hold a ball inside it."""
+
+        if rows < 3 or cols < 5:
+            return ()
+
+        return ((rows // 2, cols // 4), (rows // 2, cols - 1 - cols // 4))
+
+    def __put_back(self, ball):
+        """This helper method adds a lost ball back to the groups it was drawn in. Takes the ball. Returns
+        nothing."""
+
+        ball.add(*self.__drawn_groups.pop(ball, ()))
+
+    def __take_out(self, ball):
+        """This helper method takes a lost ball out of play and out of every group drawing it, remembering
+        those groups so the ball can be put back later. Takes the ball. Returns nothing."""
+
+        self.__drawn_groups[ball] = [group for group in ball.groups() if group is not self.__in_play]
+        ball.kill()
+
+    def step(self, inputs):
+        """This method advances the game by one frame. Takes the player inputs as a tuple of booleans ordered
+        as player 1 left, player 1 right, player 2 left, and player 2 right. Returns a list of the event names
+        from EVENTS that happened during the frame."""
+
+        events = []
+
+        # Nothing happens once the game has ended.
+        if self.__game_over:
+            return events
+
+        self.__frame += 1
+        self.__wall_moved = False
+        p1_left, p1_right, p2_left, p2_right = inputs
+
+        # Left/Right movement for player 1.
+        if p1_left:
+            self.__player1.move("left")
+        if p1_right:
+            self.__player1.move("right")
+
+        # Left/Right movement for player 2 if player 2 exists.
+        if self.__selected_players == 1:
+            if p2_left:
+                self.__player2.move("left")
+            if p2_right:
+                self.__player2.move("right")
+
+        # Increase difficulty after player reaches halfway score.
+        if (self.__hud.get_score() >= self.__phase_three_score) and (self.__phase == 2):
+            self.__phase = 3
+            events.append("phase_three")
+
+            # Adjustments to game entities.
+            self.__player1.third_phase()
+            if self.__selected_players == 1:
+                self.__player2.third_phase()
+            for ball in self.__mode_balls:
+                ball.increase_speed(2)
+            self.__bricks.set_downshift_val(8)
+
+        # Increases difficulty after player reaches phase 1.
+        if (self.__hud.get_score() >= self.__phase_two_score) and (self.__phase == 1):
+            self.__phase = 2
+            events.append("phase_two")
+
+            # Adjustments to game entities.
+            for ball in self.__mode_balls:
+                ball.increase_speed(1)
+            self.__bricks.set_downshift_val(4)
+
+        # Checks if end condition is present.
+        if self.__hud.check_game_over():
+            self.__game_over = True
+            events.append("game_over")
+            return events
+
+        # Swept collisions move the balls and find their contacts along the way.
+        if self.__swept:
+            self.__check_loss(events)
+            self.__sweep_balls(events)
+
+        else:
+            # Player-ball collisions, testing each ball against every platform rect at once.
+            balls = self.__in_play.sprites()
+            players = self.__players.sprites()
+            platform_rects = [player.rect for player in players]
+            for ball in balls:
+                collided_platform = ball.rect.collidelist(platform_rects)
+                if collided_platform >= 0:
+                    events.append("bounce")
+
+                    # Changes ball direction.
+                    ball.change_direction(players[collided_platform])
+
+                    # Shifts all bricks down.
+                    self.__move_wall_down()
+
+            # Ball-brick collisions, only checking the cells under each ball.
+            for ball in balls:
+                broken_bricks = self.__bricks.collide(ball.rect)
+                if broken_bricks:
+                    events.append("brick_break")
+
+                    # Removes brick and adds to score.
+                    for brick in broken_bricks:
+                        brick.remove_brick(self.__hud)
+
+                    # Reverse ball direction.
+                    ball.change_direction(broken_bricks[0])
+
+            # Checks the loss zone and moves the balls.
+            self.__check_loss(events)
+            for ball in self.__in_play.sprites():
+                ball.move()
+
+        # Frees the captive balls whose cavities have been opened.
+        if self.__captives:
+            self.__free_captives(events)
+
+        return events
+
+    def __move_wall_down(self):
+        """This helper method shifts all bricks down for a platform bounce. While several balls are in play it
+        only does so once per step, so that many balls bouncing together do not drive the wall into the loss
+        zone. Takes no parameters and returns nothing."""
+
+        if not (self.__wall_moved and len(self.__in_play) > 1):
+            self.__wall_moved = True
+            self.__bricks.move_down()
+
+    def __check_loss(self, events):
+        """This helper method removes lives when the bricks or the last ball in play reach the loss zone, and
+        takes any other ball that reaches it out of play. Takes the list of events for the step as a parameter
+        and returns nothing."""
+
+        # Loss zone-brick collisions remove all lives, which only the lowest live row can reach.
+        if self.__bricks.reaches(self.__loss_zone.rect):
+            self.__hud.remove_life(3)
+
+        # Ball-loss zone collisions, tested for every ball at once.
+        balls = self.__in_play.sprites()
+        for index in self.__loss_zone.rect.collidelistall([ball.rect for ball in balls]):
+            ball = balls[index]
+
+            # Takes the ball out of play while other balls are still in play.
+            if len(self.__in_play) > 1:
+                self.__take_out(ball)
+                continue
+
+            # Serves again if player has enough lives to keep playing.
+            if self.__hud.get_lives() > 1:
+                events.append("damage")
+                self.serve()
+
+            # Removes a life.
+            self.__hud.remove_life(1)
+
+    def __free_captives(self, events):
+        """This helper method puts the captive balls whose cavities have an opening into play, and keeps the
+        others in their cavities as the wall moves. Takes the list of events for the step as a parameter and
+        returns nothing."""
+
+        captives = []
+        for ball, row, col in self.__captives:
+            if self.__bricks.is_open(row, col):
+                events.append("release")
+                self.__in_play.add(ball)
+                continue
+
+            captives.append((ball, row, col))
+            center = self.__bricks.get_cell_rect(row, col).center
+            if ball.rect.center != center:
+                ball.reset(center)
+
+        self.__captives = captives
+
+    def __sweep_balls(self, events):
+        """This helper method sweeps every ball in play for one step. With more than one ball, a broadphase
+        first tests the area each ball can reach during the step against the platforms and the loss zone for
+        all balls at once, so each ball only sweeps against what it can touch. Bricks are found through the
+        brick field's cells. Takes the list of events for the step as a parameter and returns nothing."""
+
+        balls = self.__in_play.sprites()
+
+        # Sweeps a lone ball against everything, which costs less than the broadphase.
+        if len(balls) == 1:
+            self.__sweep_ball(balls[0], self.__players.sprites(), True, events)
+            return
+
+        # Finds the area each ball can reach, allowing for the sideways speed a bounce can give it.
+        reaches = []
+        for ball in balls:
+            x, y = ball.get_position()
+            dx, dy = ball.get_velocity()
+            reach_x = int(max(abs(dx), Simulation.REACH_DX)) + 2
+            reach_y = int(abs(dy)) + 2
+            reaches.append(pygame.Rect(int(x) - reach_x, int(y) - reach_y, ball.rect.width + 2 * reach_x,
+                                       ball.rect.height + 2 * reach_y))
+
+        # Tests every reach against the platforms and the loss zone, in platform order.
+        near_players = [[] for ball in balls]
+        for player in self.__players:
+            for index in player.rect.collidelistall(reaches):
+                near_players[index].append(player)
+        near_loss = set(self.__loss_zone.rect.collidelistall(reaches))
+
+        for index, ball in enumerate(balls):
+            self.__sweep_ball(ball, near_players[index], index in near_loss, events)
+
+    def __sweep_ball(self, ball, players, near_loss, events):
+        """This helper method moves a ball along its path for one step, stopping at each first contact with
+        a platform, brick, or screen edge to bounce before moving on. Takes the ball, the platforms it can
+        reach as a list, whether it can reach the loss zone as a boolean, and the list of events for the step.
+        Returns nothing."""
+
+        x, y = ball.get_position()
+        size = ball.rect.size
+        remaining = 1.0
+
+        for contact in range(Simulation.MAX_CONTACTS):
+            dx, dy = ball.get_velocity()
+            motion = (dx * remaining, dy * remaining)
+
+            # Checks the screen edges and the loss zone, which ends the sweep.
+            first = collision.sweep_bounds((x, y), size, motion, Simulation.BOUNDS)
+            kind = "edge"
+            if near_loss:
+                hit = collision.sweep((x, y), size, motion, self.__loss_zone.rect)
+                if hit and (first is None or hit[0] < first[0]):
+                    first, kind = hit, "loss_zone"
+
+            # Checks the platforms.
+            for player in players:
+                hit = collision.sweep((x, y), size, motion, player.rect)
+                if hit and (first is None or hit[0] < first[0]):
+                    first, kind, item = hit, "platform", player
+
+            # Checks the bricks in the cells the ball passes over, keeping every brick touched at once.
+            path = pygame.Rect(int(min(x, x + motion[0])), int(min(y, y + motion[1])),
+                               int(abs(motion[0])) + size[0] + 2, int(abs(motion[1])) + size[1] + 2)
+            bricks = []
+            for brick in self.__bricks.collide(path):
+                hit = collision.sweep((x, y), size, motion, brick.rect)
+                if hit is None or (first is not None and hit[0] > first[0]):
+                    continue
+                if first is None or hit[0] < first[0] or kind != "brick":
+                    first, kind, bricks = hit, "brick", []
+                bricks.append(brick)
+
+            # Moves the rest of the way when nothing is in the path.
+            if first is None:
+                x += motion[0]
+                y += motion[1]
+                break
+
+            # Moves up to the contact.
+            time, axis = first
+            x += motion[0] * time
+            y += motion[1] * time
+            ball.set_position((x, y))
+            remaining *= 1 - time
+
+            # The ball keeps going into the loss zone where the next step catches it.
+            if kind == "loss_zone":
+                x = min(max(x + motion[0] * (1 - time), 0), Simulation.BOUNDS.right - size[0])
+                y = min(y + motion[1] * (1 - time), Simulation.BOUNDS.bottom - size[1])
+                break
+
+            # Bounces off the screen edge.
+            if kind == "edge":
+                ball.bounce(axis)
+
+            # Bounces off a platform with the platform angle rule and shifts all bricks down.
+            elif kind == "platform":
+                events.append("bounce")
+                if axis == "y":
+                    ball.change_direction(item)
+                else:
+                    ball.bounce("x")
+                self.__move_wall_down()
+
+            # Removes the bricks and bounces off the first one.
+            else:
+                events.append("brick_break")
+                for brick in bricks:
+                    brick.remove_brick(self.__hud)
+                if axis == "y":
+                    ball.change_direction(bricks[0])
+                else:
+                    ball.bounce("x")
+
+        ball.set_position((x, y))
+
+    def get_state(self):
+        """This method saves the state of the game between steps, which can be restored until the game is reset.
+        Takes no parameters and returns a tuple of the frame, phase, whether the game is over, the platforms,
+        balls, balls in play, captive balls, lost balls, HUD, and wall."""
+
+        return (self.__frame, self.__phase, self.__game_over, self.__player1.get_state(),
+                self.__player2.get_state(), tuple(ball.get_state() for ball in self.__mode_balls),
+                tuple(self.__in_play.sprites()), tuple(self.__captives), tuple(self.__drawn_groups),
+                self.__hud.get_state(), self.__bricks.get_state())
+
+    def set_state(self, state):
+        """This method restores a state saved earlier in the same game. Takes a tuple from get_state. Returns
+        nothing."""
+
+        (self.__frame, self.__phase, self.__game_over, player1, player2, balls, in_play, captives, lost, hud,
+         bricks) = state
+        self.__player1.set_state(player1)
+        self.__player2.set_state(player2)
+        self.__hud.set_state(hud)
+        self.__bricks.set_state(bricks)
+
+        # Restores the balls, taking out or putting back the ones that were lost or not at the time.
+        for ball, ball_state in zip(self.__mode_balls, balls):
+            ball.set_state(ball_state)
+            if ball in lost and ball not in self.__drawn_groups:
+                self.__take_out(ball)
+            elif ball not in lost and ball in self.__drawn_groups:
+                self.__put_back(ball)
+
+        # Restores the balls in play in the order they are stepped in.
+        self.__in_play.empty()
+        self.__in_play.add(*in_play)
+        self.__captives = list(captives)
+
+    def get_state_hash(self, state=None):
+        """This method hashes a saved state of the game so two machines running the same game can check they
+        agree. The hash only depends on the game, not on the objects holding it. Takes an optional tuple from
+        get_state, which is the current state when it is None. Returns an integer."""
+
+        if state is None:
+            state = self.get_state()
+        frame, phase, game_over, player1, player2, balls, in_play, captives, lost, hud, bricks = state
+
+        # Replaces the balls with their indices in the pool.
+        indices = {ball: index for index, ball in enumerate(self.__mode_balls)}
+        summary = (frame, phase, game_over, player1, player2, balls, [indices[ball] for ball in in_play],
+                   [(indices[ball], row, col) for ball, row, col in captives], sorted(indices[ball] for ball in lost),
+                   hud, bricks[:2])
+
+        return zlib.crc32(bricks[2] + bricks[3], zlib.crc32(repr(summary).encode()))
+
+    def get_level(self):
+        """This method gets the level being played. Takes no parameters and returns the Level."""
+
+        return self.__level
+
+    def get_bricks(self):
+        """This method gets the brick field. Takes no parameters and returns the BrickField."""
+
+        return self.__bricks
+
+    def get_players(self):
+        """This method gets the player platform sprite group. Takes no parameters and returns the group."""
+
+        return self.__players
+
+    def get_player1(self):
+        """This method gets the player 1 platform. Takes no parameters and returns the platform sprite."""
+
+        return self.__player1
+
+    def get_player2(self):
+        """This method gets the player 2 platform. Takes no parameters and returns the platform sprite."""
+
+        return self.__player2
+
+    def get_ball(self):
+        """This method gets the first ball, which is the only ball in single mode. Takes no parameters and
+        returns the ball sprite."""
+
+        return self.__ball
+
+    def get_balls(self):
+        """This method gets every ball of the mode, whether it is in play, captive, or lost. Takes no
+        parameters and returns a list of ball sprites."""
+
+        return list(self.__mode_balls)
+
+    def get_balls_in_play(self):
+        """This method gets the balls in play. Takes no parameters and returns a list of ball sprites."""
+
+        return self.__in_play.sprites()
+
+    def get_mode(self):
+        """This method gets the game mode. Takes no parameters and returns a string from MODES."""
+
+        return self.__mode
+
+    def get_loss_zone(self):
+        """This method gets the loss zone. Takes no parameters and returns the loss zone sprite."""
+
+        return self.__loss_zone
+
+    def get_hud(self):
+        """This method gets the HUD which holds the score and lives. Takes no parameters and returns the HUD
+        sprite."""
+
+        return self.__hud
+
+    def get_phase(self):
+        """This method gets the current phase of the game. Takes no parameters and returns the phase as an
+        integer from 1 to 3."""
+
+        return self.__phase
+
+    def get_frame(self):
+        """This method gets the number of frames stepped so far. Takes no parameters and returns the frame
+        count as an integer."""
+
+        return self.__frame
+
+    def is_game_over(self):
+        """This method checks if the game has ended. Takes no parameters and returns a boolean."""
+
+        return self.__game_over
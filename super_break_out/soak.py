@@ -0,0 +1,361 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This program soak tests the super break-out game rules by playing many seeded headless games across
+a pool of worker processes. Every difficulty, player count, and starting phase is played in turn. Each game's
+result is streamed back and added to running totals, which stay the same size however many games are played,
+and the throughput is reported as the games finish. The seed picks the classic wall's brick shapes, but a shape
+only changes how a brick looks and not where the ball bounces, so each game's seed also drives a little input
+jitter on top of the policy, which keeps the deterministic policies from playing the same game every time, and
+the number of distinct outcomes is reported.
+
+Usage: python soak.py --games 20000 --policy random
+       python soak.py --games 100000 --policy autopilot --workers 8 --output results.jsonl --record-dir anomalies
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import argparse
+import collections
+import concurrent.futures
+import itertools
+import json
+import random
+import time
+import simulation
+import game_sprites
+import headless
+import replay
+
+
+def play_game(game, seed, start_phase, policy, max_frames, recorder=None, jitter=0.0):
+    """This function plays a configured game to the end and watches it for anomalies: a ball leaving the screen
+    by more than one step of movement, the score going down, and the game not ending within the frame limit.
+    A later phase is started by giving the score it is reached at, which the first steps turn into the phase
+    changes. Takes the simulation, its seed, the phase to start in from 1 to 3, the policy function, the most
+    frames to play, an optional recorder, and the fraction of frames whose inputs are random instead of the
+    policy's, drawn from the seed. Returns a dictionary of the game's result, where the phase frames
+    are None for phases that were not reached and the anomalies map each name to the first frame it was seen."""
+
+    rng = random.Random(seed)
+    hud = game.get_hud()
+    bounds = simulation.Simulation.BOUNDS
+    if start_phase > 1:
+        hud.add_score(game.get_level().get_phase_scores()[start_phase - 2])
+
+    result = {"seed": seed, "start_phase": start_phase, "phase_two_frame": None, "phase_three_frame": None,
+              "life_losses": 0, "anomalies": {}}
+    lives = hud.get_lives()
+    score = hud.get_score()
+    while not game.is_game_over() and game.get_frame() < max_frames:
+        inputs = policy(game, rng)
+        if jitter and rng.random() < jitter:
+            inputs = headless.random_policy(game, rng)
+        if recorder:
+            recorder.record(inputs)
+        events = game.step(inputs)
+        frame = game.get_frame()
+
+        # Records when each phase is reached.
+        if "phase_two" in events:
+            result["phase_two_frame"] = frame
+        if "phase_three" in events:
+            result["phase_three_frame"] = frame
+
+        # Counts the lives lost, where the wall reaching the loss zone takes every life left at once.
+        if hud.get_lives() < lives:
+            result["life_losses"] += lives - max(hud.get_lives(), 0)
+        lives = hud.get_lives()
+
+        # Checks the score never goes down.
+        if hud.get_score() < score:
+            result["anomalies"].setdefault("score_decreased", frame)
+        score = hud.get_score()
+
+        # Checks every ball in play is on the screen, give or take the step it overshoots an edge by.
+        for ball in game.get_balls_in_play():
+            dx, dy = ball.get_velocity()
+            if not bounds.inflate(2 * abs(dx) + 2, 2 * abs(dy) + 2).contains(ball.rect):
+                result["anomalies"].setdefault("ball_out_of_bounds", frame)
+
+    # Checks the game ended.
+    if not game.is_game_over():
+        result["anomalies"].setdefault("timeout", game.get_frame())
+
+    result["score"] = hud.get_score()
+    result["frames"] = game.get_frame()
+    result["win"] = bool(hud.get_win())
+
+    return result
+
+
+def play_chunk(task):
+    """This function plays a chunk of games in a worker process, reusing one simulation for all of them. Game n
+    of the run plays configuration n modulo the number of configurations. Takes the task as a dictionary of the
+    configurations as a list of tuples of the difficulty, players as 0 or 1, and starting phase, the index and
+    seed of the first game, number of games, policy name, whether to use swept collisions, mode, most frames per
+    game, input jitter, and the directory to save the replays of games with anomalies to or None. Only games
+    started in the first phase are recorded, since a replay cannot give the score a later phase starts with.
+    Returns a list of the games' result dictionaries."""
+
+    policy = headless.POLICIES[task["policy"]]
+    configs = task["configs"]
+    results = []
+    game = None
+    for offset in range(task["count"]):
+        seed = task["first_seed"] + offset
+        difficulty, players, start_phase = configs[(task["first_game"] + offset) % len(configs)]
+
+        # Starts the next game, resetting the simulation in place after the first.
+        if game is None:
+            game = simulation.Simulation(difficulty, players, task["swept"], seed, None, task["mode"])
+        else:
+            game.reset(seed, None, task["mode"])
+            game.configure(difficulty, players)
+        recorder = None
+        if task["record_dir"] and start_phase == 1:
+            recorder = replay.ReplayRecorder(seed, difficulty, players, task["swept"], None, task["mode"])
+
+        result = play_game(game, seed, start_phase, policy, task["max_frames"], recorder, task["jitter"])
+        result["difficulty"] = difficulty
+        result["players"] = players + 1
+
+        # Saves the replay of a game with anomalies.
+        if recorder and result["anomalies"]:
+            recorder.save(os.path.join(task["record_dir"], "soak_%d%s" % (seed, replay.EXTENSION)),
+                          result["score"], result["win"])
+        results.append(result)
+
+    return results
+
+
+def make_tasks(games, chunk, configs, seed, options):
+    """This generator splits the games into chunks of consecutive games. The games take the configurations in
+    turn, one game each, so a short run or one cut short still plays them about equally often. Takes the number
+    of games and games per chunk as integers, the configurations as a list of tuples of the difficulty, players
+    as 0 or 1, and starting phase, the seed of the first game, and a dictionary of the options every task
+    shares. Yields task dictionaries for play_chunk."""
+
+    for index in range(0, games, chunk):
+        yield dict(options, configs=configs, first_game=index, first_seed=seed + index,
+                   count=min(chunk, games - index))
+
+
+class SoakStats():
+    """This class defines running totals of soak results by configuration, which stay the same size however
+    many games are added."""
+
+    # Initalizes the most games with anomalies kept as examples as a constant class variable.
+    MAX_EXAMPLES = 20
+
+    # Initalizes the most distinct outcomes counted for each configuration as a constant class variable.
+    MAX_OUTCOMES = 1000
+
+    def __init__(self):
+        """Initalizes the empty totals and starts the clock. Takes no parameters and returns nothing."""
+
+        self.__start = time.perf_counter()
+        self.__games = 0
+        self.__frames = 0
+        self.__configs = {}
+        self.__outcomes = {}
+        self.__anomalies = collections.Counter()
+        self.__examples = []
+
+    def add(self, result):
+        """This method adds a game's result to the totals. Takes the result dictionary from play_game. Returns
+        nothing."""
+
+        self.__games += 1
+        self.__frames += result["frames"]
+
+        # Adds the game to the totals of its configuration.
+        key = (result["difficulty"], result["players"], result["start_phase"])
+        totals = self.__configs.get(key)
+        if totals is None:
+            totals = self.__configs[key] = dict.fromkeys(("games", "wins", "frames", "score", "best_score",
+                                                          "life_losses", "phase_two", "phase_two_frames",
+                                                          "phase_three", "phase_three_frames", "anomalies"), 0)
+            self.__outcomes[key] = set()
+        totals["games"] += 1
+        totals["wins"] += result["win"]
+        totals["frames"] += result["frames"]
+        totals["score"] += result["score"]
+        totals["best_score"] = max(totals["best_score"], result["score"])
+        totals["life_losses"] += result["life_losses"]
+
+        # Counts the distinct scores and lengths the configuration's games ended with, up to a limit.
+        outcomes = self.__outcomes[key]
+        if len(outcomes) < SoakStats.MAX_OUTCOMES:
+            outcomes.add((result["score"], result["frames"], result["life_losses"]))
+        for phase in ("phase_two", "phase_three"):
+            if result[phase + "_frame"] is not None:
+                totals[phase] += 1
+                totals[phase + "_frames"] += result[phase + "_frame"]
+
+        # Counts the anomalies and keeps the first few games that had any.
+        if result["anomalies"]:
+            totals["anomalies"] += 1
+            self.__anomalies.update(result["anomalies"].keys())
+            if len(self.__examples) < SoakStats.MAX_EXAMPLES:
+                self.__examples.append(result)
+
+    def get_games(self):
+        """This method gets the number of games added. Takes no parameters and returns an integer."""
+
+        return self.__games
+
+    def get_throughput(self):
+        """This method gets how fast games have been added since the totals were made. Takes no parameters and
+        returns a tuple of the games and frames per second."""
+
+        elapsed = max(time.perf_counter() - self.__start, 1e-9)
+
+        return self.__games / elapsed, self.__frames / elapsed
+
+    def get_anomalies(self):
+        """This method gets how many games had each anomaly. Takes no parameters and returns a dictionary."""
+
+        return dict(self.__anomalies)
+
+    def get_examples(self):
+        """This method gets the first results that had anomalies. Takes no parameters and returns a list of
+        result dictionaries."""
+
+        return list(self.__examples)
+
+    def get_totals(self):
+        """This method gets the totals of each configuration. Takes no parameters and returns a dictionary of
+        totals dictionaries by a tuple of the difficulty, players, and starting phase."""
+
+        return {key: dict(totals, outcomes=len(self.__outcomes[key])) for key, totals in self.__configs.items()}
+
+    def get_repeated(self):
+        """This method gets the configurations whose games all ended the same way, which means the seeds did not
+        change the games. Takes no parameters and returns a list of tuples of the difficulty, players, and
+        starting phase, for configurations with more than one game."""
+
+        return sorted(key for key, totals in self.__configs.items()
+                      if totals["games"] > 1 and len(self.__outcomes[key]) == 1)
+
+    def format_progress(self):
+        """This method describes the progress so far in one line. Takes no parameters and returns a string."""
+
+        games_per_second, frames_per_second = self.get_throughput()
+
+        return "%d games, %.1f games/s, %.0f frames/s, %d anomalies" % \
+               (self.__games, games_per_second, frames_per_second, sum(self.__anomalies.values()))
+
+    def format_table(self):
+        """This method describes the totals of each configuration as a table. Takes no parameters and returns a
+        list of lines."""
+
+        lines = ["diff players phase   games  distinct   win%  mean score  best  mean frames  lives/game"
+                 "  phase 2 (frame)   phase 3 (frame)  anomalies"]
+        for key in sorted(self.__configs):
+            totals = self.__configs[key]
+            games = totals["games"]
+            reach = []
+            for phase in ("phase_two", "phase_three"):
+                frames = totals[phase + "_frames"] / totals[phase] if totals[phase] else 0
+                reach.append("%5.1f%% (%6.0f)" % (100 * totals[phase] / games, frames))
+            outcomes = len(self.__outcomes[key])
+            distinct = "%d%s" % (outcomes, "+" if outcomes == SoakStats.MAX_OUTCOMES else "")
+            lines.append("%4d %7d %5d %7d %9s %5.1f%% %11.1f %5d %12.0f %11.2f  %s   %s  %9d" %
+                         (key + (games, distinct, 100 * totals["wins"] / games, totals["score"] / games,
+                                 totals["best_score"], totals["frames"] / games, totals["life_losses"] / games) +
+                          tuple(reach) + (totals["anomalies"],)))
+
+        return lines
+
+
+def run(tasks, workers, stats, output=None, report_every=5.0):
+    """This function plays the tasks across a pool of worker processes, adding each game's result to the totals
+    and writing it to the output as a JSON line as the chunks finish. Only a few tasks per worker are handed
+    out at a time, so the memory used does not grow with the number of games. Takes an iterable of task
+    dictionaries, the number of workers, the SoakStats, an optional open text file, and the seconds between
+    progress lines. Returns nothing."""
+
+    tasks = iter(tasks)
+    last_report = time.perf_counter()
+    with concurrent.futures.ProcessPoolExecutor(workers) as pool:
+        pending = {pool.submit(play_chunk, task) for task in itertools.islice(tasks, 2 * workers)}
+        while pending:
+            done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+            for future in done:
+                for result in future.result():
+                    stats.add(result)
+                    if output:
+                        output.write(json.dumps(result) + "\n")
+
+                # Hands out the next task in place of the finished one.
+                for task in itertools.islice(tasks, 1):
+                    pending.add(pool.submit(play_chunk, task))
+
+            # Reports the throughput.
+            if time.perf_counter() - last_report >= report_every:
+                last_report = time.perf_counter()
+                print(stats.format_progress(), flush=True)
+
+
+def main():
+    """This function parses the command line, runs the soak test, and prints the totals. Takes no parameters
+    and returns nothing."""
+
+    parser = argparse.ArgumentParser(description="Soak test super break-out across worker processes.")
+    parser.add_argument("--games", type=int, default=10000, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--chunk", type=int, default=20, help="games per task handed to a worker")
+    parser.add_argument("--policy", choices=sorted(headless.POLICIES), default="random", help="input policy")
+    parser.add_argument("--difficulties", type=int, nargs="+", choices=sorted(game_sprites.Platform.SIZES),
+                        default=sorted(game_sprites.Platform.SIZES), help="difficulties to play")
+    parser.add_argument("--players", type=int, nargs="+", choices=(1, 2), default=[1, 2],
+                        help="player counts to play")
+    parser.add_argument("--phases", type=int, nargs="+", choices=(1, 2, 3), default=[1, 2, 3],
+                        help="phases to start games in")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, which the others count up from")
+    parser.add_argument("--jitter", type=float, default=0.02,
+                        help="fraction of frames played with random inputs drawn from the game's seed")
+    parser.add_argument("--max-frames", type=int, default=100000, help="frames after which a game times out")
+    parser.add_argument("--collision", choices=("swept", "discrete"), default="swept",
+                        help="collision test for the ball")
+    parser.add_argument("--mode", choices=simulation.Simulation.MODES, default="single", help="game mode")
+    parser.add_argument("--output", default=None, help="write every game's result here as JSON lines")
+    parser.add_argument("--record-dir", default=None,
+                        help="save replays of games started in phase 1 that had anomalies here")
+    parser.add_argument("--report-every", type=float, default=5.0, help="seconds between progress lines")
+    args = parser.parse_args()
+    if args.record_dir:
+        os.makedirs(args.record_dir, exist_ok=True)
+
+    # Plays every configuration in turn.
+    configs = list(itertools.product(args.difficulties, [players - 1 for players in args.players], args.phases))
+    options = {"policy": args.policy, "swept": args.collision == "swept", "mode": args.mode,
+               "max_frames": args.max_frames, "jitter": args.jitter, "record_dir": args.record_dir}
+    tasks = make_tasks(args.games, args.chunk, configs, args.seed, options)
+    stats = SoakStats()
+    output = open(args.output, "w") if args.output else None
+    try:
+        run(tasks, args.workers, stats, output, args.report_every)
+    finally:
+        if output:
+            output.close()
+
+    # Prints the totals.
+    print(stats.format_progress())
+    for line in stats.format_table():
+        print(line)
+    for key in stats.get_repeated():
+        print("warning: every game of difficulty %d, %d players, phase %d ended the same way" % key)
+    for name, count in sorted(stats.get_anomalies().items()):
+        print("anomaly %s: %d games" % (name, count))
+    for result in stats.get_examples():
+        print("example: " + json.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
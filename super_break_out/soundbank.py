@@ -0,0 +1,128 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module contains the sound bank of the super break-out game. Sound effects play on mixer
+channels reserved for their category, each sound has a cap on how many copies play at once, and triggers of
+the same sound that arrive within a short window are merged into one play.
+"""
+
+# Import and Initalize dependencies.
+import pygame
+
+
+class SoundBank():
+    """This class defines a bank of sound effects played on reserved channel groups."""
+
+    # Initalizes the channels reserved for each category as a constant class variable.
+    CHANNELS = (("ui", 1), ("impact", 4), ("stinger", 2))
+
+    def __init__(self, clock=pygame.time.get_ticks):
+        """Initalizes the channel groups and reserves their channels so other sounds cannot take them. Takes
+        an optional function that returns the time in milliseconds. Returns nothing."""
+
+        self.__clock = clock
+        total = sum(count for category, count in SoundBank.CHANNELS)
+
+        # Keeps one channel free for sounds played outside the bank.
+        if pygame.mixer.get_num_channels() <= total:
+            pygame.mixer.set_num_channels(total + 1)
+        pygame.mixer.set_reserved(total)
+
+        # Initalizes each group's channels and what each channel last played and when.
+        self.__groups = {}
+        index = 0
+        for category, count in SoundBank.CHANNELS:
+            self.__groups[category] = [[pygame.mixer.Channel(index + offset), None, 0] for offset in range(count)]
+            index += count
+
+        self.__sounds = {}
+        self.__last_played = {}
+        self.__stats = {"played": 0, "merged": 0, "dropped": 0, "stolen": 0,
+                        "peak": dict.fromkeys(self.__groups, 0)}
+
+    def register(self, sound, category, max_voices=1, merge_window=0):
+        """This method adds a sound to the bank. Takes the Sound, its category as "ui", "impact", or "stinger",
+        the most copies of it that may play at once as an integer, and the window in milliseconds within which
+        repeated triggers are merged as an integer. Returns nothing."""
+
+        self.__sounds[sound] = (category, max_voices, merge_window)
+
+    def play(self, sound):
+        """This method plays a sound on a channel of its group. The trigger is merged if the sound was played
+        within its merge window and dropped if the sound is already playing as often as its cap allows. If its
+        group is full, the voice that has played the longest is cut off. Takes the Sound. Returns the Channel
+        it plays on, or None if it was merged or dropped."""
+
+        category, max_voices, merge_window = self.__sounds[sound]
+        now = self.__clock()
+
+        # Merges repeated triggers without touching the mixer.
+        last = self.__last_played.get(sound)
+        if last is not None and now - last < merge_window:
+            self.__stats["merged"] += 1
+            return None
+
+        # Counts the voices of this sound and finds a free or the oldest channel.
+        voices = 0
+        busy = 0
+        free = None
+        oldest = None
+        for voice in self.__groups[category]:
+            if voice[0].get_busy():
+                busy += 1
+                voices += voice[1] is sound
+                if oldest is None or voice[2] < oldest[2]:
+                    oldest = voice
+            elif free is None:
+                free = voice
+
+        # Drops the trigger once the sound is playing as often as it may.
+        if voices >= max_voices:
+            self.__stats["dropped"] += 1
+            return None
+
+        # Cuts off the oldest voice when every channel of the group is busy.
+        if free is None:
+            free = oldest
+            self.__stats["stolen"] += 1
+        else:
+            busy += 1
+
+        free[0].play(sound)
+        free[1] = sound
+        free[2] = now
+        self.__last_played[sound] = now
+        self.__stats["played"] += 1
+        self.__stats["peak"][category] = max(self.__stats["peak"][category], busy)
+
+        return free[0]
+
+    def get_busy(self):
+        """This method gets how many channels of each group are playing. Takes no parameters and returns a
+        dictionary of counts by category."""
+
+        return {category: sum(voice[0].get_busy() for voice in voices) for category, voices in self.__groups.items()}
+
+    def get_stats(self):
+        """This method gets how many sounds were played, merged, dropped, and cut off, the most channels of
+        each group that played at once, and how many play now. Takes no parameters and returns a dictionary."""
+
+        stats = dict(self.__stats)
+        stats["peak"] = dict(self.__stats["peak"])
+        stats["busy"] = self.get_busy()
+        stats["channels"] = dict(SoundBank.CHANNELS)
+
+        return stats
+
+    def get_reserved(self):
+        """This method gets how many channels the bank reserves, which are the first channels of the mixer.
+        Takes no parameters and returns an integer."""
+
+        return sum(count for category, count in SoundBank.CHANNELS)
+
+    def stop(self):
+        """This method stops every sound in the bank. Takes no parameters and returns nothing."""
+
+        for voices in self.__groups.values():
+            for voice in voices:
+                voice[0].stop()
@@ -0,0 +1,28 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module sets up the tests of the super break-out game. It selects the dummy SDL drivers and
+runs every test from the super_break_out folder, the way the game's programs are run, so the game modules can
+be imported and the assets found by their relative paths.
+"""
+
+# Selects the dummy SDL drivers before pygame is imported.
+import os
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+# Initalizes and imports dependencies.
+import sys
+import pytest
+
+# Initalizes the game folder and puts its modules on the import path.
+GAME_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, GAME_DIR)
+
+
+@pytest.fixture(autouse=True)
+def game_dir(monkeypatch):
+    """This fixture runs a test from the game folder. Takes pytest's monkeypatch fixture. Yields nothing."""
+
+    monkeypatch.chdir(GAME_DIR)
+    yield
@@ -0,0 +1,69 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module tests that levels which cannot be played through their phases to the win are refused,
+whether they are built directly or read from a level pack.
+"""
+
+# Initalizes and imports dependencies.
+import random
+import pytest
+import levels
+
+
+def record(rows, cols, cells, phase_two, phase_three, win_score):
+    """This function packs a level record without checking it. Takes the level fields. Returns the bytes."""
+
+    return levels.LEVEL.pack(rows, cols, phase_two, phase_three, win_score) + bytes(cells)
+
+
+def test_classic_level_is_playable():
+    """This test checks the classic level keeps its phase and win scores."""
+
+    assert levels.CLASSIC.get_phase_scores() == (80, 189)
+    assert levels.CLASSIC.get_win_score() == 378
+
+
+@pytest.mark.parametrize("cells, phase_two, phase_three, win_score", [
+    ([0, 0, 0], 1, 1, None),
+    ([levels.pack_cell(0, 0, 1)] * 3, 1, 2, 0),
+    ([levels.pack_cell(0, 0, 1)] * 3, 0, 2, 10),
+    ([levels.pack_cell(0, 0, 1)] * 3, 5, 4, 10),
+    ([levels.pack_cell(0, 0, 1)] * 3, 2, 10, 10),
+    ([levels.pack_cell(0, 0, 1)] * 3, 2, 5, 19),
+])
+def test_degenerate_level_is_refused(cells, phase_two, phase_three, win_score):
+    """This test checks a level with no bricks, or scores that cannot be reached in turn, is refused when built
+    and when read."""
+
+    with pytest.raises(ValueError):
+        levels.Level(1, 3, bytes(cells), phase_two, phase_three, win_score)
+    with pytest.raises(ValueError):
+        levels.read_level(record(1, 3, cells, phase_two, phase_three, win_score or 0))
+
+
+def test_degenerate_level_in_pack_is_refused(tmp_path):
+    """This test checks a pack holding a level that is won on its first step refuses to hand it out."""
+
+    path = tmp_path / ("degenerate" + levels.EXTENSION)
+    levels.write_pack(path, [levels.CLASSIC])
+
+    # Swaps the classic level's win score for one no brick total can be below.
+    data = bytearray(path.read_bytes())
+    offset = levels.HEADER.size + levels.OFFSET.size
+    data[offset:offset + levels.LEVEL.size] = levels.LEVEL.pack(6, 18, 80, 189, 0)
+    path.write_bytes(bytes(data))
+
+    pack = levels.LevelPack(str(path))
+    with pytest.raises(ValueError):
+        pack.get_level(0)
+
+
+def test_random_levels_are_playable():
+    """This test checks the generated test levels all reach both phases before their win."""
+
+    rng = random.Random(1)
+    for index in range(500):
+        level = levels.random_level(rng)
+        phase_two, phase_three = level.get_phase_scores()
+        assert 0 < phase_two <= phase_three < level.get_win_score()
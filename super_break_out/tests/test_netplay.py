@@ -0,0 +1,31 @@
+"""
+Author: Roy Chen and Jerry Wang
+Date: October 17, 2026
+Description: This module tests netplay by playing two bot peers against each other over localhost with added
+lag and packet loss, and checking both end with the game, and the events, of an offline run of their inputs.
+"""
+
+# Initalizes and imports dependencies.
+import pytest
+import netplay
+
+
+@pytest.mark.parametrize("lag, loss, seed, mode", [
+    (0, 0.0, 1, "single"),
+    (4, 0.1, 2, "single"),
+    (4, 0.1, 3, "single"),
+    (2, 0.3, 4, "cavity"),
+    (10, 0.2, 5, "double"),
+])
+def test_loopback_matches_offline_game(lag, loss, seed, mode):
+    """This test checks both peers agree with the offline game and each other, with rollbacks re-running
+    frames whenever packets are held."""
+
+    matched, metrics = netplay.run_loopback(1500, lag, loss, seed, 2, mode)
+
+    assert matched
+    for peer in metrics:
+        assert peer["desyncs"] == 0
+        assert peer["confirmed_frame"] >= 1500
+        if lag:
+            assert peer["max_rollback_frames"] > 1